@@ -2,13 +2,23 @@
 FastAPI wrapper for Todo application backend.
 
 This creates a REST API wrapper around the in-memory TodoManager.
+Set TODO_DATA_DIR to persist tasks to disk across restarts. To run several
+workers, start a task server (python -m src.todo_app.server) and set
+TODO_MANAGER_ADDRESS and TODO_MANAGER_AUTHKEY so every worker shares it.
+Set TODO_MULTI_TENANT=1 to give every user (X-User-Id header) a separate
+task list; idle lists are saved to TODO_DATA_DIR and unloaded.
 """
 
-from fastapi import FastAPI, HTTPException
+import os
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
+from src.todo_app.events import ChangesExpiredError
 from src.todo_app.manager import TodoManager, TaskNotFoundError
+from src.todo_app.storage import TaskStorage
+from src.todo_app.tenants import TenantStore
 
 app = FastAPI(
     title="Todo API",
@@ -25,8 +35,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize the todo manager
-manager = TodoManager()
+# Initialize the todo manager: one per user when TODO_MULTI_TENANT is set,
+# shared through a task server when TODO_MANAGER_ADDRESS is set, otherwise
+# a single one owned by this process
+manager_address = os.environ.get("TODO_MANAGER_ADDRESS")
+data_dir = os.environ.get("TODO_DATA_DIR")
+tenants = None
+manager = None
+if os.environ.get("TODO_MULTI_TENANT") == "1":
+    max_bytes = os.environ.get("TODO_TENANT_MAX_BYTES")
+    tenants = TenantStore(
+        data_dir,
+        idle_seconds=float(os.environ.get("TODO_TENANT_IDLE_SECONDS", "600")),
+        max_bytes=int(max_bytes) if max_bytes else None,
+    )
+elif manager_address:
+    from src.todo_app.server import connect
+
+    manager = connect(manager_address)
+else:
+    manager = TodoManager(TaskStorage(data_dir) if data_dir else None)
+
+def get_manager(x_user_id: Optional[str] = Header(None)):
+    """Provide the task manager for the current request.
+
+    In multi-tenant mode this is the calling user's own manager, which
+    stays loaded until the request is finished.
+    """
+    if tenants is None:
+        yield manager
+        return
+    if not x_user_id:
+        raise HTTPException(status_code=400, detail="X-User-Id header is required")
+    with tenants.acquire(x_user_id) as user_manager:
+        yield user_manager
+
+@app.on_event("shutdown")
+def close_manager():
+    """Flush pending changes to disk on shutdown."""
+    if tenants is not None:
+        tenants.close()
+    elif not manager_address:
+        manager.close()
 
 # Pydantic models for request/response
 class TaskCreate(BaseModel):
@@ -50,6 +100,36 @@ class TaskResponse(BaseModel):
 class TaskListResponse(BaseModel):
     tasks: List[TaskResponse]
     total: int
+    next_cursor: Optional[int] = None
+
+MAX_BATCH_SIZE = 10_000
+
+class TaskBatchCreate(BaseModel):
+    tasks: List[TaskCreate] = Field(max_length=MAX_BATCH_SIZE)
+
+class TaskBatchUpdateItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+class TaskBatchUpdate(BaseModel):
+    updates: List[TaskBatchUpdateItem] = Field(max_length=MAX_BATCH_SIZE)
+
+class TaskIds(BaseModel):
+    ids: List[int] = Field(max_length=MAX_BATCH_SIZE)
+
+class ChangeResponse(BaseModel):
+    seq: int
+    kind: str
+    task_id: int
+    task: Optional[TaskResponse] = None
+
+    class Config:
+        from_attributes = True
+
+class ChangeFeedResponse(BaseModel):
+    changes: List[ChangeResponse]
+    last_seq: int
 
 # API endpoints
 @app.get("/health")
@@ -58,16 +138,77 @@ async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
 @app.get("/api/tasks", response_model=TaskListResponse)
-async def list_tasks():
-    """List all tasks."""
-    tasks = manager.list_tasks()
-    return {
-        "tasks": tasks,
-        "total": len(tasks)
-    }
+async def list_tasks(
+    completed: Optional[bool] = None,
+    title_prefix: Optional[str] = None,
+    q: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
+    manager: TodoManager = Depends(get_manager),
+):
+    """List tasks, optionally filtered by completion status or title prefix.
+
+    Pass ``limit`` to page through the results in ID order: each page has a
+    ``next_cursor`` to send back as ``cursor``, and null on the last page.
+
+    Pass ``q`` to search titles and descriptions instead: the best ``limit``
+    matches (default 20) come back ranked, best first, without a cursor.
+    """
+    if q is not None:
+        tasks = manager.search(q, limit or 20)
+        if completed is not None:
+            tasks = [task for task in tasks if task.completed == completed]
+        return {"tasks": tasks, "total": len(tasks)}
+
+    paginate = limit is not None or cursor is not None
+    limit = limit or 100
+
+    if title_prefix is None and completed is None:
+        if not paginate:
+            tasks = manager.list_tasks()
+            return {"tasks": tasks, "total": len(tasks)}
+        tasks, next_cursor, total = manager.list_page(limit, cursor)
+        return {"tasks": tasks, "total": total, "next_cursor": next_cursor}
+
+    if title_prefix:
+        tasks = manager.find_by_title_prefix(title_prefix)
+        if completed is not None:
+            tasks = [task for task in tasks if task.completed == completed]
+    else:
+        tasks = manager.list_by_status(completed)
+    total = len(tasks)
+
+    next_cursor = None
+    if paginate:
+        if title_prefix:
+            tasks.sort(key=lambda task: task.id)
+        if cursor:
+            tasks = [task for task in tasks if task.id > cursor]
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = tasks[-1].id
+    return {"tasks": tasks, "total": total, "next_cursor": next_cursor}
+
+@app.get("/api/changes", response_model=ChangeFeedResponse)
+async def list_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10_000),
+    manager: TodoManager = Depends(get_manager),
+):
+    """List task changes made after sequence number ``since``.
+
+    Poll with the ``seq`` of the last change received (or ``last_seq``) to
+    follow changes incrementally. A 410 response means the changes are no
+    longer retained: reload /api/tasks and continue from ``last_seq``.
+    """
+    try:
+        changes, last_seq = manager.changes_since(since, limit)
+    except ChangesExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    return {"changes": changes, "last_seq": last_seq}
 
 @app.post("/api/tasks", response_model=TaskResponse)
-async def create_task(task: TaskCreate):
+async def create_task(task: TaskCreate, manager: TodoManager = Depends(get_manager)):
     """Create a new task."""
     try:
         new_task = manager.add_task(
@@ -78,17 +219,65 @@ async def create_task(task: TaskCreate):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+# Batch endpoints: each request is validated as a whole and applied
+# all-or-nothing. They are declared before the /{task_id} routes so
+# "batch" is not parsed as an ID.
+@app.post("/api/tasks/batch", response_model=TaskListResponse)
+async def create_tasks(batch: TaskBatchCreate, manager: TodoManager = Depends(get_manager)):
+    """Create several tasks at once."""
+    try:
+        tasks = manager.add_tasks(
+            [(task.title, task.description or "") for task in batch.tasks]
+        )
+        return {"tasks": tasks, "total": len(tasks)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.put("/api/tasks/batch", response_model=TaskListResponse)
+async def update_tasks(batch: TaskBatchUpdate, manager: TodoManager = Depends(get_manager)):
+    """Update the title and/or description of several tasks at once."""
+    changes = {item.id: (item.title, item.description) for item in batch.updates}
+    try:
+        tasks = manager.update_many(changes)
+        return {"tasks": tasks, "total": len(tasks)}
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/api/tasks/batch/complete", response_model=TaskListResponse)
+async def complete_tasks(batch: TaskIds, manager: TodoManager = Depends(get_manager)):
+    """Mark several tasks as completed at once."""
+    try:
+        tasks = manager.complete_many(batch.ids)
+        return {"tasks": tasks, "total": len(tasks)}
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.post("/api/tasks/batch/delete")
+async def delete_tasks(batch: TaskIds, manager: TodoManager = Depends(get_manager)):
+    """Delete several tasks at once."""
+    try:
+        deleted = manager.delete_many(batch.ids)
+        return {"message": f"{deleted} task(s) deleted successfully", "deleted": deleted}
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
 @app.get("/api/tasks/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: int):
+async def get_task(task_id: int, manager: TodoManager = Depends(get_manager)):
     """Get a specific task by ID."""
     try:
-        task = manager._find_task_by_id(task_id)
+        task = manager.get_task(task_id)
         return task
     except TaskNotFoundError:
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
 
 @app.put("/api/tasks/{task_id}", response_model=TaskResponse)
-async def update_task(task_id: int, task_update: TaskUpdate):
+async def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    manager: TodoManager = Depends(get_manager),
+):
     """Update a task."""
     try:
         updated_task = manager.update_task(
@@ -110,7 +299,7 @@ async def update_task(task_id: int, task_update: TaskUpdate):
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.delete("/api/tasks/{task_id}")
-async def delete_task(task_id: int):
+async def delete_task(task_id: int, manager: TodoManager = Depends(get_manager)):
     """Delete a task."""
     try:
         manager.delete_task(task_id)
@@ -119,7 +308,7 @@ async def delete_task(task_id: int):
         raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
 
 @app.patch("/api/tasks/{task_id}/complete", response_model=TaskResponse)
-async def toggle_complete(task_id: int):
+async def toggle_complete(task_id: int, manager: TodoManager = Depends(get_manager)):
     """Toggle task completion status."""
     try:
         task = manager.toggle_complete(task_id)
@@ -0,0 +1,108 @@
+"""Benchmark a task list page: ORM objects + Pydantic vs row mappings.
+
+Both paths read one page from an in-memory SQLite database and produce
+the response body. The fast path is the one list_tasks runs: a single
+SELECT with a window-function total, ``.mappings()`` rows turned into
+dicts, rendered by FastJSONResponse.
+
+Usage:
+    uv run python -m benchmarks.bench_serialization [--tasks 100] [--rounds 2000]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+from src.models.task import Task
+from src.schemas.task import TaskListResponse, parse_task_fields
+from src.utils.serialization import FastJSONResponse
+
+USER_ID = "bench-user"
+
+
+def make_session(count: int) -> Session:
+    """Return a session on an in-memory database holding ``count`` tasks."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[Task.__table__])
+    session = Session(engine)
+    now = datetime.utcnow()
+    session.add_all(
+        Task(
+            title=f"Task {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            completed=i % 3 == 0,
+            user_id=USER_ID,
+            change_seq=i,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, count + 1)
+    )
+    session.commit()
+    return session
+
+
+def encode_pydantic(session: Session, limit: int) -> bytes:
+    """Previous path: load Task objects, validate into TaskListResponse."""
+    tasks = session.scalars(
+        select(Task)
+        .where(Task.user_id == USER_ID)
+        .limit(limit)
+        .order_by(Task.created_at.desc())
+    ).all()
+    total = session.scalar(select(func.count()).where(Task.user_id == USER_ID))
+    model = TaskListResponse(tasks=tasks, total=total)
+    session.expunge_all()
+    return json.dumps(jsonable_encoder(model)).encode("utf-8")
+
+
+def encode_fast(session: Session, limit: int) -> bytes:
+    """Production path: row mappings rendered by FastJSONResponse."""
+    columns = [getattr(Task, name) for name in parse_task_fields(None)]
+    result = session.execute(
+        select(*columns, func.count().over().label("_total"))
+        .where(Task.user_id == USER_ID)
+        .limit(limit)
+        .order_by(Task.created_at.desc())
+    )
+    tasks = [dict(row) for row in result.mappings()]
+    total = tasks[0]["_total"] if tasks else 0
+    for task in tasks:
+        del task["_total"]
+    return FastJSONResponse({"tasks": tasks, "total": total}).body
+
+
+def measure(func, session: Session, limit: int, rounds: int) -> float:
+    """Return mean microseconds per call."""
+    func(session, limit)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(session, limit)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    session = make_session(args.tasks)
+    before = measure(encode_pydantic, session, args.tasks, args.rounds)
+    after = measure(encode_fast, session, args.tasks, args.rounds)
+
+    print(f"tasks per page: {args.tasks}")
+    print(f"ORM + pydantic  : {before:10.1f} us/page")
+    print(f"mappings + fast : {after:10.1f} us/page")
+    print(f"speedup         : {before / after:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
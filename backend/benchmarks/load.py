@@ -0,0 +1,305 @@
+"""End-to-end load benchmark for the task API.
+
+Drives all six task endpoints through weighted request mixes and reports
+latency percentiles and throughput per scenario. By default the app is
+exercised in-process (no network) against whatever DATABASE_URL points
+to, e.g. a local Postgres with DATABASE_SSL=false or
+``sqlite+aiosqlite:///./bench.db``; ``--base-url`` targets a running
+server instead.
+
+Usage:
+    uv run python -m benchmarks.load --duration 10 --concurrency 16
+    uv run python -m benchmarks.load --save-baseline benchmarks/baseline.json
+    uv run python -m benchmarks.load --compare benchmarks/baseline.json --tolerance 0.2
+
+``--compare`` exits with status 1 when any scenario's p95 latency grows, or
+its throughput drops, by more than the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+from httpx import ASGITransport, AsyncClient
+
+from src.utils.jwt import create_jwt
+
+
+@dataclass
+class Scenario:
+    """A weighted mix of task operations.
+
+    Attributes:
+        name: Scenario name used in reports and baselines
+        description: What kind of client the mix models
+        weights: Relative frequency of each operation
+        seed_tasks: Tasks created per user before measuring
+    """
+
+    name: str
+    description: str
+    weights: dict[str, int]
+    seed_tasks: int = 50
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "dashboard",
+            "Read-heavy dashboard: mostly list and detail views",
+            {"list": 70, "get": 20, "toggle": 5, "update": 5},
+            seed_tasks=100,
+        ),
+        Scenario(
+            "toggles",
+            "Bursty check-off sessions toggling completion",
+            {"toggle": 75, "list": 20, "get": 5},
+        ),
+        Scenario(
+            "bulk",
+            "Bulk creators importing and pruning tasks",
+            {"create": 65, "update": 15, "delete": 15, "list": 5},
+            seed_tasks=10,
+        ),
+    )
+}
+
+
+@dataclass
+class Stats:
+    """Latencies and errors collected for one scenario run."""
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def record(self, operation: str, seconds: float) -> None:
+        self.latencies.setdefault(operation, []).append(seconds)
+
+    def all_latencies(self) -> list[float]:
+        return [value for values in self.latencies.values() for value in values]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(values: list[float], elapsed: float) -> dict[str, float]:
+    """Turn raw latencies into the report/baseline shape (milliseconds)."""
+    ordered = sorted(values)
+    return {
+        "requests": len(ordered),
+        "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+class UserSession:
+    """One simulated user with their own token and known task IDs."""
+
+    def __init__(self, client: AsyncClient, user_id: str) -> None:
+        self.client = client
+        self.user_id = user_id
+        self.base = f"/api/{user_id}/tasks"
+        self.headers = {"Authorization": f"Bearer {create_jwt(user_id)}"}
+        self.task_ids: list[int] = []
+
+    async def create(self) -> int:
+        response = await self.client.post(
+            self.base,
+            json={"title": f"Task {len(self.task_ids)}", "description": "x" * 120},
+            headers=self.headers,
+        )
+        if response.status_code == 201:
+            self.task_ids.append(response.json()["id"])
+        return response.status_code
+
+    async def list(self) -> int:
+        response = await self.client.get(f"{self.base}?limit=100", headers=self.headers)
+        return response.status_code
+
+    async def get(self) -> int:
+        if not self.task_ids:
+            return await self.create()
+        task_id = random.choice(self.task_ids)
+        response = await self.client.get(f"{self.base}/{task_id}", headers=self.headers)
+        return response.status_code
+
+    async def update(self) -> int:
+        if not self.task_ids:
+            return await self.create()
+        task_id = random.choice(self.task_ids)
+        response = await self.client.put(
+            f"{self.base}/{task_id}",
+            json={"title": f"Renamed {random.randint(0, 9999)}"},
+            headers=self.headers,
+        )
+        return response.status_code
+
+    async def toggle(self) -> int:
+        if not self.task_ids:
+            return await self.create()
+        task_id = random.choice(self.task_ids)
+        response = await self.client.patch(
+            f"{self.base}/{task_id}/complete", headers=self.headers
+        )
+        return response.status_code
+
+    async def delete(self) -> int:
+        if not self.task_ids:
+            return await self.create()
+        task_id = self.task_ids.pop(random.randrange(len(self.task_ids)))
+        response = await self.client.delete(
+            f"{self.base}/{task_id}", headers=self.headers
+        )
+        return response.status_code
+
+
+async def run_scenario(
+    client: AsyncClient, scenario: Scenario, duration: float, concurrency: int
+) -> Stats:
+    """Run one scenario with ``concurrency`` users for ``duration`` seconds."""
+    run_id = f"{int(time.time())}-{random.randint(0, 99999)}"
+    users = [
+        UserSession(client, f"bench-{scenario.name}-{run_id}-{i}")
+        for i in range(concurrency)
+    ]
+    for user in users:
+        for _ in range(scenario.seed_tasks):
+            await user.create()
+
+    operations = list(scenario.weights)
+    weights = list(scenario.weights.values())
+    stats = Stats()
+
+    async def worker(user: UserSession, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            operation = random.choices(operations, weights)[0]
+            start = time.perf_counter()
+            status_code = await getattr(user, operation)()
+            stats.record(operation, time.perf_counter() - start)
+            if status_code >= 400:
+                stats.errors += 1
+
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(worker(user, deadline) for user in users))
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+@asynccontextmanager
+async def make_client(base_url: Optional[str]):
+    """Client for a running server, or for the app in-process."""
+    if base_url:
+        async with AsyncClient(base_url=base_url, timeout=30) as client:
+            yield client
+        return
+
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a description of every regression beyond ``tolerance``."""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if current["p95_ms"] > reference["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']}ms > baseline {reference['p95_ms']}ms"
+            )
+        if current["rps"] < reference["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {current['rps']} req/s < baseline {reference['rps']} req/s"
+            )
+    return regressions
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    results = {}
+
+    async with make_client(args.base_url) as client:
+        for name in names:
+            stats = await run_scenario(
+                client, SCENARIOS[name], args.duration, args.concurrency
+            )
+            summary = summarize(stats.all_latencies(), stats.elapsed)
+            summary["errors"] = stats.errors
+            summary["operations"] = {
+                operation: summarize(values, stats.elapsed)
+                for operation, values in sorted(stats.latencies.items())
+            }
+            results[name] = summary
+
+            print(f"\n{name}: {SCENARIOS[name].description}")
+            print(
+                f"  {'operation':<10} {'requests':>9} {'req/s':>9} "
+                f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+            )
+            for operation, row in [("ALL", summary), *summary["operations"].items()]:
+                print(
+                    f"  {operation:<10} {row['requests']:>9} {row['rps']:>9} "
+                    f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9}"
+                )
+            if stats.errors:
+                print(f"  errors: {stats.errors}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of {args.compare}")
+
+    return 0
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Task API load benchmark")
+    parser.add_argument("--scenario", choices=["all", *SCENARIOS], default="all")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=8, help="simulated users")
+    parser.add_argument("--base-url", help="benchmark a running server instead")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
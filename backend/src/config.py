@@ -1,6 +1,8 @@
 """Configuration management for the Todo backend application."""
 
 from functools import lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -15,6 +17,9 @@ class Settings(BaseSettings):
     database_url: str
     """PostgreSQL database connection URL for Neon Serverless"""
 
+    database_ssl: bool = True
+    """Require TLS for PostgreSQL connections (ignored for SQLite)"""
+
     # Authentication configuration
     better_auth_secret: str
     """Secret key for JWT token signing and verification"""
@@ -32,6 +37,67 @@ class Settings(BaseSettings):
     debug: bool = False
     """Debug mode flag"""
 
+    # Response compression
+    compression_minimum_size: int = 500
+    """Responses smaller than this many bytes are sent uncompressed"""
+
+    compression_cache_bytes: int = 8 * 1024 * 1024
+    """Total size of compressed response bodies kept for reuse (0 disables)"""
+
+    # Monitoring
+    metrics_enabled: bool = True
+    """Expose Prometheus metrics on /metrics"""
+
+    server_timing_enabled: bool = False
+    """Add a Server-Timing header (jwt, db-checkout, sql, encode, app) to responses
+
+    Off by default: the header exposes internal timings to every client.
+    """
+
+    trace_sample_rate: float = 0.0
+    """Fraction of requests whose full span trace is exported (0 disables)"""
+
+    trace_export_path: str = "traces.jsonl"
+    """JSON-lines file sampled traces are appended to"""
+
+    admin_token: Optional[str] = None
+    """Token required in X-Admin-Token for /admin endpoints (unset disables them)"""
+
+    profiler_enabled: bool = False
+    """Allow on-demand CPU profiles via /admin/profile"""
+
+    profiler_max_seconds: float = 60.0
+    """Longest profiling window a single request may ask for"""
+
+    slow_query_threshold_ms: float = 200.0
+    """SQL statements at least this slow are recorded in the slow-query log"""
+
+    slow_query_log_size: int = 100
+    """Number of slow statements kept in memory"""
+
+    slow_query_explain: bool = False
+    """Capture EXPLAIN plans for a sample of slow statements"""
+
+    slow_query_explain_sample_rate: float = 0.1
+    """Fraction of slow statements to EXPLAIN"""
+
+    slow_query_explain_per_minute: int = 6
+    """Maximum number of EXPLAINs issued per minute"""
+
+    # Real-time change events
+    event_transport: str = "local"
+    """Cross-worker event transport: "local" (single worker) or "postgres" """
+
+    event_queue_size: int = 100
+    """Pending events per subscriber before a slow consumer is dropped"""
+
+    event_heartbeat_seconds: float = 15.0
+    """Interval between keep-alive comments on idle event streams"""
+
+    # Delta sync
+    sync_tombstone_retention_days: int = 30
+    """Days deletions are kept for /changes; older sync tokens must resync"""
+
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
@@ -1,9 +1,15 @@
 """Database connection and session management for Neon PostgreSQL."""
 
+from typing import AsyncGenerator
+
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
+
 from src.config import get_settings
+from src.monitoring import instrument_engine, slow_query_log
 
 # Global engine instance
 engine = None
@@ -18,14 +24,28 @@ def get_engine():
     global engine
     if engine is None:
         settings = get_settings()
+        # Neon requires TLS; local Postgres and SQLite (benchmarks) may not
+        connect_args = {}
+        if settings.database_ssl and not settings.database_url.startswith("sqlite"):
+            connect_args["ssl"] = "require"
         engine = create_async_engine(
             settings.database_url,
             echo=settings.debug,
-            connect_args={"ssl": "require"},
+            connect_args=connect_args,
             pool_pre_ping=True,
             pool_size=5,
             max_overflow=10,
         )
+        instrument_engine(engine)
+
+        slow_query_log.configure(
+            threshold_ms=settings.slow_query_threshold_ms,
+            size=settings.slow_query_log_size,
+            explain=settings.slow_query_explain,
+            explain_sample_rate=settings.slow_query_explain_sample_rate,
+            explain_per_minute=settings.slow_query_explain_per_minute,
+        )
+        slow_query_log.attach(engine)
     return engine
 
 
@@ -39,9 +59,14 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
-async def get_db() -> AsyncSession:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for FastAPI to get a database session.
 
+    The session only checks out a pool connection when its first statement
+    runs, so requests rejected before querying never hold one. It is closed
+    once the response has been sent; read endpoints that can let go sooner
+    respond through ``release_and_respond``.
+
     Yields:
         AsyncSession: Database session for the request
 
@@ -62,10 +87,33 @@ async def init_db():
     Creates all tables defined in SQLModel metadata.
     Should be called during application startup.
     """
-    from src.models.task import Task
+    from src.models.stats import TaskDailyStats, TaskStats  # noqa: F401
+    from src.models.task import Task, TaskSyncState, TaskTombstone  # noqa: F401
+
+    def create_all(sync_conn):
+        SQLModel.metadata.create_all(sync_conn)
+        # create_all skips indexes on tables that already exist
+        for table in (Task.__table__, TaskTombstone.__table__):
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
 
     async with get_engine().begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(create_all)
+
+
+def dialect_insert(db: AsyncSession, table):
+    """Dialect-specific INSERT supporting ON CONFLICT clauses.
+
+    Args:
+        db: Session whose bind decides the dialect
+        table: Model or table to insert into
+
+    Returns:
+        Insert: PostgreSQL or SQLite INSERT construct
+    """
+    if db.bind.dialect.name == "sqlite":
+        return sqlite_insert(table)
+    return postgresql_insert(table)
 
 
 async def close_db():
@@ -0,0 +1,35 @@
+"""Admin authentication dependency for operational endpoints."""
+
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from src.config import get_settings
+
+
+async def require_admin(
+    x_admin_token: Optional[str] = Header(default=None),
+) -> None:
+    """Allow the request only if it carries the configured admin token.
+
+    Admin endpoints are disabled entirely (404) while ADMIN_TOKEN is unset.
+
+    Args:
+        x_admin_token: Value of the X-Admin-Token request header
+
+    Raises:
+        HTTPException: 404 if admin endpoints are disabled
+        HTTPException: 401 if the token is missing or wrong
+    """
+    expected = get_settings().admin_token
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+        )
@@ -1,5 +1,6 @@
 """Authentication dependencies for FastAPI endpoints."""
 
+from time import perf_counter
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
@@ -9,6 +10,9 @@ from sqlalchemy import select
 
 from src.database import get_db
 from src.models.task import Task
+from src.monitoring.context import current_user_id
+from src.monitoring.metrics import jwt_verification_duration_seconds
+from src.monitoring.tracing import add_span
 from src.utils.jwt import decode_jwt
 
 
@@ -34,8 +38,11 @@ async def get_current_user_id(
     """
     token = credentials.credentials
 
+    start = perf_counter()
+    outcome = "invalid"
     try:
         payload = decode_jwt(token)
+        outcome = "valid"
         user_id: Optional[str] = payload.get("sub")
 
         if not user_id:
@@ -45,6 +52,7 @@ async def get_current_user_id(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        current_user_id.set(user_id)
         return user_id
 
     except Exception:
@@ -53,6 +61,10 @@ async def get_current_user_id(
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    finally:
+        elapsed = perf_counter() - start
+        jwt_verification_duration_seconds.observe((outcome,), elapsed)
+        add_span("jwt", elapsed)
 
 
 async def verify_task_ownership(
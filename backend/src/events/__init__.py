@@ -0,0 +1,5 @@
+"""Task change events: in-process fan-out and cross-worker transports."""
+
+from .broker import ChangeBroker, Subscription, broker, task_event
+
+__all__ = ["ChangeBroker", "Subscription", "broker", "task_event"]
@@ -0,0 +1,192 @@
+"""In-process pub/sub fan-out of task change events.
+
+Each subscriber gets a bounded queue. Publishing never waits: when a
+subscriber's queue is full it is dropped and receives a single overflow
+marker, after which the client is expected to resync through the delta
+sync endpoint. A transport can be plugged in to carry events between
+workers; it must hand every message (including the worker's own) back
+to ``deliver``, and call ``lost`` whenever messages may have been missed.
+
+Events are published after the change is committed, so publishing is
+best-effort: a transport failure is logged and never fails the request.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Optional, Protocol
+
+from src.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW = {"type": "overflow"}
+"""Final event sent to a subscriber that fell behind or may have missed events"""
+
+
+class BrokerTransport(Protocol):
+    """Carries change events between workers."""
+
+    async def start(
+        self,
+        deliver: Callable[[str, dict[str, Any]], None],
+        lost: Callable[[], None],
+    ) -> None:
+        """Begin receiving events and pass each one to ``deliver``.
+
+        ``lost`` must be called whenever events may have been missed, e.g.
+        after the connection to other workers dropped.
+        """
+
+    async def publish(self, user_id: str, event: dict[str, Any]) -> None:
+        """Send an event to every worker, including this one."""
+
+    async def stop(self) -> None:
+        """Stop receiving events and release resources."""
+
+
+class Subscription:
+    """A single consumer's view of a user's change stream.
+
+    Attributes:
+        user_id: User whose task changes are delivered
+        queue: Bounded buffer of pending events
+        overflowed: Whether the subscriber was dropped for falling behind
+    """
+
+    def __init__(self, user_id: str, queue_size: int) -> None:
+        self.user_id = user_id
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def offer(self, event: dict[str, Any]) -> bool:
+        """Enqueue an event without waiting.
+
+        Returns:
+            bool: False if the queue was full and the subscriber was dropped
+        """
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.overflow()
+            return False
+
+    def overflow(self) -> None:
+        """Replace the backlog with the overflow marker and stop accepting events."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(OVERFLOW)
+        self.overflowed = True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait before returning None
+
+        Returns:
+            Optional[dict[str, Any]]: The next event, or None on timeout
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ChangeBroker:
+    """Fans task change events out to per-user subscribers.
+
+    Args:
+        queue_size: Maximum pending events per subscriber before it is dropped
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        self.queue_size = queue_size
+        self.transport: Optional[BrokerTransport] = None
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    async def start(self, transport: Optional[BrokerTransport] = None) -> None:
+        """Attach and start a cross-worker transport (None keeps it local)."""
+        self.transport = transport
+        if transport is not None:
+            await transport.start(self.deliver, self.resync_all)
+
+    async def stop(self) -> None:
+        """Stop the transport, if any."""
+        if self.transport is not None:
+            await self.transport.stop()
+            self.transport = None
+
+    def subscribe(self, user_id: str) -> Subscription:
+        """Register a new subscriber for a user's changes."""
+        subscription = Subscription(user_id, self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber; safe to call more than once."""
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def subscriber_count(self, user_id: str) -> int:
+        """Number of live subscribers for a user."""
+        return len(self._subscribers.get(user_id, ()))
+
+    def deliver(self, user_id: str, event: dict[str, Any]) -> None:
+        """Fan an event out to this worker's subscribers without blocking."""
+        subscribers = self._subscribers.get(user_id)
+        if not subscribers:
+            return
+        for subscription in list(subscribers):
+            if not subscription.offer(event):
+                self.unsubscribe(subscription)
+
+    def resync_all(self) -> None:
+        """Drop every subscriber with an overflow marker so clients resync."""
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                subscription.overflow()
+                self.unsubscribe(subscription)
+
+    async def publish(self, user_id: str, event: dict[str, Any]) -> None:
+        """Publish an event through the transport, or locally without one.
+
+        Never raises: if the transport fails, the error is logged and the
+        event is still delivered to this worker's subscribers.
+        """
+        if self.transport is None:
+            self.deliver(user_id, event)
+            return
+        try:
+            await self.transport.publish(user_id, event)
+        except Exception:
+            logger.exception("Publishing a %s event failed", event.get("type"))
+            self.deliver(user_id, event)
+
+
+def task_event(event_type: str, task: Task) -> dict[str, Any]:
+    """Build a small change event for a task.
+
+    Args:
+        event_type: One of "created", "updated", "completed" or "deleted"
+        task: The task that changed
+
+    Returns:
+        dict[str, Any]: JSON-compatible event payload
+    """
+    updated_at: Optional[datetime] = task.updated_at
+    return {
+        "type": event_type,
+        "id": task.id,
+        "uuid": task.uuid,
+        "completed": task.completed,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+    }
+
+
+# Process-wide broker shared by the routers and the application lifespan
+broker = ChangeBroker()
@@ -0,0 +1,128 @@
+"""Postgres LISTEN/NOTIFY transport for the change broker.
+
+Lets several uvicorn workers (or hosts) share one change stream: every
+worker LISTENs on a channel and publishes with NOTIFY, and each
+notification is fanned out to that worker's local subscribers.
+
+If the connection drops, notifications sent meanwhile are lost, so the
+transport tells the broker (which asks every subscriber to resync) and
+reconnects in the background with exponential backoff.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotifyTransport:
+    """BrokerTransport backed by a dedicated asyncpg connection.
+
+    Args:
+        dsn: PostgreSQL DSN (an SQLAlchemy ``postgresql+asyncpg://`` URL works)
+        channel: NOTIFY channel name
+        ssl: Value passed to asyncpg's ``ssl`` argument (None uses its default)
+        min_backoff: Seconds before the first reconnection attempt
+        max_backoff: Longest wait between reconnection attempts
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "task_changes",
+        ssl: Any = None,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self.channel = channel
+        self.ssl = ssl
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._conn: Optional[asyncpg.Connection] = None
+        self._deliver: Optional[Callable[[str, dict[str, Any]], None]] = None
+        self._lost: Optional[Callable[[], None]] = None
+        self._reconnecting: Optional[asyncio.Task] = None
+        self._stopped = False
+        # One connection serves both LISTEN and NOTIFY; asyncpg forbids overlap
+        self._lock = asyncio.Lock()
+
+    async def start(
+        self,
+        deliver: Callable[[str, dict[str, Any]], None],
+        lost: Callable[[], None],
+    ) -> None:
+        """Open the connection and start listening."""
+        self._deliver = deliver
+        self._lost = lost
+        self._stopped = False
+        await self._connect()
+
+    async def _connect(self) -> None:
+        conn = await asyncpg.connect(self.dsn, ssl=self.ssl)
+        conn.add_termination_listener(self._on_terminate)
+        await conn.add_listener(self.channel, self._on_notify)
+        self._conn = conn
+
+    async def publish(self, user_id: str, event: dict[str, Any]) -> None:
+        """NOTIFY all listening workers about an event.
+
+        Raises:
+            ConnectionError: If the connection is down and being re-established
+        """
+        payload = json.dumps({"user_id": user_id, "event": event})
+        async with self._lock:
+            if self._conn is None or self._conn.is_closed():
+                raise ConnectionError("LISTEN/NOTIFY connection is reconnecting")
+            await self._conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        self._stopped = True
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+            self._reconnecting = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            if not conn.is_closed():
+                await conn.remove_listener(self.channel, self._on_notify)
+                await conn.close()
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        message = json.loads(payload)
+        self._deliver(message["user_id"], message["event"])
+
+    def _on_terminate(self, connection) -> None:
+        if self._stopped or connection is not self._conn:
+            return
+        self._conn = None
+        logger.warning(
+            "Lost the LISTEN connection for channel %r; reconnecting", self.channel
+        )
+        self._lost()
+        self._reconnecting = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.min_backoff
+        while not self._stopped:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+            except (OSError, asyncpg.PostgresError) as e:
+                delay = min(delay * 2, self.max_backoff)
+                logger.warning(
+                    "Reconnecting LISTEN for channel %r failed (%s); retrying in %.1fs",
+                    self.channel,
+                    e,
+                    delay,
+                )
+                continue
+            logger.info("Reconnected LISTEN for channel %r", self.channel)
+            # Changes published while the connection was down were not heard
+            self._lost()
+            self._reconnecting = None
+            return
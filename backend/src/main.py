@@ -2,12 +2,22 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import get_settings
 from src.database import close_db, init_db
-from src.routers import tasks
+from src.events import broker
+from src.middleware import CompressionMiddleware
+from src.monitoring import (
+    CONTENT_TYPE,
+    MetricsMiddleware,
+    RequestContextMiddleware,
+    TraceExporter,
+    TracingMiddleware,
+    registry,
+)
+from src.routers import admin, tasks
 
 
 @asynccontextmanager
@@ -15,8 +25,9 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events.
 
     This function handles:
-    - Startup: Initialize database tables
-    - Shutdown: Close database connections
+    - Startup: Initialize database tables and the change event broker
+    - Shutdown: Stop the broker, flush sampled traces and close database
+      connections
     """
     # Startup
     settings = get_settings()
@@ -24,11 +35,26 @@ async def lifespan(app: FastAPI):
         print("Starting up...")
     await init_db()
 
+    broker.queue_size = settings.event_queue_size
+    transport = None
+    if settings.event_transport == "postgres":
+        from src.events.postgres import PostgresNotifyTransport
+
+        transport = PostgresNotifyTransport(
+            settings.database_url,
+            ssl="require" if settings.database_ssl else None,
+        )
+    await broker.start(transport)
+
     yield
 
     # Shutdown
     if settings.debug:
         print("Shutting down...")
+    await broker.stop()
+    trace_exporter = getattr(app.state, "trace_exporter", None)
+    if trace_exporter is not None:
+        trace_exporter.close()
     await close_db()
 
 
@@ -57,8 +83,34 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Negotiated gzip/zstd/Brotli compression for larger responses
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        cache_bytes=settings.compression_cache_bytes,
+    )
+
+    # Makes the request available to SQL hooks (slow-query log, tracing)
+    app.add_middleware(RequestContextMiddleware)
+
+    # Server-Timing header and sampled span traces; wraps compression so
+    # the header is added before the response is encoded
+    if settings.server_timing_enabled or settings.trace_sample_rate > 0:
+        app.state.trace_exporter = TraceExporter(settings.trace_export_path)
+        app.add_middleware(
+            TracingMiddleware,
+            server_timing=settings.server_timing_enabled,
+            sample_rate=settings.trace_sample_rate,
+            exporter=app.state.trace_exporter,
+        )
+
+    # Request metrics; outermost so latency includes compression
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
     # Include routers
     app.include_router(tasks.router)
+    app.include_router(admin.router)
 
     # Health check endpoint
     @app.get("/health", tags=["health"])
@@ -66,6 +118,13 @@ def create_app() -> FastAPI:
         """Health check endpoint for load balancers."""
         return {"status": "healthy"}
 
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", tags=["health"], include_in_schema=False)
+        async def metrics():
+            """Prometheus metrics in text exposition format."""
+            return Response(registry.render(), media_type=CONTENT_TYPE)
+
     # Root endpoint
     @app.get("/", tags=["root"])
     async def root():
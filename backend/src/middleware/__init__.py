@@ -0,0 +1,5 @@
+"""ASGI middleware for the Todo application."""
+
+from .compression import CompressionMiddleware
+
+__all__ = ["CompressionMiddleware"]
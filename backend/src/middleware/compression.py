@@ -0,0 +1,306 @@
+"""Negotiated response compression middleware.
+
+Supports gzip (always available) plus zstd and Brotli when the optional
+``zstandard`` / ``brotli`` packages are installed. Bodies below a size
+threshold are sent as-is, streaming responses are compressed chunk by
+chunk, and compressed bodies of complete responses are kept in an LRU
+cache, bounded by total size and keyed by a digest of the body, so an
+unchanged task list is not compressed again on every poll. Server-Sent
+Events streams are never compressed, since a compressor would buffer
+events that must reach the client at once.
+"""
+
+import hashlib
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+)
+"""Content-Type prefixes worth compressing"""
+
+UNCOMPRESSED_TYPES = ("text/event-stream",)
+"""Content-Type prefixes always sent as-is, even if they match the above"""
+
+
+class _GzipStream:
+    """Incremental gzip compressor that flushes after every chunk."""
+
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    """Incremental Brotli compressor that flushes after every chunk."""
+
+    def __init__(self, quality: int) -> None:
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.process(chunk) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdStream:
+    """Incremental zstd compressor that flushes after every chunk."""
+
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class Codec:
+    """A content coding the middleware can produce.
+
+    Attributes:
+        name: Content-Encoding token (e.g. "gzip")
+        level: Compression level/quality passed to the compressor
+    """
+
+    def __init__(self, name: str, level: int) -> None:
+        self.name = name
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a complete body in one shot."""
+        if self.name == "zstd":
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        if self.name == "br":
+            return brotli.compress(data, quality=self.level)
+        obj = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return obj.compress(data) + obj.flush()
+
+    def stream(self):
+        """Return an incremental compressor for streaming bodies."""
+        if self.name == "zstd":
+            return _ZstdStream(self.level)
+        if self.name == "br":
+            return _BrotliStream(self.level)
+        return _GzipStream(self.level)
+
+
+def available_codecs(gzip_level: int = 6) -> list[Codec]:
+    """Return supported codecs in server preference order (fastest first)."""
+    codecs = []
+    if zstandard is not None:
+        codecs.append(Codec("zstd", 3))
+    if brotli is not None:
+        codecs.append(Codec("br", 4))
+    codecs.append(Codec("gzip", gzip_level))
+    return codecs
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into a mapping of coding to q-value."""
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        token, _, params = item.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+    return accepted
+
+
+class CompressionMiddleware:
+    """ASGI middleware that compresses responses the client can decode.
+
+    Args:
+        app: The wrapped ASGI application
+        minimum_size: Bodies smaller than this many bytes are not compressed
+        cache_bytes: Total size of compressed bodies kept for reuse (0 disables)
+        gzip_level: zlib compression level used for gzip
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        cache_bytes: int = 8 * 1024 * 1024,
+        gzip_level: int = 6,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_bytes = cache_bytes
+        self.codecs = available_codecs(gzip_level)
+        self._cache: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+        self._cached_bytes = 0
+
+    def negotiate(self, accept_encoding: str) -> Optional[Codec]:
+        """Pick the best codec for an Accept-Encoding header value.
+
+        The client's q-values win; ties go to the server's preference order.
+        """
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best: Optional[Codec] = None
+        best_quality = 0.0
+        for codec in self.codecs:
+            quality = accepted.get(codec.name, wildcard)
+            if quality > best_quality:
+                best, best_quality = codec, quality
+        return best
+
+    def compress_cached(self, codec: Codec, body: bytes) -> bytes:
+        """Compress a complete body, reusing a cached result when possible.
+
+        The cache is keyed by a digest of the body itself, never by ETag:
+        ETags are only unique per URL (and per user), so two responses with
+        the same ETag may have different bodies.
+        """
+        if self.cache_bytes <= 0:
+            return codec.compress(body)
+
+        key = (hashlib.blake2b(body, digest_size=16).digest(), codec.name)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        compressed = codec.compress(body)
+        if len(compressed) <= self.cache_bytes:
+            self._cache[key] = compressed
+            self._cached_bytes += len(compressed)
+            while self._cached_bytes > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+        return compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codec = self.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if codec is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, codec, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper that applies the negotiated codec."""
+
+    def __init__(self, middleware: CompressionMiddleware, codec: Codec, send: Send):
+        self.middleware = middleware
+        self.codec = codec
+        self._send = send
+        self._start: Optional[Message] = None
+        self._stream = None
+        self._passthrough = False
+
+    def _should_compress(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if content_type.startswith(UNCOMPRESSED_TYPES):
+            return False
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self._start = message
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._stream is not None:
+            chunk = self._stream.compress(body) if body else b""
+            if not more_body:
+                chunk += self._stream.finish()
+            await self._send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+            return
+
+        # First body message: decide how to send the whole response
+        start = self._start
+        headers = MutableHeaders(raw=start["headers"])
+
+        if not self._should_compress(headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.codec.name
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed representation is no longer byte-identical
+            headers["ETag"] = f"W/{etag}"
+
+        if not more_body:
+            compressed = self.middleware.compress_cached(self.codec, body)
+            headers["Content-Length"] = str(len(compressed))
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streaming response (e.g. an export): compress each chunk as it comes
+        del headers["Content-Length"]
+        self._stream = self.codec.stream()
+        await self._send(start)
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._stream.compress(body),
+                "more_body": True,
+            }
+        )
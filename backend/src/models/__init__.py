@@ -1,6 +1,14 @@
 """Database models for the Todo application."""
 
-from .task import Task
+from .stats import TaskDailyStats, TaskStats
+from .task import Task, TaskSyncState, TaskTombstone
 from .user import User
 
-__all__ = ["Task", "User"]
+__all__ = [
+    "Task",
+    "TaskTombstone",
+    "TaskSyncState",
+    "TaskStats",
+    "TaskDailyStats",
+    "User",
+]
@@ -0,0 +1,43 @@
+"""Aggregate models backing per-user task statistics."""
+
+from datetime import date
+
+from sqlmodel import Field, SQLModel
+
+
+class TaskStats(SQLModel, table=True):
+    """Running task counters for a user.
+
+    Maintained in the same transaction as every task mutation so that the
+    stats endpoint never has to scan the task table.
+
+    Attributes:
+        user_id: User the counters belong to
+        total: Number of tasks the user currently has
+        completed: Number of those tasks marked complete
+    """
+
+    __tablename__ = "task_stats"
+
+    user_id: str = Field(primary_key=True, description="User ID from JWT")
+    total: int = Field(default=0)
+    completed: int = Field(default=0)
+
+
+class TaskDailyStats(SQLModel, table=True):
+    """Number of times a user marked a task complete on a given (UTC) day.
+
+    Counts completion events: un-completing or deleting the task later does
+    not decrement the bucket.
+
+    Attributes:
+        user_id: User the bucket belongs to
+        day: UTC calendar day
+        completed: Completion events recorded on that day
+    """
+
+    __tablename__ = "task_daily_stats"
+
+    user_id: str = Field(primary_key=True, description="User ID from JWT")
+    day: date = Field(primary_key=True)
+    completed: int = Field(default=0)
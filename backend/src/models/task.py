@@ -5,6 +5,7 @@ from typing import Optional
 from uuid import uuid4
 
 from pydantic import ConfigDict
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -23,6 +24,7 @@ class Task(SQLModel, table=True):
         user_id: Foreign key referencing the user who owns this task
         created_at: Timestamp when task was created
         updated_at: Timestamp when task was last modified
+        change_seq: Per-user change sequence number of the last modification
     """
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -33,9 +35,70 @@ class Task(SQLModel, table=True):
     user_id: str = Field(index=True, description="User ID from JWT")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    change_seq: int = Field(default=0, description="Delta sync position")
 
     model_config = ConfigDict(from_attributes=True)
 
+    # Serves delta sync: "tasks of this user changed after a cursor"
+    __table_args__ = (
+        Index("ix_task_user_id_change_seq", "user_id", "change_seq", "id"),
+    )
+
     def __repr__(self) -> str:
         """String representation of the Task object."""
         return f"<Task(id={self.id}, title='{self.title}', completed={self.completed})>"
+
+
+class TaskTombstone(SQLModel, table=True):
+    """Deletion log entry used by delta sync.
+
+    A tombstone is written in the same transaction that deletes a task so
+    that syncing clients can learn about deletions without a full refetch.
+
+    Tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS are pruned; see
+    TaskSyncState.pruned_seq.
+
+    Attributes:
+        id: Primary key (auto-incrementing)
+        task_id: ID of the deleted task
+        uuid: UUID of the deleted task
+        user_id: User who owned the deleted task
+        deleted_at: Timestamp when the task was deleted
+        change_seq: Per-user change sequence number of the deletion
+    """
+
+    __tablename__ = "task_tombstone"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    task_id: int = Field(description="ID of the deleted task")
+    uuid: str = Field(description="UUID of the deleted task")
+    user_id: str = Field(index=True, description="User ID from JWT")
+    deleted_at: datetime = Field(default_factory=datetime.utcnow)
+    change_seq: int = Field(default=0, description="Delta sync position")
+
+    __table_args__ = (
+        Index("ix_task_tombstone_user_id_change_seq", "user_id", "change_seq"),
+    )
+
+
+class TaskSyncState(SQLModel, table=True):
+    """Per-user change counter that orders task changes for delta sync.
+
+    Every mutation increments ``change_seq`` in its own transaction and
+    stamps the changed task (or tombstone) with the new value. The row
+    stays locked until that transaction commits, so a user's changes
+    become visible in sequence order and a sync cursor never skips a
+    change that committed late.
+
+    Attributes:
+        user_id: User the counter belongs to
+        change_seq: Sequence number of the user's latest change
+        pruned_seq: Highest sequence number of a pruned tombstone; older
+            sync cursors may have missed deletions and must resync
+    """
+
+    __tablename__ = "task_sync_state"
+
+    user_id: str = Field(primary_key=True, description="User ID from JWT")
+    change_seq: int = Field(default=0)
+    pruned_seq: int = Field(default=0)
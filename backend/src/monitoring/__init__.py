@@ -0,0 +1,36 @@
+"""Monitoring: metrics, SQL statement hooks and request instrumentation."""
+
+from .context import RequestContextMiddleware, current_user_id, request_scope
+from .metrics import CONTENT_TYPE, registry
+from .middleware import MetricsMiddleware
+from .profiler import SamplingProfiler, profiler
+from .slow_queries import SlowQueryLog, slow_query_log
+from .sql import (
+    QueryBudget,
+    add_statement_observer,
+    instrument_engine,
+    remove_statement_observer,
+)
+from .tracing import TraceExporter, TracingMiddleware, add_span, current_trace, span
+
+__all__ = [
+    "RequestContextMiddleware",
+    "current_user_id",
+    "request_scope",
+    "CONTENT_TYPE",
+    "registry",
+    "MetricsMiddleware",
+    "SamplingProfiler",
+    "profiler",
+    "SlowQueryLog",
+    "slow_query_log",
+    "QueryBudget",
+    "add_statement_observer",
+    "instrument_engine",
+    "remove_statement_observer",
+    "TraceExporter",
+    "TracingMiddleware",
+    "add_span",
+    "current_trace",
+    "span",
+]
@@ -0,0 +1,63 @@
+"""Per-request context shared with code that has no access to the request.
+
+SQLAlchemy engine events and other low-level hooks use these to find out
+which route and user a statement belongs to.
+"""
+
+import hashlib
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import get_settings
+
+from .profiler import profiler
+
+request_scope: ContextVar[Optional[Scope]] = ContextVar("request_scope", default=None)
+"""ASGI scope of the request being served (route is filled in after routing)"""
+
+current_user_id: ContextVar[Optional[str]] = ContextVar(
+    "current_user_id", default=None
+)
+"""Authenticated user ID, set by get_current_user_id"""
+
+
+def current_route() -> Optional[str]:
+    """Return ``"METHOD /route/template"`` for the current request, if any."""
+    scope = request_scope.get()
+    if scope is None:
+        return None
+    route = getattr(scope.get("route"), "path_format", None) or "<unmatched>"
+    return f"{scope['method']} {route}"
+
+
+def hash_user_id(user_id: Optional[str]) -> Optional[str]:
+    """Return a short keyed hash of a user ID, safe to put in logs."""
+    if user_id is None:
+        return None
+    key = get_settings().better_auth_secret.encode("utf-8")[:64]
+    return hashlib.blake2b(user_id.encode("utf-8"), key=key, digest_size=8).hexdigest()
+
+
+class RequestContextMiddleware:
+    """Expose the current request's ASGI scope through ``request_scope``.
+
+    Also reports finished requests to the sampling profiler while it runs.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_scope.reset(token)
+            if profiler.running:
+                profiler.request_finished()
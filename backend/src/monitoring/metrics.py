@@ -0,0 +1,205 @@
+"""Minimal Prometheus-style metrics with a lock-free hot path.
+
+Metrics are plain dicts of label tuples to numbers. Every update happens on
+the event loop thread (SQLAlchemy's async engine runs its events there
+too), so increments need no locks; histograms store per-bucket counts and
+only accumulate them when /metrics is rendered.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+"""Latency buckets in seconds"""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content-Type of the Prometheus text exposition format"""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(
+    names: tuple[str, ...], values: tuple[str, ...], extra: str = ""
+) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base class for a named metric family.
+
+    Attributes:
+        name: Metric name
+        documentation: HELP text
+        labelnames: Names of the labels, in the order values are passed
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> list[str]:
+        """Render the metric family in Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self.samples())
+        return lines
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...] = (), amount: float = 1) -> None:
+        """Increase the counter for a label set."""
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in list(self.values.items())
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def dec(self, labels: tuple[str, ...] = (), amount: float = 1) -> None:
+        """Decrease the gauge for a label set."""
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def set(self, labels: tuple[str, ...], value: float) -> None:
+        """Set the gauge for a label set."""
+        self.values[labels] = value
+
+
+class Histogram(Metric):
+    """Distribution of observations across fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., count above last bucket, sum]
+        self.values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        """Record one observation for a label set."""
+        state = self.values.get(labels)
+        if state is None:
+            state = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def samples(self) -> list[str]:
+        lines = []
+        for labels, state in list(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} "
+                    f"{cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric, returning an existing one with the same name."""
+        return self.metrics.setdefault(metric.name, metric)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Look up a metric by name."""
+        return self.metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in list(self.metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by method, route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration_seconds = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method and route template.",
+        ("method", "route"),
+    )
+)
+http_requests_in_progress = registry.register(
+    Gauge(
+        "http_requests_in_progress",
+        "HTTP requests currently being served, by method.",
+        ("method",),
+    )
+)
+db_statement_duration_seconds = registry.register(
+    Histogram(
+        "db_statement_duration_seconds",
+        "SQL statement execution time by statement type.",
+        ("operation",),
+    )
+)
+jwt_verification_duration_seconds = registry.register(
+    Histogram(
+        "jwt_verification_duration_seconds",
+        "JWT decoding and verification time by outcome.",
+        ("result",),
+        buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01),
+    )
+)
@@ -0,0 +1,52 @@
+"""ASGI middleware recording per-route request metrics."""
+
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import (
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_requests_total,
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Return the matched route's path template, e.g. ``/api/{user_id}/tasks``.
+
+    Unmatched paths collapse into one label value to keep cardinality bounded.
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Record latency, status and in-flight counts for HTTP requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_progress.dec((method,))
+            route = route_template(scope)
+            elapsed = perf_counter() - start
+            http_request_duration_seconds.observe((method, route), elapsed)
+            http_requests_total.inc((method, route, str(status_code)))
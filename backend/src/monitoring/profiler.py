@@ -0,0 +1,167 @@
+"""On-demand statistical CPU profiler for a running worker.
+
+While a profile is being taken, a daemon thread wakes every few
+milliseconds, reads the event loop thread's current stack with
+``sys._current_frames()`` and counts it. Nothing is installed in the
+interpreter (no ``sys.setprofile`` tracing), so the profiled code runs at
+full speed and the cost is bounded by the sampling interval. Results are
+returned in the collapsed-stack format read by flamegraph.pl, speedscope
+and inferno: one ``root;caller;callee count`` line per distinct stack.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+MAX_DEPTH = 128
+"""Deeper stacks are truncated at the root end"""
+
+_PATH_PREFIXES = sorted(
+    {os.path.join(path, "") for path in sys.path if path and os.path.isdir(path)},
+    key=len,
+    reverse=True,
+)
+
+
+def _short_path(filename: str) -> str:
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+def frame_label(frame: FrameType) -> str:
+    """Describe a frame as ``function (path:first_line)``."""
+    code = frame.f_code
+    return f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame: Optional[FrameType]) -> str:
+    """Fold a frame and its callers into a root-first, ``;``-joined stack."""
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile is requested while another one is running."""
+
+
+class SamplingProfiler:
+    """Samples one thread's stack at a fixed interval.
+
+    Only one profile runs at a time per worker.
+    """
+
+    def __init__(self) -> None:
+        self.samples: Counter[str] = Counter()
+        self.requests_seen = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._request_target: Optional[int] = None
+        self._requests_done: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether a profile is currently being taken."""
+        return self._thread is not None
+
+    def start(self, interval: float, thread_id: Optional[int] = None) -> None:
+        """Begin sampling.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (defaults to the calling thread)
+
+        Raises:
+            ProfilerBusy: If a profile is already running
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise ProfilerBusy("A profile is already running")
+            self.samples = Counter()
+            self.requests_seen = 0
+            self._stop.clear()
+            target = thread_id if thread_id is not None else threading.get_ident()
+            self._thread = threading.Thread(
+                target=self._sample,
+                args=(target, interval),
+                name="sampling-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """Stop sampling and return the collected stack counts."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        self._request_target = None
+        self._requests_done = None
+        return self.samples
+
+    def _sample(self, thread_id: int, interval: float) -> None:
+        samples = self.samples
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                break
+            samples[collapse_stack(frame)] += 1
+            del frame
+
+    def request_finished(self) -> None:
+        """Count a completed request (called by RequestContextMiddleware)."""
+        self.requests_seen += 1
+        if (
+            self._request_target is not None
+            and self.requests_seen >= self._request_target
+        ):
+            self._requests_done.set()
+
+    async def profile(
+        self,
+        seconds: float,
+        requests: Optional[int] = None,
+        interval: float = 0.005,
+    ) -> Counter[str]:
+        """Profile the event loop thread of this worker.
+
+        Args:
+            seconds: Length of the window (upper bound when ``requests`` is set)
+            requests: Stop early once this many other requests have completed
+            interval: Seconds between samples
+
+        Returns:
+            Counter[str]: Number of samples per collapsed stack
+
+        Raises:
+            ProfilerBusy: If a profile is already running
+        """
+        self.start(interval)
+        self._requests_done = asyncio.Event()
+        self._request_target = requests
+        try:
+            await asyncio.wait_for(self._requests_done.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            samples = self.stop()
+        return samples
+
+
+def render_collapsed(samples: Counter[str]) -> str:
+    """Format stack counts as collapsed-stack lines, most frequent first."""
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+
+profiler = SamplingProfiler()
+"""Process-wide profiler used by the admin endpoint"""
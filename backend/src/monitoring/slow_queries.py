@@ -0,0 +1,169 @@
+"""Slow-query log with optional, sampled EXPLAIN capture.
+
+Statements slower than a threshold are recorded in a bounded ring buffer
+together with the shape of their bound parameters (types only, never
+values), the calling route and a keyed hash of the user ID. When enabled,
+a sample of them is re-run as ``EXPLAIN`` on a separate connection in a
+background task, rate-limited so a burst of slow queries cannot pile more
+load onto the database.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .context import current_route, current_user_id, hash_user_id
+from .sql import add_statement_observer, statement_operation
+
+MAX_STATEMENT_LENGTH = 2000
+"""Longer statements are truncated in the log"""
+
+EXPLAINABLE = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+"""Statement types EXPLAIN is attempted for (plain EXPLAIN never executes)"""
+
+_explaining: ContextVar[bool] = ContextVar("explaining_slow_query", default=False)
+
+
+def parameter_shape(parameters: Any) -> str:
+    """Describe bound parameters by type only, e.g. ``(str, int, int)``."""
+    if parameters is None:
+        return "()"
+    if isinstance(parameters, dict):
+        inner = ", ".join(
+            f"{name}: {type(value).__name__}" for name, value in parameters.items()
+        )
+        return "{" + inner + "}"
+    if isinstance(parameters, list):
+        if not parameters:
+            return "[]"
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+    if isinstance(parameters, tuple):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+class SlowQueryLog:
+    """Ring buffer of slow SQL statements.
+
+    Args:
+        threshold_ms: Statements taking at least this long are recorded
+        size: Maximum number of entries kept
+        explain: Whether to capture EXPLAIN plans
+        explain_sample_rate: Fraction of slow statements to EXPLAIN
+        explain_per_minute: Upper bound on EXPLAINs issued per minute
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 200.0,
+        size: int = 100,
+        explain: bool = False,
+        explain_sample_rate: float = 0.1,
+        explain_per_minute: int = 6,
+    ) -> None:
+        self.entries: deque[dict[str, Any]] = deque(maxlen=size)
+        self.engine: Optional[AsyncEngine] = None
+        self._explain_times: deque[float] = deque()
+        self._pending: set[asyncio.Task] = set()
+        self.configure(
+            threshold_ms, size, explain, explain_sample_rate, explain_per_minute
+        )
+
+    def configure(
+        self,
+        threshold_ms: float,
+        size: int,
+        explain: bool,
+        explain_sample_rate: float,
+        explain_per_minute: int,
+    ) -> None:
+        """Update settings, keeping the most recent entries that still fit."""
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_per_minute = explain_per_minute
+        if self.entries.maxlen != size:
+            self.entries = deque(self.entries, maxlen=size)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Start observing statements executed on an engine."""
+        self.engine = engine
+        add_statement_observer(self.observe)
+
+    def clear(self) -> None:
+        """Drop every recorded entry."""
+        self.entries.clear()
+
+    def observe(
+        self, conn: Connection, statement: str, parameters: Any, duration: float
+    ) -> None:
+        """Statement observer: record the statement if it was slow."""
+        duration_ms = duration * 1000
+        if duration_ms < self.threshold_ms or _explaining.get():
+            return
+
+        entry = {
+            "recorded_at": datetime.utcnow().isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "parameter_shape": parameter_shape(parameters),
+            "route": current_route(),
+            "user_hash": hash_user_id(current_user_id.get()),
+            "plan": None,
+        }
+        self.entries.append(entry)
+
+        if self._should_explain(statement):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self._capture_plan(entry, statement, parameters))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    def _should_explain(self, statement: str) -> bool:
+        if not self.explain or self.engine is None:
+            return False
+        if statement_operation(statement) not in EXPLAINABLE:
+            return False
+        if random.random() >= self.explain_sample_rate:
+            return False
+
+        # Sliding one-minute window rate limit
+        now = time.monotonic()
+        while self._explain_times and now - self._explain_times[0] > 60:
+            self._explain_times.popleft()
+        if len(self._explain_times) >= self.explain_per_minute:
+            return False
+        self._explain_times.append(now)
+        return True
+
+    async def _capture_plan(
+        self, entry: dict[str, Any], statement: str, parameters: Any
+    ) -> None:
+        _explaining.set(True)
+        if self.engine.dialect.name == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN "
+        else:
+            prefix = "EXPLAIN "
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.exec_driver_sql(prefix + statement, parameters)
+                rows = result.fetchall()
+            entry["plan"] = "\n".join(
+                " ".join(str(value) for value in row) for row in rows
+            )
+        except Exception as e:
+            entry["plan"] = f"EXPLAIN failed: {type(e).__name__}: {e}"
+
+
+# Process-wide slow-query log, attached to the engine by get_engine()
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,79 @@
+"""SQL statement timing hooks shared by monitoring features.
+
+A single pair of SQLAlchemy cursor events times every statement and hands
+the result to registered observers, so metrics, logging and tracing do not
+each install their own listeners.
+"""
+
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .metrics import db_statement_duration_seconds
+
+StatementObserver = Callable[[Connection, str, Any, float], None]
+"""Callback receiving (connection, statement, parameters, duration_seconds)"""
+
+
+class QueryBudget(NamedTuple):
+    """Most database work a route may do per request.
+
+    Attributes:
+        statements: SQL statements executed
+        round_trips: Statements plus transaction BEGIN/COMMIT/ROLLBACK
+    """
+
+    statements: int
+    round_trips: int
+
+
+def _record_metrics(conn: Connection, statement: str, parameters: Any, duration: float):
+    db_statement_duration_seconds.observe((statement_operation(statement),), duration)
+
+
+_observers: list[StatementObserver] = [_record_metrics]
+
+
+def add_statement_observer(observer: StatementObserver) -> None:
+    """Register a callback run after every SQL statement."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_statement_observer(observer: StatementObserver) -> None:
+    """Unregister a callback added with add_statement_observer."""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def statement_operation(statement: str) -> str:
+    """Return the leading SQL keyword (SELECT, INSERT, ...) of a statement."""
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the per-execution context, so a failed statement leaves nothing
+    # behind on the connection
+    if context is not None:
+        context._statement_start = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_statement_start", None)
+    if start is None:
+        return
+    duration = perf_counter() - start
+    for observer in _observers:
+        observer(conn, statement, parameters, duration)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach the timing listeners to an async engine (idempotent)."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
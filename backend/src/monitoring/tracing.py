@@ -0,0 +1,272 @@
+"""Per-request span tracking, Server-Timing headers and sampled trace export.
+
+A RequestTrace lives in a context variable for the duration of a request.
+JWT verification, pool checkout, every SQL statement and JSON encoding
+add spans to it; the totals go out in a ``Server-Timing`` header and a
+sampled subset of full traces is appended as JSON lines to a file by a
+background thread, so file I/O never blocks the event loop. When
+Server-Timing is off and a request is not sampled no trace is created,
+and each hook costs a single context variable lookup.
+"""
+
+import json
+import logging
+import queue
+import random
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .context import current_user_id, hash_user_id
+from .sql import add_statement_observer, statement_operation
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTrace:
+    """Spans recorded while serving one request.
+
+    Attributes:
+        start: perf_counter() value when the request arrived
+        sampled: Whether the full trace is exported
+        spans: (name, start offset in seconds, duration in seconds, detail)
+    """
+
+    __slots__ = ("start", "sampled", "spans")
+
+    def __init__(self, sampled: bool) -> None:
+        self.start = perf_counter()
+        self.sampled = sampled
+        self.spans: list[tuple[str, float, float, Optional[str]]] = []
+
+    def add(self, name: str, duration: float, detail: Optional[str] = None) -> None:
+        """Record a span that just finished and took ``duration`` seconds."""
+        offset = perf_counter() - self.start - duration
+        self.spans.append((name, offset, duration, detail))
+
+    def server_timing(self) -> str:
+        """Summarise spans as a Server-Timing header value (durations in ms)."""
+        totals: dict[str, list[float]] = {}
+        for name, _, duration, _ in self.spans:
+            total = totals.setdefault(name, [0.0, 0])
+            total[0] += duration
+            total[1] += 1
+
+        metrics = []
+        for name, (duration, count) in totals.items():
+            entry = f"{name};dur={duration * 1000:.2f}"
+            if count > 1:
+                entry += f';desc="{count}x"'
+            metrics.append(entry)
+        metrics.append(f"app;dur={(perf_counter() - self.start) * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+current_trace: ContextVar[Optional[RequestTrace]] = ContextVar(
+    "current_trace", default=None
+)
+"""Trace of the request being served, or None when tracing is off"""
+
+
+def add_span(name: str, duration: float, detail: Optional[str] = None) -> None:
+    """Add a span to the current request's trace, if there is one."""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.add(name, duration, detail)
+
+
+class span:
+    """Context manager timing a block into the current trace.
+
+    Usage:
+        with span("encode"):
+            body = render(content)
+    """
+
+    __slots__ = ("name", "detail", "_trace", "_start")
+
+    def __init__(self, name: str, detail: Optional[str] = None) -> None:
+        self.name = name
+        self.detail = detail
+
+    def __enter__(self) -> "span":
+        self._trace = current_trace.get()
+        if self._trace is not None:
+            self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._trace is not None:
+            self._trace.add(self.name, perf_counter() - self._start, self.detail)
+
+
+def _trace_statement(
+    conn: Connection, statement: str, parameters: Any, duration: float
+) -> None:
+    trace = current_trace.get()
+    if trace is not None:
+        trace.add("sql", duration, statement_operation(statement))
+
+
+def _mark_checkout_start(orm_execute_state) -> None:
+    session = orm_execute_state.session
+    if not session.in_transaction() and current_trace.get() is not None:
+        session.info["checkout_start"] = perf_counter()
+
+
+def _record_checkout(session: Session, transaction, connection) -> None:
+    start = session.info.pop("checkout_start", None)
+    if start is not None:
+        add_span("db-checkout", perf_counter() - start)
+
+
+def install_tracing() -> None:
+    """Hook SQL statements and session connection checkout (idempotent)."""
+    add_statement_observer(_trace_statement)
+    if not event.contains(Session, "do_orm_execute", _mark_checkout_start):
+        event.listen(Session, "do_orm_execute", _mark_checkout_start)
+        event.listen(Session, "after_begin", _record_checkout)
+
+
+class TraceExporter:
+    """Appends sampled traces to a JSON-lines file from a background thread.
+
+    export() only queues the record; a daemon thread started on first use
+    writes it. Records arriving while ``queue_size`` are still waiting are
+    dropped and counted in ``dropped``.
+
+    Args:
+        path: File to append to
+        queue_size: Most records waiting to be written
+    """
+
+    def __init__(self, path: str, queue_size: int = 1000) -> None:
+        self.path = path
+        self.dropped = 0
+        self._queue: queue.Queue[Optional[dict[str, Any]]] = queue.Queue(queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, record: dict[str, Any]) -> None:
+        """Queue one trace record for writing (never blocks)."""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write the queued records and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write, name="trace-exporter", daemon=True
+                )
+                self._thread.start()
+
+    def _write(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+            except OSError:
+                logger.exception("Could not write trace to %s", self.path)
+            finally:
+                self._queue.task_done()
+
+
+class TracingMiddleware:
+    """Create a RequestTrace per request and report it.
+
+    Args:
+        app: The wrapped ASGI application
+        server_timing: Whether to add a Server-Timing header to responses
+        sample_rate: Fraction of requests whose full trace is exported
+        exporter: Destination for sampled traces
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = False,
+        sample_rate: float = 0.0,
+        exporter: Optional[TraceExporter] = None,
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.sample_rate = sample_rate if exporter is not None else 0.0
+        self.exporter = exporter
+        install_tracing()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or current_trace.get() is not None:
+            # Not HTTP, or already traced by an outer TracingMiddleware
+            await self.app(scope, receive, send)
+            return
+
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not (self.server_timing or sampled):
+            await self.app(scope, receive, send)
+            return
+
+        trace = RequestTrace(sampled)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        token = current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if sampled:
+                self._export(trace, scope, status_code)
+            current_trace.reset(token)
+
+    def _export(self, trace: RequestTrace, scope: Scope, status_code: int) -> None:
+        route = getattr(scope.get("route"), "path_format", None) or "<unmatched>"
+        record = {
+            "route": f"{scope['method']} {route}",
+            "status": status_code,
+            "user_hash": hash_user_id(current_user_id.get()),
+            "duration_ms": round((perf_counter() - trace.start) * 1000, 3),
+            "spans": [
+                {
+                    "name": name,
+                    "start_ms": round(offset * 1000, 3),
+                    "duration_ms": round(duration * 1000, 3),
+                    "detail": detail,
+                }
+                for name, offset, duration, detail in trace.spans
+            ],
+        }
+        self.exporter.export(record)
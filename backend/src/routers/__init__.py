@@ -1,5 +1,5 @@
 """API routers for the Todo application."""
 
-from . import tasks
+from . import admin, tasks
 
-__all__ = ["tasks"]
+__all__ = ["admin", "tasks"]
@@ -0,0 +1,94 @@
+"""Operational endpoints guarded by the admin token."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.config import get_settings
+from src.dependencies.admin import require_admin
+from src.monitoring.profiler import ProfilerBusy, profiler, render_collapsed
+from src.monitoring.slow_queries import slow_query_log
+
+# All routes require the X-Admin-Token header and stay out of the public docs
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+    include_in_schema=False,
+)
+
+
+@router.get(
+    "/slow-queries",
+    status_code=status.HTTP_200_OK,
+    summary="List recently recorded slow SQL statements",
+)
+async def list_slow_queries(limit: int = 50):
+    """Get the most recent slow statements, newest first.
+
+    Args:
+        limit: Maximum number of entries to return
+
+    Returns:
+        dict: Threshold, number of entries kept and the entries themselves
+    """
+    entries = list(slow_query_log.entries)[-limit:][::-1] if limit > 0 else []
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "recorded": len(slow_query_log.entries),
+        "entries": entries,
+    }
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Clear the slow-query log",
+)
+async def clear_slow_queries():
+    """Drop every recorded slow statement."""
+    slow_query_log.clear()
+
+
+@router.post(
+    "/profile",
+    response_class=PlainTextResponse,
+    summary="Take a sampling CPU profile of this worker",
+)
+async def take_profile(
+    seconds: float = Query(10.0, gt=0),
+    requests: Optional[int] = Query(None, ge=1),
+    interval_ms: float = Query(5.0, ge=1, le=100),
+):
+    """Sample the worker's event loop and return collapsed stacks.
+
+    The response arrives when the window closes, so it covers whatever
+    other requests this worker served meanwhile. Pipe it into
+    ``flamegraph.pl`` or load it in speedscope.
+
+    Args:
+        seconds: Window length, capped at PROFILER_MAX_SECONDS
+        requests: Stop early once this many other requests have finished
+        interval_ms: Milliseconds between samples
+
+    Returns:
+        str: ``frame;frame;frame count`` lines, most frequent first
+
+    Raises:
+        HTTPException: 404 if the profiler is disabled
+        HTTPException: 409 if a profile is already running
+    """
+    settings = get_settings()
+    if not settings.profiler_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    try:
+        samples = await profiler.profile(
+            min(seconds, settings.profiler_max_seconds),
+            requests=requests,
+            interval=interval_ms / 1000,
+        )
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    return render_collapsed(samples)
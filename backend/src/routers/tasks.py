@@ -3,28 +3,125 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import get_settings
 from src.database import get_db
-from src.dependencies.auth import get_current_user_id, verify_task_ownership
-from src.models.task import Task
+from src.dependencies.auth import get_current_user_id
+from src.events.broker import OVERFLOW, Subscription, broker, task_event
+from src.models.task import Task, TaskTombstone
+from src.monitoring.sql import QueryBudget
 from src.schemas.task import (
+    TaskChangesResponse,
     TaskCompleteResponse,
     TaskCreate,
     TaskListResponse,
     TaskResponse,
+    TaskStatsResponse,
     TaskUpdate,
+    parse_task_fields,
+)
+from src.utils.serialization import FastJSONResponse, dumps, release_and_respond
+from src.utils.stats import get_task_stats, record_task_change
+from src.utils.sync import (
+    SyncCursor,
+    decode_sync_token,
+    encode_sync_token,
+    get_sync_state,
+    next_change_seq,
+    prune_tombstones,
 )
 
 # Create router with path prefix and tags
 router = APIRouter(prefix="/api/{user_id}/tasks", tags=["tasks"])
 
+# Most database work each endpoint may do per request once the user's stats
+# row exists; enforced by tests/test_query_budgets.py. Raise a budget only
+# deliberately, in the same change that needs the extra query. Round trips
+# add BEGIN and COMMIT/ROLLBACK to the statements.
+#
+# Every write first takes the user's next change sequence number (one
+# upsert that also serializes the user's writes until commit) and then
+# changes the task in one statement that doubles as the ownership check:
+#   create: sequence, INSERT, stats counters
+#   update: sequence, UPDATE ... RETURNING, stats counters and daily bucket
+#     when completion flips (a flip that finds the status already set falls
+#     back to a plain UPDATE and skips the stats, so it is also at most 4)
+#   toggle: sequence, UPDATE ... RETURNING, stats counters, daily bucket
+#   delete: sequence, DELETE ... RETURNING, tombstone pruning, tombstone
+#     INSERT, stats counters
+# Reads: list is one SELECT with a window-function total; changes reads the
+# sync state, the tasks and, given a token, the tombstones; stats reads the
+# counters and the daily buckets.
+QUERY_BUDGETS = {
+    "list_tasks": QueryBudget(statements=1, round_trips=3),
+    "create_task": QueryBudget(statements=3, round_trips=5),
+    "list_task_changes": QueryBudget(statements=3, round_trips=5),
+    "task_stats": QueryBudget(statements=2, round_trips=4),
+    "stream_task_events": QueryBudget(statements=0, round_trips=0),
+    "get_task": QueryBudget(statements=1, round_trips=3),
+    "update_task": QueryBudget(statements=4, round_trips=6),
+    "delete_task": QueryBudget(statements=5, round_trips=7),
+    "toggle_task_complete": QueryBudget(statements=4, round_trips=6),
+}
+
+_TOTAL = "_total"
+"""Label of the window-function count selected alongside list pages"""
+
+
+def _task_columns(fields: Optional[str]) -> list:
+    """Resolve a ``?fields=`` value into Task columns to select.
+
+    Raises:
+        HTTPException: 400 if the fieldset is invalid
+    """
+    try:
+        names = parse_task_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return [getattr(Task, name) for name in names]
+
+
+async def _sse_stream(subscription: Subscription, heartbeat: float):
+    """Render a subscription as a Server-Sent Events stream."""
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            event = await subscription.get(timeout=heartbeat)
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {dumps(event).decode()}\n\n"
+            if event is OVERFLOW:
+                break
+    finally:
+        broker.unsubscribe(subscription)
+
+
+async def _update_owned_task(
+    db: AsyncSession, task_id: int, user_id: str, values: dict, *conditions
+) -> Optional[Task]:
+    """UPDATE one of the user's tasks and return it, or None if none matched.
+
+    The row is changed and read back in a single statement, which also
+    serves as the ownership check.
+    """
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id, *conditions)
+        .values(**values)
+        .returning(Task)
+    )
+    return result.scalar_one_or_none()
+
 
 @router.get(
     "",
     response_model=TaskListResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="List all tasks for a user",
 )
@@ -33,48 +130,62 @@ async def list_tasks(
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-    _: str = Depends(get_current_user_id),
+    fields: Optional[str] = None,
+    token_user_id: str = Depends(get_current_user_id),
 ):
     """Get a paginated list of all tasks for the authenticated user.
 
+    Rows come straight from the database, so they are encoded directly to
+    JSON instead of being validated into TaskResponse objects one by one.
+    A sparse fieldset (``?fields=id,title,completed``) narrows both the
+    selected columns and the returned objects.
+
     Args:
         user_id: The user ID from the URL path (verified against JWT)
         db: Database session
         skip: Number of tasks to skip (for pagination)
         limit: Maximum number of tasks to return
+        fields: Optional comma-separated list of task fields to return
+        token_user_id: User ID from JWT token
 
     Returns:
-        TaskListResponse: Object containing tasks list and total count
+        FastJSONResponse: TaskListResponse-shaped body with tasks and total count
 
     Raises:
+        HTTPException: 400 if fields names an unknown field
         HTTPException: 401 if authentication fails
         HTTPException: 403 if user_id doesn't match token
     """
     # Verify the user_id in URL matches the authenticated user
-    token_user_id = Depends(get_current_user_id)
-    if user_id != token_user_id.dependency:
+    if user_id != token_user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot access other user's tasks",
         )
 
-    # Count total tasks for the user
-    count_query = select(func.count()).where(Task.user_id == user_id)
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    columns = _task_columns(fields)
 
-    # Get paginated tasks
+    # Get the page and the user's total in one statement
     query = (
-        select(Task)
+        select(*columns, func.count().over().label(_TOTAL))
         .where(Task.user_id == user_id)
         .offset(skip)
         .limit(limit)
         .order_by(Task.created_at.desc())
     )
     result = await db.execute(query)
-    tasks = list(result.scalars().all())
+    tasks = [dict(row) for row in result.mappings()]
+
+    if tasks:
+        total = tasks[0][_TOTAL]
+        for task in tasks:
+            del task[_TOTAL]
+    else:
+        # An empty page carries no count; only then is a second query needed
+        count_query = select(func.count()).where(Task.user_id == user_id)
+        total = (await db.execute(count_query)).scalar_one()
 
-    return TaskListResponse(tasks=tasks, total=total)
+    return await release_and_respond(db, {"tasks": tasks, "total": total})
 
 
 @router.post(
@@ -116,18 +227,247 @@ async def create_task(
         title=task_data.title,
         description=task_data.description,
         user_id=user_id,
+        change_seq=await next_change_seq(db, user_id),
     )
 
     db.add(task)
+    await record_task_change(db, user_id, total_delta=1)
     await db.commit()
-    await db.refresh(task)
+    await broker.publish(user_id, task_event("created", task))
 
     return task
 
 
+@router.get(
+    "/changes",
+    response_model=TaskChangesResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List task changes since a sync token",
+)
+async def list_task_changes(
+    user_id: str,
+    db: AsyncSession = Depends(get_db),
+    since: Optional[str] = None,
+    limit: int = 500,
+    token_user_id: str = Depends(get_current_user_id),
+):
+    """Get tasks created or updated, and tasks deleted, since a sync token.
+
+    Without ``since`` every task is returned (a full sync) together with a
+    token positioned at the current end of the deletion log. Clients then
+    pass ``next_token`` back to receive only later changes, repeating while
+    ``has_more`` is true.
+
+    Changes are ordered by a per-user sequence number assigned when they
+    commit (see utils/sync.py), so no change is skipped however late its
+    transaction commits. Deletions are remembered for
+    SYNC_TOMBSTONE_RETENTION_DAYS; an older token gets 410 Gone and the
+    client must start again with a full sync.
+
+    Args:
+        user_id: The user ID from the URL path
+        db: Database session
+        since: Token returned by a previous call, or None for a full sync
+        limit: Maximum number of tasks and of tombstones to return
+        token_user_id: User ID from JWT token
+
+    Returns:
+        FastJSONResponse: TaskChangesResponse-shaped body
+
+    Raises:
+        HTTPException: 400 if the sync token is invalid
+        HTTPException: 401 if authentication fails
+        HTTPException: 403 if user_id doesn't match token
+        HTTPException: 410 if the sync token is too old; resync required
+    """
+    # Verify the user_id in URL matches the authenticated user
+    if user_id != token_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot access other user's tasks",
+        )
+
+    try:
+        cursor = decode_sync_token(since) if since else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    change_seq, pruned_seq = await get_sync_state(db, user_id)
+    if cursor is not None and cursor.tombstone_seq < pruned_seq:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Resync required: sync token predates retained deletions",
+        )
+
+    # Tasks changed after the cursor, walking (user_id, change_seq, id) in order
+    query = select(*_task_columns(None), Task.change_seq).where(
+        Task.user_id == user_id
+    )
+    if cursor is not None:
+        query = query.where(
+            or_(
+                Task.change_seq > cursor.change_seq,
+                and_(
+                    Task.change_seq == cursor.change_seq,
+                    Task.id > cursor.task_id,
+                ),
+            )
+        )
+    query = query.order_by(Task.change_seq, Task.id).limit(limit + 1)
+    tasks = [dict(row) for row in (await db.execute(query)).mappings()]
+
+    # Deletions after the cursor; a full sync only needs the log position
+    if cursor is not None:
+        tombstone_query = (
+            select(
+                TaskTombstone.change_seq,
+                TaskTombstone.task_id,
+                TaskTombstone.uuid,
+                TaskTombstone.deleted_at,
+            )
+            .where(
+                TaskTombstone.user_id == user_id,
+                TaskTombstone.change_seq > cursor.tombstone_seq,
+            )
+            .order_by(TaskTombstone.change_seq)
+            .limit(limit + 1)
+        )
+        result = await db.execute(tombstone_query)
+        deleted = [dict(row) for row in result.mappings()]
+        last_tombstone_seq = cursor.tombstone_seq
+    else:
+        deleted = []
+        last_tombstone_seq = change_seq
+
+    has_more = len(tasks) > limit or len(deleted) > limit
+    tasks = tasks[:limit]
+    deleted = deleted[:limit]
+
+    if tasks:
+        last_change_seq, last_task_id = tasks[-1]["change_seq"], tasks[-1]["id"]
+    elif cursor is not None:
+        last_change_seq, last_task_id = cursor.change_seq, cursor.task_id
+    else:
+        last_change_seq, last_task_id = 0, 0
+    if deleted:
+        last_tombstone_seq = deleted[-1]["change_seq"]
+    tasks = [
+        {key: value for key, value in row.items() if key != "change_seq"}
+        for row in tasks
+    ]
+    deleted = [
+        {key: value for key, value in row.items() if key != "change_seq"}
+        for row in deleted
+    ]
+
+    next_token = encode_sync_token(
+        SyncCursor(last_change_seq, last_task_id, last_tombstone_seq)
+    )
+
+    return await release_and_respond(
+        db,
+        {
+            "tasks": tasks,
+            "deleted": deleted,
+            "next_token": next_token,
+            "has_more": has_more,
+        },
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsResponse,
+    response_class=FastJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get task summary statistics",
+)
+async def task_stats(
+    user_id: str,
+    db: AsyncSession = Depends(get_db),
+    days: int = Query(default=30, ge=1, le=365),
+    token_user_id: str = Depends(get_current_user_id),
+):
+    """Get total, open and done counts plus a daily completion trend.
+
+    Served from aggregates maintained with every task mutation, so the cost
+    does not depend on how many tasks the user has. The trend counts
+    completion events on each UTC day; un-completing or deleting a task
+    does not remove it from the day it was completed.
+
+    Args:
+        user_id: The user ID from the URL path
+        db: Database session
+        days: Number of days in the completion trend, ending today
+        token_user_id: User ID from JWT token
+
+    Returns:
+        FastJSONResponse: TaskStatsResponse-shaped body
+
+    Raises:
+        HTTPException: 401 if authentication fails
+        HTTPException: 403 if user_id doesn't match token
+    """
+    # Verify the user_id in URL matches the authenticated user
+    if user_id != token_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot access other user's tasks",
+        )
+
+    stats = await get_task_stats(db, user_id, days)
+    return await release_and_respond(db, stats)
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream task changes as Server-Sent Events",
+)
+async def stream_task_events(
+    user_id: str,
+    token_user_id: str = Depends(get_current_user_id),
+):
+    """Push the user's task changes as they happen.
+
+    Each mutation is sent as a small event (``created``, ``updated``,
+    ``completed`` or ``deleted``) carrying the task id, uuid, completion
+    status and updated_at. A consumer that falls behind by more than
+    EVENT_QUEUE_SIZE events receives a final ``overflow`` event and is
+    disconnected; it should then catch up through ``/changes``.
+
+    Args:
+        user_id: The user ID from the URL path
+        token_user_id: User ID from JWT token
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` of change events
+
+    Raises:
+        HTTPException: 401 if authentication fails
+        HTTPException: 403 if user_id doesn't match token
+    """
+    # Verify the user_id in URL matches the authenticated user
+    if user_id != token_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Cannot access other user's tasks",
+        )
+
+    subscription = broker.subscribe(user_id)
+    return StreamingResponse(
+        _sse_stream(subscription, get_settings().event_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
+    response_class=FastJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="Get a specific task",
 )
@@ -135,6 +475,7 @@ async def get_task(
     task_id: int,
     user_id: str,
     db: AsyncSession = Depends(get_db),
+    fields: Optional[str] = None,
     token_user_id: str = Depends(get_current_user_id),
 ):
     """Get a specific task by ID.
@@ -143,12 +484,14 @@ async def get_task(
         task_id: The ID of the task to retrieve
         user_id: The user ID from the URL path
         db: Database session
+        fields: Optional comma-separated list of task fields to return
         token_user_id: User ID from JWT token
 
     Returns:
-        TaskResponse: The task object
+        FastJSONResponse: TaskResponse-shaped body, narrowed to ``fields``
 
     Raises:
+        HTTPException: 400 if fields names an unknown field
         HTTPException: 401 if authentication fails
         HTTPException: 403 if user_id doesn't match token
         HTTPException: 404 if task not found
@@ -160,18 +503,18 @@ async def get_task(
             detail="Cannot access other user's tasks",
         )
 
+    columns = _task_columns(fields)
     result = await db.execute(
-        select(Task).where(Task.id == task_id, Task.user_id == user_id)
+        select(*columns).where(Task.id == task_id, Task.user_id == user_id)
     )
-    task = result.scalar_one_or_none()
-
-    if not task:
+    row = result.mappings().one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    return task
+    return await release_and_respond(db, dict(row))
 
 
 @router.put(
@@ -186,7 +529,6 @@ async def update_task(
     task_data: TaskUpdate,
     db: AsyncSession = Depends(get_db),
     token_user_id: str = Depends(get_current_user_id),
-    task: Task = Depends(verify_task_ownership),
 ):
     """Update a task's title, description, or completion status.
 
@@ -196,7 +538,6 @@ async def update_task(
         task_data: Task update data (title, description, completed)
         db: Database session
         token_user_id: User ID from JWT token
-        task: Task object (verified by verify_task_ownership)
 
     Returns:
         TaskResponse: The updated task
@@ -213,15 +554,31 @@ async def update_task(
             detail="Cannot update other user's tasks",
         )
 
-    # Update fields that are provided
-    update_data = task_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
+    values = task_data.model_dump(exclude_unset=True)
+    values["updated_at"] = datetime.utcnow()
+    values["change_seq"] = await next_change_seq(db, user_id)
 
-    task.updated_at = datetime.utcnow()
+    task, completed_delta = None, 0
+    if "completed" in values:
+        # Only matches if the completion status actually flips, so the
+        # counters move exactly once however many updates race
+        task = await _update_owned_task(
+            db, task_id, user_id, values, Task.completed != values["completed"]
+        )
+        if task is not None:
+            completed_delta = 1 if task.completed else -1
+    if task is None:
+        task = await _update_owned_task(db, task_id, user_id, values)
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
 
+    if completed_delta:
+        await record_task_change(db, user_id, completed_delta=completed_delta)
     await db.commit()
-    await db.refresh(task)
+    await broker.publish(user_id, task_event("updated", task))
 
     return task
 
@@ -236,7 +593,6 @@ async def delete_task(
     user_id: str,
     db: AsyncSession = Depends(get_db),
     token_user_id: str = Depends(get_current_user_id),
-    task: Task = Depends(verify_task_ownership),
 ):
     """Delete a task.
 
@@ -245,7 +601,6 @@ async def delete_task(
         user_id: The user ID from the URL path
         db: Database session
         token_user_id: User ID from JWT token
-        task: Task object (verified by verify_task_ownership)
 
     Returns:
         None (204 No Content)
@@ -262,8 +617,35 @@ async def delete_task(
             detail="Cannot delete other user's tasks",
         )
 
-    await db.delete(task)
+    change_seq = await next_change_seq(db, user_id)
+    # Of two concurrent deletes only one gets the row back, so the
+    # counters are decremented once
+    result = await db.execute(
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .returning(Task.id, Task.uuid, Task.completed, Task.updated_at)
+    )
+    task = result.one_or_none()
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+
+    # Record the deletion for delta sync in the same transaction
+    await prune_tombstones(
+        db, user_id, get_settings().sync_tombstone_retention_days
+    )
+    db.add(
+        TaskTombstone(
+            task_id=task.id, uuid=task.uuid, user_id=user_id, change_seq=change_seq
+        )
+    )
+    await record_task_change(
+        db, user_id, total_delta=-1, completed_delta=-1 if task.completed else 0
+    )
     await db.commit()
+    await broker.publish(user_id, task_event("deleted", task))
 
 
 @router.patch(
@@ -277,7 +659,6 @@ async def toggle_task_complete(
     user_id: str,
     db: AsyncSession = Depends(get_db),
     token_user_id: str = Depends(get_current_user_id),
-    task: Task = Depends(verify_task_ownership),
 ):
     """Toggle the completion status of a task.
 
@@ -286,7 +667,6 @@ async def toggle_task_complete(
         user_id: The user ID from the URL path
         db: Database session
         token_user_id: User ID from JWT token
-        task: Task object (verified by verify_task_ownership)
 
     Returns:
         TaskCompleteResponse: Updated task with new completion status
@@ -303,11 +683,23 @@ async def toggle_task_complete(
             detail="Cannot modify other user's tasks",
         )
 
-    task.completed = not task.completed
-    task.updated_at = datetime.utcnow()
+    # Flipped in the database, so concurrent toggles each see the other's
+    # result instead of both completing the same task
+    values = {
+        "completed": ~Task.completed,
+        "updated_at": datetime.utcnow(),
+        "change_seq": await next_change_seq(db, user_id),
+    }
+    task = await _update_owned_task(db, task_id, user_id, values)
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
 
+    await record_task_change(db, user_id, completed_delta=1 if task.completed else -1)
     await db.commit()
-    await db.refresh(task)
+    await broker.publish(user_id, task_event("completed", task))
 
     return TaskCompleteResponse(
         id=task.id,
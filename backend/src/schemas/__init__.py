@@ -1,7 +1,18 @@
 """Pydantic schemas for request/response validation."""
 
 from .auth import TokenPayload, TokenResponse
-from .task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, TaskCompleteResponse
+from .task import (
+    TaskCreate,
+    TaskUpdate,
+    TaskResponse,
+    TaskListResponse,
+    TaskCompleteResponse,
+    TaskTombstoneResponse,
+    TaskChangesResponse,
+    TaskDailyCompletion,
+    TaskStatsResponse,
+    parse_task_fields,
+)
 
 __all__ = [
     "TokenPayload",
@@ -11,4 +22,9 @@ __all__ = [
     "TaskResponse",
     "TaskListResponse",
     "TaskCompleteResponse",
+    "TaskTombstoneResponse",
+    "TaskChangesResponse",
+    "TaskDailyCompletion",
+    "TaskStatsResponse",
+    "parse_task_fields",
 ]
@@ -1,6 +1,6 @@
 """Pydantic schemas for task operations."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -48,3 +48,63 @@ class TaskCompleteResponse(BaseModel):
     id: int
     uuid: str
     completed: bool
+
+
+class TaskTombstoneResponse(BaseModel):
+    """Schema for a deleted task in a delta sync response."""
+
+    task_id: int
+    uuid: str
+    deleted_at: datetime
+
+
+class TaskDailyCompletion(BaseModel):
+    """Schema for one day of the completion trend (completion events)."""
+
+    day: date
+    completed: int
+
+
+class TaskStatsResponse(BaseModel):
+    """Schema for task summary statistics response."""
+
+    total: int
+    open: int
+    done: int
+    daily: list[TaskDailyCompletion]
+
+
+class TaskChangesResponse(BaseModel):
+    """Schema for delta sync response."""
+
+    tasks: list[TaskResponse]
+    deleted: list[TaskTombstoneResponse]
+    next_token: str
+    has_more: bool
+
+
+def parse_task_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """Parse a sparse fieldset such as ``"id,title,completed"``.
+
+    Args:
+        fields: Comma-separated TaskResponse field names, or None for all
+
+    Returns:
+        tuple[str, ...]: Requested field names in TaskResponse order
+
+    Raises:
+        ValueError: If the fieldset is empty or names an unknown field
+    """
+    all_fields = tuple(TaskResponse.model_fields)
+    if fields is None:
+        return all_fields
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise ValueError("At least one field must be requested")
+
+    unknown = requested.difference(all_fields)
+    if unknown:
+        raise ValueError(f"Unknown task fields: {', '.join(sorted(unknown))}")
+
+    return tuple(name for name in all_fields if name in requested)
@@ -1,5 +1,16 @@
 """Utility modules for the Todo application."""
 
 from .jwt import decode_jwt, create_jwt
+from .serialization import FastJSONResponse, dumps, release_and_respond
+from .sync import SyncCursor, decode_sync_token, encode_sync_token
 
-__all__ = ["decode_jwt", "create_jwt"]
+__all__ = [
+    "decode_jwt",
+    "create_jwt",
+    "FastJSONResponse",
+    "dumps",
+    "release_and_respond",
+    "SyncCursor",
+    "decode_sync_token",
+    "encode_sync_token",
+]
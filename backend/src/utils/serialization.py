@@ -0,0 +1,71 @@
+"""Fast JSON serialization helpers for task responses.
+
+Rows loaded from the database are already trusted, so list endpoints can
+skip per-object Pydantic validation and encode plain dicts straight to
+JSON bytes. orjson is used when installed; otherwise the standard library
+encoder is used with the same output format.
+"""
+
+import json
+from datetime import date
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.monitoring.tracing import span
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode values the standard library encoder does not understand."""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to compact JSON bytes.
+
+    Args:
+        content: JSON-compatible data (dates and datetimes are encoded as ISO 8601)
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson when it is available."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes."""
+        with span("encode"):
+            return dumps(content)
+
+
+async def release_and_respond(db: AsyncSession, content: Any) -> FastJSONResponse:
+    """Close the request's session, then encode ``content`` as the response.
+
+    get_db only closes the session once the response has been sent, so read
+    endpoints that have already fetched everything they need respond through
+    this to hand their pool connection back before encoding.
+
+    Args:
+        db: The request's database session
+        content: JSON-compatible response body
+
+    Returns:
+        FastJSONResponse: The rendered response
+    """
+    await db.close()
+    return FastJSONResponse(content)
@@ -0,0 +1,143 @@
+"""Incrementally maintained per-user task statistics.
+
+Task mutations call record_task_change() inside their own transaction, so
+the counters in ``task_stats`` and the per-day buckets in
+``task_daily_stats`` commit (or roll back) together with the change they
+describe. Reading statistics is then O(1) in the number of tasks.
+
+The daily buckets count completion events, not tasks that are still
+complete: un-completing or deleting a task leaves the day it was completed
+unchanged, and completing it again counts again on the new day.
+
+A user's counter row is created on their first mutation. Until then,
+reads count the task table directly and write nothing.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import dialect_insert
+from src.models.stats import TaskDailyStats, TaskStats
+from src.models.task import Task
+
+
+async def _count_tasks(db: AsyncSession, user_id: str) -> tuple[int, int]:
+    """Count a user's tasks and completed tasks from the task table."""
+    counts = select(
+        func.count(),
+        func.coalesce(func.sum(case((Task.completed, 1), else_=0)), 0),
+    ).where(Task.user_id == user_id)
+    total, completed = (await db.execute(counts)).one()
+    return total, completed
+
+
+async def _seed_stats(db: AsyncSession, user_id: str) -> bool:
+    """Create a user's counters from the task table (one-time backfill).
+
+    Returns:
+        bool: False if another transaction created the row first
+    """
+    total, completed = await _count_tasks(db, user_id)
+
+    statement = (
+        dialect_insert(db, TaskStats)
+        .values(user_id=user_id, total=total, completed=completed)
+        .on_conflict_do_nothing(index_elements=["user_id"])
+    )
+    result = await db.execute(statement)
+    return result.rowcount == 1
+
+
+async def record_task_change(
+    db: AsyncSession,
+    user_id: str,
+    total_delta: int = 0,
+    completed_delta: int = 0,
+) -> None:
+    """Apply a task mutation to the user's aggregates.
+
+    Must be called after the mutation has been added to ``db`` and before
+    the transaction commits. Take the deltas from the statement that made
+    the change (e.g. the row an ``UPDATE ... RETURNING`` matched), not from
+    an earlier read, or concurrent requests will count the same change twice.
+
+    Args:
+        db: Session holding the mutation
+        user_id: Owner of the changed task
+        total_delta: Change in number of tasks (+1 create, -1 delete)
+        completed_delta: Change in number of completed tasks
+    """
+    # Seeding counts the task table, so pending changes must be visible
+    await db.flush()
+
+    statement = (
+        update(TaskStats)
+        .where(TaskStats.user_id == user_id)
+        .values(
+            total=TaskStats.total + total_delta,
+            completed=TaskStats.completed + completed_delta,
+        )
+    )
+    result = await db.execute(statement)
+    if result.rowcount == 0 and not await _seed_stats(db, user_id):
+        # Lost a race to create the row; apply the delta to the winner's row
+        await db.execute(statement)
+
+    # Daily buckets record completion events; un-completing does not undo one
+    if completed_delta > 0:
+        bucket = dialect_insert(db, TaskDailyStats).values(
+            user_id=user_id,
+            day=datetime.utcnow().date(),
+            completed=completed_delta,
+        )
+        bucket = bucket.on_conflict_do_update(
+            index_elements=["user_id", "day"],
+            set_={"completed": TaskDailyStats.completed + completed_delta},
+        )
+        await db.execute(bucket)
+
+
+async def get_task_stats(
+    db: AsyncSession, user_id: str, days: int = 30
+) -> dict[str, Any]:
+    """Read a user's task statistics from the maintained aggregates.
+
+    Read-only: a user without a counter row yet is counted from the task
+    table, and the row is created by their next mutation.
+
+    Args:
+        db: Database session
+        user_id: User to read statistics for
+        days: Number of daily buckets to return, ending today (UTC)
+
+    Returns:
+        dict[str, Any]: TaskStatsResponse-shaped mapping
+    """
+    row = await db.get(TaskStats, user_id)
+    if row is None:
+        total, completed = await _count_tasks(db, user_id)
+    else:
+        total, completed = row.total, row.completed
+
+    today = datetime.utcnow().date()
+    first_day = today - timedelta(days=days - 1)
+    result = await db.execute(
+        select(TaskDailyStats.day, TaskDailyStats.completed).where(
+            TaskDailyStats.user_id == user_id,
+            TaskDailyStats.day >= first_day,
+        )
+    )
+    buckets: dict[date, int] = dict(result.tuples().all())
+
+    return {
+        "total": total,
+        "open": total - completed,
+        "done": completed,
+        "daily": [
+            {"day": day, "completed": buckets.get(day, 0)}
+            for day in (first_day + timedelta(days=i) for i in range(days))
+        ],
+    }
@@ -0,0 +1,144 @@
+"""Change sequencing and opaque cursor tokens for task delta sync.
+
+Every task mutation takes the next number from the user's TaskSyncState
+counter and stamps it on the changed task or on the deletion tombstone.
+The counter row stays locked until the mutation commits, so sequence
+numbers become visible in order and "changes after N" never misses a
+transaction that committed late (timestamps taken from the app clock
+cannot promise that).
+
+Tombstones are kept for SYNC_TOMBSTONE_RETENTION_DAYS; a cursor older
+than the newest pruned tombstone can no longer be served and the client
+must run a full sync.
+"""
+
+import base64
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import dialect_insert
+from src.models.task import TaskSyncState, TaskTombstone
+
+
+class SyncCursor(NamedTuple):
+    """Position in a user's change stream.
+
+    Attributes:
+        change_seq: change_seq of the last task seen (0 before any task)
+        task_id: ID of the last task seen, breaking change_seq ties
+        tombstone_seq: change_seq of the last deletion covered
+    """
+
+    change_seq: int
+    task_id: int
+    tombstone_seq: int
+
+
+def encode_sync_token(cursor: SyncCursor) -> str:
+    """Encode a cursor as an opaque URL-safe token.
+
+    Args:
+        cursor: Cursor to encode
+
+    Returns:
+        str: Token to pass back as ``?since=``
+    """
+    raw = f"{cursor.change_seq}|{cursor.task_id}|{cursor.tombstone_seq}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> SyncCursor:
+    """Decode a token produced by encode_sync_token.
+
+    Args:
+        token: Token from the ``since`` query parameter
+
+    Returns:
+        SyncCursor: The decoded cursor
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+        change_seq, task_id, tombstone_seq = raw.split("|")
+        return SyncCursor(int(change_seq), int(task_id), int(tombstone_seq))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid sync token") from e
+
+
+async def next_change_seq(db: AsyncSession, user_id: str) -> int:
+    """Allocate the next change sequence number for a user.
+
+    Call once per mutation, inside its transaction. Concurrent mutations
+    of the same user wait here until this transaction ends.
+
+    Args:
+        db: Session holding the mutation
+        user_id: Owner of the changed task
+
+    Returns:
+        int: Sequence number to stamp on the task or tombstone
+    """
+    statement = (
+        dialect_insert(db, TaskSyncState)
+        .values(user_id=user_id, change_seq=1)
+        .on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"change_seq": TaskSyncState.change_seq + 1},
+        )
+        .returning(TaskSyncState.change_seq)
+    )
+    return (await db.execute(statement)).scalar_one()
+
+
+async def get_sync_state(db: AsyncSession, user_id: str) -> tuple[int, int]:
+    """Read a user's latest change and pruned-tombstone sequence numbers.
+
+    Args:
+        db: Database session
+        user_id: User to read
+
+    Returns:
+        tuple[int, int]: (change_seq, pruned_seq), zeros for a new user
+    """
+    row = (
+        await db.execute(
+            select(TaskSyncState.change_seq, TaskSyncState.pruned_seq).where(
+                TaskSyncState.user_id == user_id
+            )
+        )
+    ).one_or_none()
+    return (row.change_seq, row.pruned_seq) if row else (0, 0)
+
+
+async def prune_tombstones(db: AsyncSession, user_id: str, retention_days: int) -> None:
+    """Delete a user's tombstones older than the retention period.
+
+    Runs in the caller's transaction (a delete, which is already writing
+    the user's tombstones) and records the newest pruned sequence number
+    so that older cursors are told to resync.
+
+    Args:
+        db: Session holding the mutation
+        user_id: User whose tombstones to prune
+        retention_days: Age in days after which tombstones are dropped
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    pruned = await db.execute(
+        delete(TaskTombstone)
+        .where(TaskTombstone.user_id == user_id, TaskTombstone.deleted_at < cutoff)
+        .returning(TaskTombstone.change_seq)
+    )
+    newest = max(pruned.scalars(), default=None)
+    if newest is None:
+        return
+    await db.execute(
+        update(TaskSyncState)
+        .where(TaskSyncState.user_id == user_id, TaskSyncState.pruned_seq < newest)
+        .values(pruned_seq=newest)
+    )
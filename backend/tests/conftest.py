@@ -1,11 +1,15 @@
 """Pytest fixtures for testing the Todo backend application."""
 
+from collections import Counter
+
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event
 
+from src.database import AsyncSessionLocal, get_engine
 from src.main import app
-from src.database import get_db, AsyncSessionLocal
+from src.monitoring.context import request_scope
+from src.monitoring.sql import add_statement_observer, remove_statement_observer
 from src.utils.jwt import create_jwt
 
 
@@ -113,3 +117,53 @@ async def setup_database():
     from src.database import init_db
 
     await init_db()
+
+
+class QueryCounter:
+    """Counts SQL statements and round trips per route name.
+
+    Attributes:
+        statements: Statements executed, keyed by route name
+        round_trips: Statements plus BEGIN/COMMIT/ROLLBACK, keyed by route name
+    """
+
+    def __init__(self):
+        self.statements = Counter()
+        self.round_trips = Counter()
+
+    def reset(self):
+        self.statements.clear()
+        self.round_trips.clear()
+
+    def _route(self):
+        scope = request_scope.get()
+        route = scope.get("route") if scope else None
+        return getattr(route, "name", None)
+
+    def observe_statement(self, conn, statement, parameters, duration):
+        route = self._route()
+        self.statements[route] += 1
+        self.round_trips[route] += 1
+
+    def observe_transaction(self, conn):
+        self.round_trips[self._route()] += 1
+
+
+@pytest.fixture
+def query_counter():
+    """Fixture counting database work per route through engine events.
+
+    Yields:
+        QueryCounter: Counts for requests made while the fixture is active
+    """
+    counter = QueryCounter()
+    sync_engine = get_engine().sync_engine
+    add_statement_observer(counter.observe_statement)
+    for name in ("begin", "commit", "rollback"):
+        event.listen(sync_engine, name, counter.observe_transaction)
+    try:
+        yield counter
+    finally:
+        remove_statement_observer(counter.observe_statement)
+        for name in ("begin", "commit", "rollback"):
+            event.remove(sync_engine, name, counter.observe_transaction)
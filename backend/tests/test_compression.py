@@ -0,0 +1,173 @@
+"""Test cases for the response compression middleware."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.middleware.compression import (
+    Codec,
+    CompressionMiddleware,
+    parse_accept_encoding,
+)
+
+LARGE_BODY = {"tasks": [{"id": i, "title": f"Task {i}"} for i in range(200)]}
+
+
+def build_app(**options) -> FastAPI:
+    """Build a tiny app wrapped in the compression middleware."""
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(LARGE_BODY, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/large-other")
+    async def large_other():
+        body = {"tasks": [{"id": i, "title": f"Other {i}"} for i in range(200)]}
+        return JSONResponse(body, headers={"ETag": '"v1"'})
+
+    @app.get("/events")
+    async def events():
+        async def stream():
+            for i in range(50):
+                yield f"data: {{\"seq\": {i}}}\n\n".encode()
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    @app.get("/export")
+    async def export():
+        async def rows():
+            for i in range(50):
+                yield f'{{"id": {i}}}\n'.encode()
+
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, **options)
+    return app
+
+
+@pytest.fixture
+async def client():
+    """Async client for the compression test app."""
+    transport = ASGITransport(app=build_app(minimum_size=500))
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def test_parse_accept_encoding():
+    """Test q-value parsing of the Accept-Encoding header."""
+    assert parse_accept_encoding("gzip, br;q=0.5, zstd;q=0") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "zstd": 0.0,
+    }
+
+
+def test_negotiate_respects_client_preference():
+    """Test that q=0 codings are never picked and gzip is always available."""
+    middleware = CompressionMiddleware(app=None)
+
+    assert middleware.negotiate("gzip").name == "gzip"
+    assert middleware.negotiate("identity") is None
+    assert middleware.negotiate("*;q=0") is None
+    assert middleware.negotiate("br;q=0, zstd;q=0, gzip").name == "gzip"
+
+
+def test_compressed_bodies_are_reused():
+    """Test that an unchanged body is served from the compression cache."""
+    middleware = CompressionMiddleware(app=None)
+    codec = Codec("gzip", 6)
+
+    first = middleware.compress_cached(codec, b"x" * 1000)
+    second = middleware.compress_cached(codec, b"x" * 1000)
+
+    assert first is second
+    assert gzip.decompress(first) == b"x" * 1000
+
+
+def test_different_bodies_are_compressed_separately():
+    """Test that bodies are never confused, whatever ETag they were sent with."""
+    middleware = CompressionMiddleware(app=None)
+    codec = Codec("gzip", 6)
+
+    first = middleware.compress_cached(codec, b"x" * 1000)
+    second = middleware.compress_cached(codec, b"y" * 1000)
+
+    assert gzip.decompress(first) == b"x" * 1000
+    assert gzip.decompress(second) == b"y" * 1000
+
+
+def test_cache_is_bounded_by_total_bytes():
+    """Test that least recently used bodies are evicted past the byte budget."""
+    codec = Codec("gzip", 6)
+    bodies = [bytes(range(256)) * 8 + bytes([i]) for i in range(10)]
+    entry_size = len(codec.compress(bodies[0]))
+    middleware = CompressionMiddleware(app=None, cache_bytes=3 * entry_size)
+
+    for body in bodies:
+        middleware.compress_cached(codec, body)
+
+    assert len(middleware._cache) <= 3
+    assert middleware._cached_bytes <= middleware.cache_bytes
+
+
+@pytest.mark.asyncio
+class TestCompressionMiddleware:
+    """Test suite for negotiated response compression."""
+
+    async def test_gzip_large_response(self, client):
+        """Test that large JSON bodies are gzip-compressed."""
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.json() == LARGE_BODY
+
+    async def test_small_response_not_compressed(self, client):
+        """Test that bodies under the threshold are sent as-is."""
+        response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    async def test_identity_when_not_accepted(self, client):
+        """Test that nothing is compressed without a matching Accept-Encoding."""
+        response = await client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE_BODY
+
+    async def test_streaming_response_compressed(self, client):
+        """Test that streaming exports are compressed chunk by chunk."""
+        response = await client.get("/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        lines = response.text.strip().split("\n")
+        assert len(lines) == 50
+
+    async def test_same_etag_different_resource(self, client):
+        """Test that two resources sharing an ETag get their own bodies."""
+        headers = {"Accept-Encoding": "gzip"}
+        first = await client.get("/large", headers=headers)
+        second = await client.get("/large-other", headers=headers)
+
+        assert first.json() == LARGE_BODY
+        assert second.json()["tasks"][0]["title"] == "Other 0"
+
+    async def test_event_stream_not_compressed(self, client):
+        """Test that Server-Sent Events pass through uncompressed."""
+        response = await client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text.count("data:") == 50
@@ -0,0 +1,54 @@
+"""Test cases for database session management."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import get_db, get_engine
+from src.utils.serialization import FastJSONResponse
+
+
+@pytest.mark.asyncio
+class TestGetDb:
+    """Test suite for the get_db dependency."""
+
+    async def test_session_holds_no_connection_until_used(self):
+        """Test that a session is yielded without checking out a connection."""
+        dependency = get_db()
+        session = await anext(dependency)
+
+        assert isinstance(session, AsyncSession)
+        assert not session.in_transaction()
+
+        assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+        assert session.in_transaction()
+
+        await dependency.aclose()
+        assert not session.in_transaction()
+
+    async def test_read_endpoints_release_connection_before_encoding(
+        self, async_client, auth_headers, test_user_id, monkeypatch
+    ):
+        """Test that the pool connection is returned before the body is encoded."""
+        base = f"/api/{test_user_id}/tasks"
+        created = await async_client.post(
+            base, json={"title": "Pooled"}, headers=auth_headers
+        )
+        checked_out = []
+        render = FastJSONResponse.render
+
+        def record_pool(self, content):
+            checked_out.append(get_engine().pool.checkedout())
+            return render(self, content)
+
+        monkeypatch.setattr(FastJSONResponse, "render", record_pool)
+        for url in (
+            base,
+            f"{base}/{created.json()['id']}",
+            f"{base}/changes",
+            f"{base}/stats",
+        ):
+            response = await async_client.get(url, headers=auth_headers)
+            assert response.status_code == 200
+
+        assert checked_out == [0, 0, 0, 0]
@@ -0,0 +1,169 @@
+"""Test cases for task change events."""
+
+import asyncio
+
+import pytest
+
+from src.events.broker import OVERFLOW, ChangeBroker, broker
+
+
+@pytest.mark.asyncio
+class TestChangeBroker:
+    """Test suite for the in-process change broker."""
+
+    async def test_fan_out_to_user_subscribers(self):
+        """Test that events reach every subscriber of the same user only."""
+        changes = ChangeBroker(queue_size=10)
+        first = changes.subscribe("alice")
+        second = changes.subscribe("alice")
+        other = changes.subscribe("bob")
+
+        await changes.publish("alice", {"type": "created", "id": 1})
+
+        assert (await first.get(timeout=1))["id"] == 1
+        assert (await second.get(timeout=1))["id"] == 1
+        assert await other.get(timeout=0.01) is None
+
+    async def test_slow_consumer_is_dropped(self):
+        """Test that a full queue drops the subscriber with an overflow marker."""
+        changes = ChangeBroker(queue_size=2)
+        slow = changes.subscribe("alice")
+
+        for i in range(3):
+            await changes.publish("alice", {"type": "updated", "id": i})
+
+        assert slow.overflowed is True
+        assert changes.subscriber_count("alice") == 0
+        assert await slow.get(timeout=1) is OVERFLOW
+        assert await slow.get(timeout=0.01) is None
+
+    async def test_mutations_publish_events(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that task endpoints publish change events after commit."""
+        subscription = broker.subscribe(test_user_id)
+        try:
+            response = await async_client.post(
+                f"/api/{test_user_id}/tasks",
+                json={"title": "Event Task"},
+                headers=auth_headers,
+            )
+            task_id = response.json()["id"]
+            await async_client.patch(
+                f"/api/{test_user_id}/tasks/{task_id}/complete",
+                headers=auth_headers,
+            )
+
+            created = await subscription.get(timeout=1)
+            completed = await subscription.get(timeout=1)
+        finally:
+            broker.unsubscribe(subscription)
+
+        assert created["type"] == "created"
+        assert created["id"] == task_id
+        assert completed["type"] == "completed"
+        assert completed["completed"] is True
+
+    async def test_publish_failure_is_not_raised(self):
+        """Test that a failing transport is logged and events stay local."""
+
+        class BrokenTransport:
+            async def start(self, deliver, lost):
+                pass
+
+            async def publish(self, user_id, event):
+                raise ConnectionError("connection lost")
+
+            async def stop(self):
+                pass
+
+        changes = ChangeBroker(queue_size=10)
+        await changes.start(BrokenTransport())
+        subscription = changes.subscribe("alice")
+
+        await changes.publish("alice", {"type": "created", "id": 1})
+
+        assert (await subscription.get(timeout=1))["id"] == 1
+
+    async def test_resync_all_drops_every_subscriber(self):
+        """Test that a lost transport sends every subscriber an overflow marker."""
+        changes = ChangeBroker(queue_size=10)
+        first = changes.subscribe("alice")
+        second = changes.subscribe("bob")
+        await changes.publish("alice", {"type": "created", "id": 1})
+
+        changes.resync_all()
+
+        assert await first.get(timeout=1) is OVERFLOW
+        assert await second.get(timeout=1) is OVERFLOW
+        assert changes.subscriber_count("alice") == 0
+        assert changes.subscriber_count("bob") == 0
+
+
+class FakeConnection:
+    """Minimal stand-in for an asyncpg connection."""
+
+    def __init__(self):
+        self.closed = False
+        self.on_terminate = None
+
+    def add_termination_listener(self, callback):
+        self.on_terminate = callback
+
+    async def add_listener(self, channel, callback):
+        pass
+
+    async def remove_listener(self, channel, callback):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    def drop(self):
+        """Simulate the server closing the connection."""
+        self.closed = True
+        self.on_terminate(self)
+
+
+@pytest.mark.asyncio
+class TestPostgresNotifyTransport:
+    """Test suite for LISTEN connection loss and reconnection."""
+
+    async def test_reconnects_with_backoff(self, monkeypatch):
+        """Test that a dropped connection is reported and re-established."""
+        from src.events import postgres
+
+        connections = []
+        attempts = 0
+
+        async def connect(dsn, ssl=None):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 2:
+                raise OSError("connection refused")
+            connections.append(FakeConnection())
+            return connections[-1]
+
+        monkeypatch.setattr(postgres.asyncpg, "connect", connect)
+        lost = []
+        transport = postgres.PostgresNotifyTransport(
+            "postgresql://db/test", min_backoff=0.01, max_backoff=0.02
+        )
+        await transport.start(lambda user_id, event: None, lambda: lost.append(1))
+
+        connections[0].drop()
+        with pytest.raises(ConnectionError):
+            await transport.publish("alice", {"type": "created"})
+        for _ in range(100):
+            if len(connections) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert attempts == 3
+        assert len(lost) == 2
+        assert transport._conn is connections[1]
+        await transport.stop()
+        assert connections[1].closed
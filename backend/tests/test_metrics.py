@@ -0,0 +1,80 @@
+"""Test cases for Prometheus metrics."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.monitoring import add_statement_observer, remove_statement_observer
+from src.monitoring.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test that histogram buckets are cumulative with +Inf, sum and count."""
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    )
+
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(("/a",), value)
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/a"} 4' in text
+    assert 'latency_seconds_sum{route="/a"} 6.05' in text
+
+
+def test_counter_escapes_label_values():
+    """Test that label values are escaped in the text format."""
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("events_total", "Events.", ("name",)))
+
+    counter.inc(('say "hi"',))
+
+    assert 'events_total{name="say \\"hi\\""} 1' in registry.render()
+
+
+@pytest.mark.asyncio
+class TestMetricsEndpoint:
+    """Test suite for the /metrics endpoint."""
+
+    async def test_metrics_endpoint(self, async_client, auth_headers, test_user_id):
+        """Test that requests, SQL and JWT timings show up by route template."""
+        await async_client.get(f"/api/{test_user_id}/tasks", headers=auth_headers)
+
+        response = await async_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert (
+            'http_requests_total{method="GET",route="/api/{user_id}/tasks",status="200"}'
+            in text
+        )
+        assert 'db_statement_duration_seconds_count{operation="SELECT"}' in text
+        assert 'jwt_verification_duration_seconds_count{result="valid"}' in text
+        assert "http_requests_in_progress" in text
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_does_not_skew_timing(db):
+    """Test that a statement that raises leaves no timing state behind."""
+    durations = []
+
+    def observe(conn, statement, parameters, duration):
+        durations.append((statement, duration))
+
+    add_statement_observer(observe)
+    try:
+        with pytest.raises(OperationalError):
+            await db.execute(text("SELECT * FROM no_such_table"))
+        await db.rollback()
+        await db.execute(text("SELECT 1"))
+    finally:
+        remove_statement_observer(observe)
+
+    assert [statement for statement, _ in durations] == ["SELECT 1"]
+    connection = await db.connection()
+    assert "statement_start" not in connection.sync_connection.info
@@ -0,0 +1,113 @@
+"""Test cases for the on-demand sampling profiler."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.config import get_settings
+from src.monitoring.profiler import SamplingProfiler, render_collapsed
+
+
+def busy_work(seconds: float) -> None:
+    """Spin the CPU so the sampler has something to see."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def test_collapsed_stacks_are_root_first():
+    """Test that samples fold into root-first stacks with counts."""
+    profiler = SamplingProfiler()
+    profiler.start(interval=0.001)
+    try:
+        busy_work(0.1)
+    finally:
+        samples = profiler.stop()
+
+    output = render_collapsed(samples)
+    assert output
+    for line in output.splitlines():
+        stack, _, count = line.rpartition(" ")
+        assert int(count) > 0
+    assert any(
+        stack.index("test_collapsed_stacks_are_root_first") < stack.index("busy_work")
+        for stack in samples
+        if "busy_work" in stack
+    )
+    assert not profiler.running
+
+
+@pytest.fixture
+def profiler_headers():
+    """Enable admin endpoints and the profiler for the duration of a test."""
+    settings = get_settings()
+    previous = settings.admin_token, settings.profiler_enabled
+    settings.admin_token = "test-admin-token"
+    settings.profiler_enabled = True
+    yield {"X-Admin-Token": "test-admin-token"}
+    settings.admin_token, settings.profiler_enabled = previous
+
+
+@pytest.mark.asyncio
+class TestProfileEndpoint:
+    """Test suite for /admin/profile."""
+
+    async def test_disabled_by_default(self, async_client):
+        """Test that the profiler is unavailable without configuration."""
+        settings = get_settings()
+        previous = settings.admin_token
+        settings.admin_token = "test-admin-token"
+        try:
+            response = await async_client.post(
+                "/admin/profile", headers={"X-Admin-Token": "test-admin-token"}
+            )
+        finally:
+            settings.admin_token = previous
+
+        assert response.status_code == 404
+
+    async def test_requires_admin_token(self, async_client, profiler_headers):
+        """Test that profiles cannot be taken without the admin token."""
+        response = await async_client.post("/admin/profile?seconds=0.1")
+
+        assert response.status_code == 401
+
+    async def test_profile_next_requests(
+        self, async_client, profiler_headers, auth_headers, test_user_id
+    ):
+        """Test that a request-bounded profile returns once they finish."""
+
+        async def traffic():
+            await asyncio.sleep(0.05)
+            for _ in range(3):
+                await async_client.get(
+                    f"/api/{test_user_id}/tasks", headers=auth_headers
+                )
+
+        started = time.perf_counter()
+        response, _ = await asyncio.gather(
+            async_client.post(
+                "/admin/profile?seconds=10&requests=3&interval_ms=1",
+                headers=profiler_headers,
+            ),
+            traffic(),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert time.perf_counter() - started < 5
+        assert response.text
+
+    async def test_one_profile_at_a_time(self, async_client, profiler_headers):
+        """Test that a concurrent profile request is rejected."""
+        first = asyncio.ensure_future(
+            async_client.post("/admin/profile?seconds=0.3", headers=profiler_headers)
+        )
+        await asyncio.sleep(0.05)
+        second = await async_client.post(
+            "/admin/profile?seconds=0.1", headers=profiler_headers
+        )
+
+        assert second.status_code == 409
+        assert (await first).status_code == 200
@@ -0,0 +1,89 @@
+"""SQL statement budgets for the task endpoints.
+
+Each request is made after a warm-up that creates the user's stats row,
+then the statements and round trips it issued are compared with the
+budget declared for its route in ``src/routers/tasks.py``.
+"""
+
+import pytest
+
+from src.routers.tasks import QUERY_BUDGETS, router
+
+
+def test_every_route_has_a_budget():
+    """Test that new endpoints cannot be added without declaring a budget."""
+    names = {route.name for route in router.routes}
+
+    assert names == set(QUERY_BUDGETS)
+
+
+@pytest.mark.asyncio
+class TestQueryBudgets:
+    """Test suite enforcing per-route query budgets."""
+
+    @pytest.fixture
+    async def task_url(self, async_client, auth_headers, test_user_id):
+        """Create a task (and the user's stats row) and return its URL."""
+        base = f"/api/{test_user_id}/tasks"
+        response = await async_client.post(
+            base, json={"title": "Budgeted"}, headers=auth_headers
+        )
+        return f"{base}/{response.json()['id']}"
+
+    async def request(self, async_client, query_counter, route, method, url, **kwargs):
+        """Make one request and assert it stayed within its route's budget."""
+        query_counter.reset()
+        response = await async_client.request(method, url, **kwargs)
+        assert response.status_code < 400
+
+        budget = QUERY_BUDGETS[route]
+        statements = query_counter.statements[route]
+        round_trips = query_counter.round_trips[route]
+        assert statements <= budget.statements, (
+            f"{route} ran {statements} statements (budget {budget.statements})"
+        )
+        assert round_trips <= budget.round_trips, (
+            f"{route} made {round_trips} round trips (budget {budget.round_trips})"
+        )
+
+    async def test_read_endpoints(
+        self, async_client, query_counter, auth_headers, test_user_id, task_url
+    ):
+        """Test list, get, changes and stats budgets."""
+        base = f"/api/{test_user_id}/tasks"
+        changes = await async_client.get(f"{base}/changes", headers=auth_headers)
+        token = changes.json()["next_token"]
+        for route, url in [
+            ("list_tasks", base),
+            ("get_task", task_url),
+            ("list_task_changes", f"{base}/changes"),
+            ("list_task_changes", f"{base}/changes?since={token}"),
+            ("task_stats", f"{base}/stats"),
+        ]:
+            await self.request(
+                async_client, query_counter, route, "GET", url, headers=auth_headers
+            )
+
+    async def test_write_endpoints(
+        self, async_client, query_counter, auth_headers, test_user_id, task_url
+    ):
+        """Test create, update, toggle and delete budgets."""
+        base = f"/api/{test_user_id}/tasks"
+        calls = [
+            ("create_task", "POST", base, {"title": "Another"}),
+            ("update_task", "PUT", task_url, {"title": "Renamed"}),
+            ("update_task", "PUT", task_url, {"completed": True}),
+            ("toggle_task_complete", "PATCH", f"{task_url}/complete", None),
+            ("toggle_task_complete", "PATCH", f"{task_url}/complete", None),
+            ("delete_task", "DELETE", task_url, None),
+        ]
+        for route, method, url, body in calls:
+            await self.request(
+                async_client,
+                query_counter,
+                route,
+                method,
+                url,
+                json=body,
+                headers=auth_headers,
+            )
@@ -0,0 +1,92 @@
+"""Test cases for the slow-query log and admin endpoint."""
+
+import asyncio
+
+import pytest
+
+from src.config import get_settings
+from src.database import get_engine
+from src.monitoring.slow_queries import SlowQueryLog, parameter_shape, slow_query_log
+from src.monitoring.sql import remove_statement_observer
+
+
+def test_parameter_shape_hides_values():
+    """Test that only parameter types are recorded."""
+    assert parameter_shape(("secret", 5, None)) == "(str, int, NoneType)"
+    assert parameter_shape({"user_id": "secret"}) == "{user_id: str}"
+    assert parameter_shape([(1,), (2,)]) == "2 x (int)"
+
+
+@pytest.fixture
+def admin_headers():
+    """Enable admin endpoints for the duration of a test."""
+    settings = get_settings()
+    previous = settings.admin_token
+    settings.admin_token = "test-admin-token"
+    yield {"X-Admin-Token": "test-admin-token"}
+    settings.admin_token = previous
+
+
+@pytest.mark.asyncio
+class TestSlowQueryLog:
+    """Test suite for slow statement capture."""
+
+    async def test_records_slow_statements_with_plan(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that slow statements carry route, user hash and an EXPLAIN plan."""
+        log = SlowQueryLog(
+            threshold_ms=0, size=5, explain=True, explain_sample_rate=1.0
+        )
+        log.attach(get_engine())
+        try:
+            await async_client.get(f"/api/{test_user_id}/tasks", headers=auth_headers)
+            await asyncio.sleep(0.2)
+        finally:
+            remove_statement_observer(log.observe)
+
+        selects = [e for e in log.entries if e["statement"].startswith("SELECT")]
+        assert selects
+        entry = selects[-1]
+        assert entry["route"] == "GET /api/{user_id}/tasks"
+        assert entry["user_hash"] and test_user_id not in entry["user_hash"]
+        assert test_user_id not in entry["parameter_shape"]
+        assert any(e["plan"] for e in selects)
+
+    async def test_ring_buffer_is_bounded(self):
+        """Test that only the newest entries are kept."""
+        log = SlowQueryLog(threshold_ms=0, size=2)
+
+        for i in range(5):
+            log.observe(None, f"SELECT {i}", (), 0.5)
+
+        assert [e["statement"] for e in log.entries] == ["SELECT 3", "SELECT 4"]
+
+    async def test_admin_endpoint_requires_token(self, async_client, admin_headers):
+        """Test that the admin endpoint rejects missing or wrong tokens."""
+        response = await async_client.get("/admin/slow-queries")
+        assert response.status_code == 401
+
+        response = await async_client.get(
+            "/admin/slow-queries", headers={"X-Admin-Token": "wrong"}
+        )
+        assert response.status_code == 401
+
+    async def test_admin_endpoint_lists_entries(self, async_client, admin_headers):
+        """Test that recorded entries are returned newest first."""
+        slow_query_log.clear()
+        slow_query_log.observe(None, "SELECT 1", (), 10.0)
+        slow_query_log.observe(None, "SELECT 2", (), 10.0)
+
+        response = await async_client.get("/admin/slow-queries", headers=admin_headers)
+
+        assert response.status_code == 200
+        statements = [e["statement"] for e in response.json()["entries"]]
+        assert statements == ["SELECT 2", "SELECT 1"]
+        slow_query_log.clear()
+
+    async def test_admin_disabled_without_token(self, async_client):
+        """Test that admin endpoints do not exist unless configured."""
+        response = await async_client.get("/admin/slow-queries")
+
+        assert response.status_code == 404
@@ -1,6 +1,13 @@
 """Test cases for task API endpoints."""
 
+import asyncio
+from datetime import datetime
+
 import pytest
+from sqlalchemy import case, func, select, update
+
+from src.models.stats import TaskStats
+from src.models.task import Task, TaskTombstone
 
 
 @pytest.mark.asyncio
@@ -40,7 +47,9 @@ class TestTaskEndpoints:
         assert data["description"] is None
         assert data["completed"] is False
 
-    async def test_create_task_empty_title(self, async_client, auth_headers, test_user_id):
+    async def test_create_task_empty_title(
+        self, async_client, auth_headers, test_user_id
+    ):
         """Test creating a task with empty title fails."""
         response = await async_client.post(
             f"/api/{test_user_id}/tasks",
@@ -138,7 +147,9 @@ class TestTaskEndpoints:
         assert data["completed"] is True
         assert data["description"] == "Original Description"  # Unchanged
 
-    async def test_update_task_not_found(self, async_client, auth_headers, test_user_id):
+    async def test_update_task_not_found(
+        self, async_client, auth_headers, test_user_id
+    ):
         """Test updating a non-existent task returns 404."""
         response = await async_client.put(
             f"/api/{test_user_id}/tasks/999999",
@@ -173,7 +184,9 @@ class TestTaskEndpoints:
         )
         assert get_response.status_code == 404
 
-    async def test_delete_task_not_found(self, async_client, auth_headers, test_user_id):
+    async def test_delete_task_not_found(
+        self, async_client, auth_headers, test_user_id
+    ):
         """Test deleting a non-existent task returns 404."""
         response = await async_client.delete(
             f"/api/{test_user_id}/tasks/999999",
@@ -182,7 +195,9 @@ class TestTaskEndpoints:
 
         assert response.status_code == 404
 
-    async def test_toggle_complete_success(self, async_client, auth_headers, test_user_id):
+    async def test_toggle_complete_success(
+        self, async_client, auth_headers, test_user_id
+    ):
         """Test toggling task completion status successfully."""
         # Create a task (defaults to incomplete)
         create_response = await async_client.post(
@@ -213,7 +228,9 @@ class TestTaskEndpoints:
         data = response.json()
         assert data["completed"] is False
 
-    async def test_toggle_complete_not_found(self, async_client, auth_headers, test_user_id):
+    async def test_toggle_complete_not_found(
+        self, async_client, auth_headers, test_user_id
+    ):
         """Test toggling completion on non-existent task returns 404."""
         response = await async_client.patch(
             f"/api/{test_user_id}/tasks/999999/complete",
@@ -222,7 +239,14 @@ class TestTaskEndpoints:
 
         assert response.status_code == 404
 
-    async def test_user_isolation_get(self, async_client, auth_headers, test_user_id, another_user_headers, another_user_id):
+    async def test_user_isolation_get(
+        self,
+        async_client,
+        auth_headers,
+        test_user_id,
+        another_user_headers,
+        another_user_id,
+    ):
         """Test user isolation - cannot access another user's task."""
         # Create task as user A
         create_response = await async_client.post(
@@ -240,7 +264,9 @@ class TestTaskEndpoints:
 
         assert response.status_code == 403  # or 404 depending on implementation
 
-    async def test_user_isolation_list(self, async_client, auth_headers, test_user_id, another_user_id):
+    async def test_user_isolation_list(
+        self, async_client, auth_headers, test_user_id, another_user_id
+    ):
         """Test user isolation - can only list own tasks."""
         response = await async_client.get(
             f"/api/{another_user_id}/tasks",
@@ -257,7 +283,9 @@ class TestTaskEndpoints:
 
         assert response.status_code == 403  # Missing credentials
 
-    async def test_invalid_auth_token(self, async_client, invalid_auth_headers, test_user_id):
+    async def test_invalid_auth_token(
+        self, async_client, invalid_auth_headers, test_user_id
+    ):
         """Test that requests with invalid token are rejected."""
         response = await async_client.get(
             f"/api/{test_user_id}/tasks",
@@ -297,6 +325,261 @@ class TestTaskEndpoints:
         data = response.json()
         assert len(data["tasks"]) == 2
 
+    async def test_list_tasks_sparse_fields(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that ?fields= narrows the returned task objects."""
+        await async_client.post(
+            f"/api/{test_user_id}/tasks",
+            json={"title": "Sparse Task", "description": "Not returned"},
+            headers=auth_headers,
+        )
+
+        response = await async_client.get(
+            f"/api/{test_user_id}/tasks?fields=id,title,completed",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] > 0
+        for task in data["tasks"]:
+            assert set(task) == {"id", "title", "completed"}
+
+    async def test_get_task_sparse_fields(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that ?fields= narrows a single task response."""
+        create_response = await async_client.post(
+            f"/api/{test_user_id}/tasks",
+            json={"title": "Sparse Get Task"},
+            headers=auth_headers,
+        )
+        task_id = create_response.json()["id"]
+
+        response = await async_client.get(
+            f"/api/{test_user_id}/tasks/{task_id}?fields=title",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"title": "Sparse Get Task"}
+
+    async def test_list_tasks_unknown_field(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that requesting an unknown field is rejected."""
+        response = await async_client.get(
+            f"/api/{test_user_id}/tasks?fields=id,secret",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    async def test_task_changes_delta_sync(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that delta sync returns only changes and deletion tombstones."""
+        base = f"/api/{test_user_id}/tasks"
+        kept = await async_client.post(
+            base, json={"title": "Kept"}, headers=auth_headers
+        )
+        doomed = await async_client.post(
+            base, json={"title": "Doomed"}, headers=auth_headers
+        )
+
+        # Full sync positions the token at the current end of the change log
+        response = await async_client.get(f"{base}/changes", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["deleted"] == []
+        token = data["next_token"]
+
+        # Nothing changed since the token
+        response = await async_client.get(
+            f"{base}/changes?since={token}", headers=auth_headers
+        )
+        assert response.json()["tasks"] == []
+        assert response.json()["deleted"] == []
+
+        # One update and one delete show up as a change and a tombstone
+        kept_id = kept.json()["id"]
+        doomed_id = doomed.json()["id"]
+        await async_client.put(
+            f"{base}/{kept_id}", json={"title": "Kept v2"}, headers=auth_headers
+        )
+        await async_client.delete(f"{base}/{doomed_id}", headers=auth_headers)
+
+        response = await async_client.get(
+            f"{base}/changes?since={token}", headers=auth_headers
+        )
+        data = response.json()
+        assert [task["id"] for task in data["tasks"]] == [kept_id]
+        assert data["tasks"][0]["title"] == "Kept v2"
+        assert [tombstone["task_id"] for tombstone in data["deleted"]] == [doomed_id]
+        assert data["has_more"] is False
+
+    async def test_task_changes_invalid_token(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that a malformed sync token is rejected."""
+        response = await async_client.get(
+            f"/api/{test_user_id}/tasks/changes?since=not-a-token",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    async def test_task_changes_follow_commit_sequence(
+        self, async_client, auth_headers, test_user_id, db
+    ):
+        """Test that delta sync orders changes by sequence, not by timestamp."""
+        base = f"/api/{test_user_id}/tasks"
+        changes = await async_client.get(f"{base}/changes", headers=auth_headers)
+        token = changes.json()["next_token"]
+        created = await async_client.post(
+            base, json={"title": "Backdated"}, headers=auth_headers
+        )
+        task_id = created.json()["id"]
+
+        # A timestamp behind the cursor (clock skew, late commit) is still seen
+        await db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(updated_at=datetime(2000, 1, 1))
+        )
+        await db.commit()
+
+        response = await async_client.get(
+            f"{base}/changes?since={token}", headers=auth_headers
+        )
+        assert [task["id"] for task in response.json()["tasks"]] == [task_id]
+
+    async def test_task_changes_expired_token(
+        self, async_client, auth_headers, test_user_id, db
+    ):
+        """Test that a token older than the retained tombstones must resync."""
+        base = f"/api/{test_user_id}/tasks"
+        first = await async_client.post(
+            base, json={"title": "Old"}, headers=auth_headers
+        )
+        second = await async_client.post(
+            base, json={"title": "New"}, headers=auth_headers
+        )
+        changes = await async_client.get(f"{base}/changes", headers=auth_headers)
+        token = changes.json()["next_token"]
+        await async_client.delete(
+            f"{base}/{first.json()['id']}", headers=auth_headers
+        )
+
+        # Age the tombstone past retention; the next delete prunes it
+        await db.execute(
+            update(TaskTombstone)
+            .where(TaskTombstone.task_id == first.json()["id"])
+            .values(deleted_at=datetime(2000, 1, 1))
+        )
+        await db.commit()
+        await async_client.delete(
+            f"{base}/{second.json()['id']}", headers=auth_headers
+        )
+
+        response = await async_client.get(
+            f"{base}/changes?since={token}", headers=auth_headers
+        )
+        assert response.status_code == 410
+
+        # A full sync hands out a fresh token that works again
+        fresh = (await async_client.get(f"{base}/changes", headers=auth_headers)).json()
+        response = await async_client.get(
+            f"{base}/changes?since={fresh['next_token']}", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+    async def test_task_stats_tracks_mutations(
+        self, async_client, another_user_headers, another_user_id
+    ):
+        """Test that stats counters follow creates, toggles and deletes."""
+        base = f"/api/{another_user_id}/tasks"
+        before = (
+            await async_client.get(f"{base}/stats", headers=another_user_headers)
+        ).json()
+
+        first = await async_client.post(
+            base, json={"title": "Stats A"}, headers=another_user_headers
+        )
+        second = await async_client.post(
+            base, json={"title": "Stats B"}, headers=another_user_headers
+        )
+        await async_client.patch(
+            f"{base}/{first.json()['id']}/complete", headers=another_user_headers
+        )
+        await async_client.delete(
+            f"{base}/{second.json()['id']}", headers=another_user_headers
+        )
+
+        response = await async_client.get(
+            f"{base}/stats?days=7", headers=another_user_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == before["total"] + 1
+        assert data["done"] == before["done"] + 1
+        assert data["open"] == data["total"] - data["done"]
+        assert len(data["daily"]) == 7
+        assert data["daily"][-1]["completed"] == before["daily"][-1]["completed"] + 1
+
+        # Daily buckets count completion events, so un-completing keeps them
+        await async_client.patch(
+            f"{base}/{first.json()['id']}/complete", headers=another_user_headers
+        )
+        after = (
+            await async_client.get(f"{base}/stats?days=7", headers=another_user_headers)
+        ).json()
+        assert after["done"] == before["done"]
+        assert after["daily"] == data["daily"]
+
+    async def test_task_stats_survive_concurrent_mutations(
+        self, async_client, db, another_user_headers, another_user_id
+    ):
+        """Test that racing toggles and deletes keep stats equal to the tasks."""
+        base = f"/api/{another_user_id}/tasks"
+        ids = []
+        for i in range(4):
+            response = await async_client.post(
+                base, json={"title": f"Race {i}"}, headers=another_user_headers
+            )
+            ids.append(response.json()["id"])
+
+        toggles = [
+            async_client.patch(
+                f"{base}/{task_id}/complete", headers=another_user_headers
+            )
+            for task_id in ids[:2]
+            for _ in range(3)
+        ]
+        deletes = [
+            async_client.delete(f"{base}/{task_id}", headers=another_user_headers)
+            for task_id in ids[2:]
+            for _ in range(2)
+        ]
+        responses = await asyncio.gather(*toggles, *deletes)
+
+        assert sorted(r.status_code for r in responses[len(toggles):]) == [
+            204,
+            204,
+            404,
+            404,
+        ]
+        counts = select(func.count(), func.sum(case((Task.completed, 1), else_=0)))
+        total, completed = (
+            await db.execute(counts.where(Task.user_id == another_user_id))
+        ).one()
+        stats = await db.get(TaskStats, another_user_id)
+        assert (stats.total, stats.completed) == (total, completed)
+        # Each task was toggled an odd number of times
+        assert completed == 2
+
     async def test_health_check(self, async_client):
         """Test health check endpoint."""
         response = await async_client.get("/health")
@@ -0,0 +1,117 @@
+"""Test cases for Server-Timing headers and sampled request traces."""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.main import app
+from src.monitoring.tracing import (
+    RequestTrace,
+    TraceExporter,
+    TracingMiddleware,
+    add_span,
+    current_trace,
+)
+
+
+def parse_server_timing(header: str) -> dict[str, str]:
+    """Map metric name to its parameters in a Server-Timing header."""
+    metrics = {}
+    for entry in header.split(","):
+        name, _, params = entry.strip().partition(";")
+        metrics[name] = params
+    return metrics
+
+
+def test_server_timing_sums_repeated_spans():
+    """Test that repeated spans are summed and counted."""
+    trace = RequestTrace(sampled=False)
+    trace.add("sql", 0.002)
+    trace.add("sql", 0.003)
+    trace.add("jwt", 0.001)
+
+    metrics = parse_server_timing(trace.server_timing())
+
+    assert metrics["sql"] == 'dur=5.00;desc="2x"'
+    assert metrics["jwt"] == "dur=1.00"
+    assert "app" in metrics
+
+
+def test_add_span_without_trace_is_noop():
+    """Test that spans outside a traced request are ignored."""
+    assert current_trace.get() is None
+    add_span("sql", 0.1)
+
+
+@pytest.mark.asyncio
+class TestTracing:
+    """Test suite for per-request tracing."""
+
+    async def test_server_timing_header(self, auth_headers, test_user_id):
+        """Test that responses break down JWT, checkout, SQL and encoding time."""
+        traced = TracingMiddleware(app, server_timing=True)
+        transport = ASGITransport(app=traced)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.post(
+                f"/api/{test_user_id}/tasks",
+                json={"title": "Traced"},
+                headers=auth_headers,
+            )
+            response = await client.get(
+                f"/api/{test_user_id}/tasks", headers=auth_headers
+            )
+
+        assert response.status_code == 200
+        metrics = parse_server_timing(response.headers["server-timing"])
+        for name in ("jwt", "db-checkout", "sql", "encode", "app"):
+            assert name in metrics
+
+    async def test_server_timing_off_by_default(
+        self, async_client, auth_headers, test_user_id
+    ):
+        """Test that the default app does not reveal internal timings."""
+        response = await async_client.get(
+            f"/api/{test_user_id}/tasks", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
+
+    async def test_sampled_traces_are_exported(
+        self, tmp_path, auth_headers, test_user_id
+    ):
+        """Test that sampled requests are written as JSON lines."""
+        path = tmp_path / "traces.jsonl"
+        exporter = TraceExporter(str(path))
+        traced = TracingMiddleware(
+            app, server_timing=False, sample_rate=1.0, exporter=exporter
+        )
+        transport = ASGITransport(app=traced)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get(f"/api/{test_user_id}/tasks", headers=auth_headers)
+        exporter.close()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        record = records[-1]
+        assert record["route"] == "GET /api/{user_id}/tasks"
+        assert record["status"] == 200
+        assert test_user_id not in json.dumps(record)
+        assert {"jwt", "sql"} <= {s["name"] for s in record["spans"]}
+
+    async def test_disabled_tracing_adds_nothing(
+        self, tmp_path, auth_headers, test_user_id
+    ):
+        """Test that no header or trace is produced when both are off."""
+        path = tmp_path / "traces.jsonl"
+        traced = TracingMiddleware(
+            app, server_timing=False, sample_rate=0.0, exporter=TraceExporter(str(path))
+        )
+        transport = ASGITransport(app=traced)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                f"/api/{test_user_id}/tasks", headers=auth_headers
+            )
+
+        assert response.status_code == 200
+        assert not path.exists()
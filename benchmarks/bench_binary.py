@@ -0,0 +1,103 @@
+"""Benchmark TodoManager save/load with the binary format against JSON.
+
+Each format saves a populated TodoManager to a file and loads it back
+into a new one; the report shows file size and tasks per second.
+
+Usage:
+    python -m benchmarks.bench_binary [--sizes 100000 1000000]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict
+
+from src.todo_app.manager import TodoManager
+from src.todo_app.models import Task
+
+
+def populate(count: int) -> TodoManager:
+    """Return a manager holding ``count`` tasks shaped like typical CLI input."""
+    manager = TodoManager()
+    for i in range(count):
+        manager.add_task(
+            f"Task {i}" if i % 3 else "Buy groceries",
+            "Pick up milk and eggs" if i % 4 == 0 else "",
+        )
+        if i % 5 == 0:
+            manager.toggle_complete(i + 1)
+    return manager
+
+
+def save_json(manager: TodoManager, path: str) -> None:
+    """Save the manager as a JSON document."""
+    state = {
+        "next_id": manager._next_id,
+        "tasks": [asdict(task) for task in manager.iter_tasks()],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+def load_json(path: str) -> TodoManager:
+    """Load a manager from a JSON document written by save_json()."""
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    manager = TodoManager()
+    tasks = [Task(**fields) for fields in state["tasks"]]
+    manager._replace_state(tasks, state["next_id"])
+    return manager
+
+
+def load_binary(path: str) -> TodoManager:
+    """Load a manager from a binary snapshot."""
+    manager = TodoManager()
+    manager.load(path)
+    return manager
+
+
+FORMATS = {
+    "json": (save_json, load_json),
+    "binary": (lambda manager, path: manager.save(path), load_binary),
+    "binary+zlib": (lambda manager, path: manager.save(path, compress=True), load_binary),
+}
+
+
+def timed(function, *args) -> tuple[float, object]:
+    """Return (seconds taken, result) for one call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>10} {'format':>12} {'MB':>8} {'save s':>8} {'load s':>8} "
+        f"{'save/s':>11} {'load/s':>11}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.sizes:
+            manager = populate(count)
+            expected = manager.list_tasks()
+            for name, (save, load) in FORMATS.items():
+                path = os.path.join(directory, name)
+                save_seconds, _ = timed(save, manager, path)
+                load_seconds, loaded = timed(load, path)
+                assert loaded.list_tasks() == expected, f"{name} round trip differs"
+                size = os.path.getsize(path)
+                print(
+                    f"{count:>10,} {name:>12} {size / 2**20:>8.1f} "
+                    f"{save_seconds:>8.2f} {load_seconds:>8.2f} "
+                    f"{count / save_seconds:>11,.0f} {count / load_seconds:>11,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
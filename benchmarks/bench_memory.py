@@ -0,0 +1,72 @@
+"""Benchmark TodoManager memory use for large in-memory task counts.
+
+Compares the ``__slots__`` Task against the previous ``__dict__``-based
+dataclass, with both stored in a TodoManager.
+
+Usage:
+    python -m benchmarks.bench_memory [--sizes 100000 1000000 10000000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+
+from src.todo_app.manager import TodoManager
+from src.todo_app.models import Task
+
+
+@dataclass
+class DictTask:
+    """The previous Task layout, with a per-instance ``__dict__``."""
+
+    id: int
+    title: str
+    description: str = ""
+    completed: bool = False
+
+
+def fill(manager: TodoManager, task_class: type, count: int) -> None:
+    """Store ``count`` tasks shaped like typical CLI input."""
+    for task_id in range(1, count + 1):
+        manager._tasks[task_id] = task_class(
+            id=task_id,
+            title=f"Task {task_id}",
+            description="Pick up groceries" if task_id % 4 == 0 else "",
+        )
+    manager._next_id = count + 1
+
+
+def measure(task_class: type, count: int) -> int:
+    """Return bytes allocated by a TodoManager holding ``count`` tasks."""
+    gc.collect()
+    tracemalloc.start()
+    manager = TodoManager()
+    fill(manager, task_class, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del manager
+    return size
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(
+        f"{'tasks':>12} {'__dict__ MB':>12} {'__slots__ MB':>13} "
+        f"{'B/task':>8} {'saved':>7}"
+    )
+    for count in args.sizes:
+        before = measure(DictTask, count)
+        after = measure(Task, count)
+        print(
+            f"{count:>12,} {before / 2**20:>12.1f} {after / 2**20:>13.1f} "
+            f"{after / count:>8.0f} {1 - after / before:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
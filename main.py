@@ -2,20 +2,60 @@
 Main entry point for the Todo application.
 
 This script initializes and runs the command-line interface for the
-in-memory todo task manager.
+todo task manager. Tasks are kept in memory unless ``--data-dir`` is
+given, in which case they are saved to (and restored from) that directory.
+
+Commands are read from a file with ``--script FILE`` (``-`` for stdin), or
+from stdin when it is piped, and run in batch mode without prompts:
+
+    python main.py --data-dir data --script commands.txt
+    printf 'add Milk\ncomplete 1\n' | python main.py
 """
 
+import argparse
+import sys
+
 from src.todo_app.cli import CLI
+from src.todo_app.manager import TodoManager
+from src.todo_app.storage import TaskStorage
 
 
 def main() -> None:
     """
     Start the Todo application.
 
-    Creates a CLI instance and runs the main application loop.
+    Parses command-line options, creates a CLI instance and runs the main
+    application loop.
     """
-    cli = CLI()
-    cli.run()
+    parser = argparse.ArgumentParser(description="Todo App")
+    parser.add_argument(
+        "--data-dir",
+        help="save tasks in this directory and restore them on the next run",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="run the commands in FILE ('-' for stdin) without prompting",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="in script mode, print only the summary",
+    )
+    args = parser.parse_args()
+
+    storage = TaskStorage(args.data_dir) if args.data_dir else None
+    cli = CLI(TodoManager(storage))
+    if args.script is None and sys.stdin.isatty():
+        cli.run()
+        return
+
+    if args.script in (None, "-"):
+        failed = cli.run_script(sys.stdin, quiet=args.quiet)
+    else:
+        with open(args.script, encoding="utf-8") as script:
+            failed = cli.run_script(script, quiet=args.quiet)
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,27 @@ Todo App - In-Memory Console Todo Application
 
 A simple command-line todo application built following spec-driven
 development principles. Phase I implements core CRUD + completion
-operations with in-memory storage.
+operations with in-memory storage, optionally persisted to disk through
+an append-only log with snapshots (TaskStorage).
 """
 
 from .cli import CLI
+from .events import ChangeKind, ChangesExpiredError, TaskEvent
 from .manager import TaskNotFoundError, TodoManager
 from .models import Task
+from .storage import TaskStorage
+from .tenants import TenantStore
 
 __version__ = "0.1.0"
 
-__all__ = ["CLI", "Task", "TodoManager", "TaskNotFoundError"]
+__all__ = [
+    "CLI",
+    "ChangeKind",
+    "ChangesExpiredError",
+    "Task",
+    "TaskEvent",
+    "TaskStorage",
+    "TenantStore",
+    "TodoManager",
+    "TaskNotFoundError",
+]
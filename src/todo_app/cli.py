@@ -2,12 +2,18 @@
 Command-line interface for the Todo application.
 
 This module provides the CLI class that handles user interaction,
-command parsing, and display formatting for the todo app.
+command parsing, and display formatting for the todo app. Commands can
+also be run non-interactively from a script with CLI.run_script().
 """
 
-from typing import Optional
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from typing import Iterable, Optional
 
 from .manager import TaskNotFoundError, TodoManager
+from .models import Task
 
 
 class CLI:
@@ -18,10 +24,18 @@ class CLI:
     user-friendly error messages.
     """
 
-    def __init__(self) -> None:
-        """Initialize the CLI with a new TodoManager instance."""
-        self.manager = TodoManager()
+    def __init__(self, manager: Optional[TodoManager] = None) -> None:
+        """
+        Initialize the CLI.
+
+        Args:
+            manager: TodoManager to operate on (default: a new in-memory one)
+        """
+        self.manager = manager if manager is not None else TodoManager()
         self.running = True
+        self.interactive = True
+        self.failures: list[tuple[int, str]] = []
+        self._line = 0
 
     def run(self) -> None:
         """
@@ -43,6 +57,116 @@ class CLI:
                 print("\n")
                 self._handle_exit()
 
+    def run_script(self, lines: Iterable[str], quiet: bool = False) -> int:
+        """
+        Run commands non-interactively, one per line, and print a summary.
+
+        Confirmations are skipped, ``update`` takes its new values inline
+        (``update <id> <title> [description]``), blank lines and lines
+        starting with ``#`` are ignored, and ``quit`` stops the script.
+        Output is buffered and written in large chunks, and consecutive
+        ``add`` commands are applied together with add_tasks().
+
+        Args:
+            lines: Command lines, e.g. an open script file or sys.stdin
+            quiet: Print only the summary (and the failures it lists)
+
+        Returns:
+            Number of commands that failed
+        """
+        self.interactive = False
+        self.failures = []
+        out = sys.stdout
+        buffer = io.StringIO()
+        pending_adds: list[tuple[int, str]] = []
+        executed = 0
+        start = time.perf_counter()
+
+        def flush_output() -> None:
+            if not quiet:
+                out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+        with redirect_stdout(buffer):
+            for line_number, line in enumerate(lines, start=1):
+                command = line.strip()
+                if not command or command.startswith("#"):
+                    continue
+                cmd, _, args = command.partition(" ")
+                cmd = cmd.lower()
+                if cmd in ("quit", "exit"):
+                    break
+                executed += 1
+                if cmd == "add" and args.strip():
+                    pending_adds.append((line_number, args))
+                    continue
+
+                self._add_pending(pending_adds)
+                self._line = line_number
+                self._process_command(command)
+                if buffer.tell() > 1 << 16:
+                    flush_output()
+            self._add_pending(pending_adds)
+        flush_output()
+
+        elapsed = time.perf_counter() - start
+        failed = len(self.failures)
+        print(
+            f"\nProcessed {executed} command(s) in {elapsed:.2f}s: "
+            f"{executed - failed} succeeded, {failed} failed"
+        )
+        for line_number, message in self.failures[:20]:
+            print(f"  line {line_number}: {message}")
+        if failed > 20:
+            print(f"  ... and {failed - 20} more")
+        if self.manager.persistent:
+            self.manager.close()
+            print("All tasks have been saved.")
+        return failed
+
+    def _add_pending(self, pending: list[tuple[int, str]]) -> None:
+        """
+        Add the tasks of buffered ``add`` commands in one call.
+
+        Args:
+            pending: (line number, arguments) of each command; cleared
+        """
+        if not pending:
+            return
+        items = []
+        for _, args in pending:
+            parts = args.split(maxsplit=1)
+            items.append((parts[0], parts[1] if len(parts) > 1 else ""))
+        for task in self.manager.add_tasks(items):
+            self._print_added(task)
+        pending.clear()
+
+    def _error(self, message: str) -> None:
+        """
+        Report a failed command.
+
+        Args:
+            message: Error message to print (and, in a script, to summarize)
+        """
+        print(message)
+        if not self.interactive:
+            self.failures.append((self._line, message))
+
+    def _confirm(self, prompt: str) -> bool:
+        """
+        Ask the user to confirm an action; always yes in a script.
+
+        Args:
+            prompt: Question to show
+
+        Returns:
+            Whether to go ahead
+        """
+        if not self.interactive:
+            return True
+        return input(prompt).strip().lower() in ("y", "yes")
+
     def _print_welcome(self) -> None:
         """Display welcome message and command help."""
         print("=" * 50)
@@ -50,10 +174,11 @@ class CLI:
         print("=" * 50)
         print("\nAvailable commands:")
         print("  add <title> [description]  - Add a new task")
-        print("  list                       - Show all tasks")
+        print("  list [done|pending]        - Show all, completed or open tasks")
+        print("  search <words>             - Find tasks by title or description")
         print("  update <id>                - Update a task")
-        print("  delete <id>                - Delete a task")
-        print("  complete <id>              - Toggle task completion")
+        print("  delete <ids>               - Delete tasks (e.g. 3, 1-500, 2,4,6)")
+        print("  complete <ids>             - Toggle one task, or complete several")
         print("  help                       - Show this help message")
         print("  quit / exit                - Exit the application")
         print()
@@ -62,10 +187,11 @@ class CLI:
         """Display command help."""
         print("\nAvailable commands:")
         print("  add <title> [description]  - Add a new task")
-        print("  list                       - Show all tasks")
+        print("  list [done|pending]        - Show all, completed or open tasks")
+        print("  search <words>             - Find tasks by title or description")
         print("  update <id>                - Update a task")
-        print("  delete <id>                - Delete a task")
-        print("  complete <id>              - Toggle task completion")
+        print("  delete <ids>               - Delete tasks (e.g. 3, 1-500, 2,4,6)")
+        print("  complete <ids>             - Toggle one task, or complete several")
         print("  help                       - Show this help message")
         print("  quit / exit                - Exit the application")
 
@@ -86,7 +212,9 @@ class CLI:
         elif cmd == "add":
             self._handle_add(parts[1] if len(parts) > 1 else "")
         elif cmd == "list":
-            self._handle_list()
+            self._handle_list(parts[1] if len(parts) > 1 else "")
+        elif cmd == "search":
+            self._handle_search(parts[1] if len(parts) > 1 else "")
         elif cmd == "update":
             self._handle_update(parts[1] if len(parts) > 1 else "")
         elif cmd == "delete":
@@ -94,7 +222,9 @@ class CLI:
         elif cmd == "complete":
             self._handle_complete(parts[1] if len(parts) > 1 else "")
         else:
-            print(f"Unknown command: '{cmd}'. Type 'help' for available commands.")
+            self._error(
+                f"Unknown command: '{cmd}'. Type 'help' for available commands."
+            )
 
     def _handle_add(self, args: str) -> None:
         """
@@ -104,7 +234,7 @@ class CLI:
             args: Command arguments containing title and optional description
         """
         if not args:
-            print("Error: Task title is required.")
+            self._error("Error: Task title is required.")
             print("Usage: add <title> [description]")
             return
 
@@ -116,22 +246,74 @@ class CLI:
 
         try:
             task = self.manager.add_task(title, description)
-            print(f"\n[OK] Task added successfully!")
-            print(f"  ID: {task.id}")
-            print(f"  Title: {task.title}")
-            if task.description:
-                print(f"  Description: {task.description}")
+            self._print_added(task)
         except ValueError as e:
-            print(f"Error: {e}")
+            self._error(f"Error: {e}")
 
-    def _handle_list(self) -> None:
-        """Handle the 'list' command to display all tasks."""
-        tasks = self.manager.list_tasks()
+    def _print_added(self, task: Task) -> None:
+        """
+        Display a newly added task.
+
+        Args:
+            task: The task that was added
+        """
+        print(f"\n[OK] Task added successfully!")
+        print(f"  ID: {task.id}")
+        print(f"  Title: {task.title}")
+        if task.description:
+            print(f"  Description: {task.description}")
+
+    def _handle_list(self, args: str = "") -> None:
+        """
+        Handle the 'list' command to display tasks.
+
+        Args:
+            args: Optional filter, 'done' or 'pending'
+        """
+        status_filter = args.strip().lower()
+        if status_filter in ("done", "completed"):
+            tasks = self.manager.list_by_status(True)
+        elif status_filter in ("pending", "open", "incomplete"):
+            tasks = self.manager.list_by_status(False)
+        elif status_filter:
+            self._error(f"Error: Unknown filter '{args}'.")
+            print("Usage: list [done|pending]")
+            return
+        else:
+            tasks = self.manager.list_tasks()
 
         if not tasks:
             print("\nNo tasks found. Add a task with 'add <title>'.")
             return
 
+        self._print_tasks(tasks)
+
+    def _handle_search(self, args: str) -> None:
+        """
+        Handle the 'search' command to find tasks by text.
+
+        Args:
+            args: Words to look for in titles and descriptions
+        """
+        if not args.strip():
+            self._error("Error: Search words are required.")
+            print("Usage: search <words>")
+            return
+
+        tasks = self.manager.search(args)
+        if not tasks:
+            print(f"\nNo tasks match '{args}'.")
+            return
+
+        self._print_tasks(tasks)
+
+    def _print_tasks(self, tasks: list[Task]) -> None:
+        """
+        Display tasks as a table.
+
+        Args:
+            tasks: Tasks to display, in display order
+        """
         print(f"\n{'=' * 50}")
         print(f"{'ID':<5} {'Status':<8} {'Title':<30} {'Description'}")
         print(f"{'=' * 50}")
@@ -153,19 +335,23 @@ class CLI:
             args: Command arguments containing task ID
         """
         if not args:
-            print("Error: Task ID is required.")
+            self._error("Error: Task ID is required.")
             print("Usage: update <id>")
             return
 
+        if not self.interactive:
+            self._handle_update_inline(args)
+            return
+
         try:
             task_id = int(args)
         except ValueError:
-            print(f"Error: Invalid task ID '{args}'. Please provide a number.")
+            self._error(f"Error: Invalid task ID '{args}'. Please provide a number.")
             return
 
         try:
             # Find the task first to show current values
-            task = self.manager._find_task_by_id(task_id)
+            task = self.manager.get_task(task_id)
             print(f"\nUpdating Task #{task_id}")
             print(f"Current title: {task.title}")
             print(f"Current description: {task.description}")
@@ -187,9 +373,37 @@ class CLI:
             print(f"\n[OK] Task #{task_id} updated successfully!")
 
         except TaskNotFoundError as e:
-            print(f"Error: {e}")
+            self._error(f"Error: {e}")
         except ValueError as e:
-            print(f"Error: {e}")
+            self._error(f"Error: {e}")
+
+    def _handle_update_inline(self, args: str) -> None:
+        """
+        Handle 'update <id> <title> [description]' without prompting.
+
+        Args:
+            args: Task ID, new title and optional new description
+        """
+        parts = args.split(maxsplit=2)
+        if len(parts) < 2:
+            self._error("Error: New title is required.")
+            print("Usage: update <id> <title> [description]")
+            return
+
+        try:
+            task_id = int(parts[0])
+        except ValueError:
+            self._error(
+                f"Error: Invalid task ID '{parts[0]}'. Please provide a number."
+            )
+            return
+
+        try:
+            description = parts[2] if len(parts) > 2 else None
+            self.manager.update_task(task_id, parts[1], description)
+            print(f"\n[OK] Task #{task_id} updated successfully!")
+        except (TaskNotFoundError, ValueError) as e:
+            self._error(f"Error: {e}")
 
     def _handle_delete(self, args: str) -> None:
         """
@@ -199,29 +413,31 @@ class CLI:
             args: Command arguments containing task ID
         """
         if not args:
-            print("Error: Task ID is required.")
+            self._error("Error: Task ID is required.")
             print("Usage: delete <id>")
             return
 
+        if self._is_id_list(args):
+            self._handle_delete_many(args)
+            return
+
         try:
             task_id = int(args)
         except ValueError:
-            print(f"Error: Invalid task ID '{args}'. Please provide a number.")
+            self._error(f"Error: Invalid task ID '{args}'. Please provide a number.")
             return
 
         try:
             # Show task before deletion
-            task = self.manager._find_task_by_id(task_id)
-            confirm = input(f"\nDelete task '{task.title}'? (y/n): ").strip().lower()
-
-            if confirm in ("y", "yes"):
+            task = self.manager.get_task(task_id)
+            if self._confirm(f"\nDelete task '{task.title}'? (y/n): "):
                 self.manager.delete_task(task_id)
                 print(f"\n[OK] Task #{task_id} deleted successfully!")
             else:
                 print("\nDeletion cancelled.")
 
         except TaskNotFoundError as e:
-            print(f"Error: {e}")
+            self._error(f"Error: {e}")
 
     def _handle_complete(self, args: str) -> None:
         """
@@ -231,14 +447,18 @@ class CLI:
             args: Command arguments containing task ID
         """
         if not args:
-            print("Error: Task ID is required.")
+            self._error("Error: Task ID is required.")
             print("Usage: complete <id>")
             return
 
+        if self._is_id_list(args):
+            self._handle_complete_many(args)
+            return
+
         try:
             task_id = int(args)
         except ValueError:
-            print(f"Error: Invalid task ID '{args}'. Please provide a number.")
+            self._error(f"Error: Invalid task ID '{args}'. Please provide a number.")
             return
 
         try:
@@ -247,10 +467,87 @@ class CLI:
             print(f"\n[OK] Task #{task_id} marked as {status}!")
 
         except TaskNotFoundError as e:
-            print(f"Error: {e}")
+            self._error(f"Error: {e}")
+
+    @staticmethod
+    def _is_id_list(args: str) -> bool:
+        """Return whether arguments name several tasks (ranges or lists)."""
+        return "-" in args or "," in args
+
+    def _parse_ids(self, args: str) -> Optional[list[int]]:
+        """
+        Resolve task IDs and ranges such as ``1-500`` or ``2,4,6-9``.
+
+        Ranges cover only tasks that exist; IDs given one by one are
+        returned even if missing, so the bulk operation can report them.
+
+        Args:
+            args: Comma or space separated IDs and inclusive ranges
+
+        Returns:
+            List of task IDs, or None after printing an error
+        """
+        ids = []
+        for part in args.replace(",", " ").split():
+            start, dash, end = part.partition("-")
+            try:
+                if dash:
+                    tasks = self.manager.list_id_range(int(start), int(end))
+                    ids.extend(task.id for task in tasks)
+                else:
+                    ids.append(int(part))
+            except ValueError:
+                self._error(f"Error: Invalid task ID or range '{part}'.")
+                return None
+        if not ids:
+            print(f"No tasks found in '{args}'.")
+            return None
+        return ids
+
+    def _handle_delete_many(self, args: str) -> None:
+        """
+        Delete every task in a list of IDs and ranges after one confirmation.
+
+        Args:
+            args: IDs and ranges, e.g. ``1-500``
+        """
+        ids = self._parse_ids(args)
+        if ids is None:
+            return
+
+        if not self._confirm(f"\nDelete {len(ids)} task(s)? (y/n): "):
+            print("\nDeletion cancelled.")
+            return
+
+        try:
+            deleted = self.manager.delete_many(ids)
+            print(f"\n[OK] {deleted} task(s) deleted successfully!")
+        except TaskNotFoundError as e:
+            self._error(f"Error: {e}")
+
+    def _handle_complete_many(self, args: str) -> None:
+        """
+        Mark every task in a list of IDs and ranges as completed.
+
+        Args:
+            args: IDs and ranges, e.g. ``1-500``
+        """
+        ids = self._parse_ids(args)
+        if ids is None:
+            return
+
+        try:
+            tasks = self.manager.complete_many(ids)
+            print(f"\n[OK] {len(tasks)} task(s) marked as completed!")
+        except TaskNotFoundError as e:
+            self._error(f"Error: {e}")
 
     def _handle_exit(self) -> None:
         """Handle application exit."""
         print("\nThank you for using Todo App!")
-        print("Note: All tasks are stored in memory and will be lost on exit.")
+        if self.manager.persistent:
+            self.manager.close()
+            print("All tasks have been saved.")
+        else:
+            print("Note: All tasks are stored in memory and will be lost on exit.")
         self.running = False
@@ -0,0 +1,256 @@
+"""
+Change events emitted by TodoManager.
+
+Every change to a manager's tasks is described by a TaskEvent carrying a
+sequence number that increases by one per event. Consumers can:
+
+- register a listener, called synchronously for each event, to keep a
+  derived view (counts, caches, indexes) current in O(1) per change;
+- subscribe, receiving events through a bounded buffer they drain at
+  their own pace from any thread;
+- ask the change log for every event after a sequence number they have
+  already seen, as long as it is still retained.
+
+A consumer that falls too far behind gets ChangesExpiredError and should
+reload the full task list, then continue from the current sequence.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from itertools import islice
+from typing import Callable, Optional
+
+from .models import Task
+
+
+class ChangeKind(str, Enum):
+    """Type of change a TaskEvent describes."""
+
+    ADD = "add"
+    UPDATE = "update"
+    TOGGLE = "toggle"
+    DELETE = "delete"
+    RESET = "reset"
+    """Every task was replaced (e.g. by TodoManager.load); reload all tasks"""
+
+
+@dataclass(frozen=True, slots=True)
+class TaskEvent:
+    """
+    One change to a task.
+
+    Attributes:
+        seq: Sequence number, one higher than the previous event's
+        kind: Type of change
+        task_id: ID of the changed task (0 for RESET)
+        task: Task after the change (None for DELETE and RESET)
+        previous: Task before the change (None for ADD and RESET)
+    """
+
+    seq: int
+    kind: ChangeKind
+    task_id: int
+    task: Optional[Task] = None
+    previous: Optional[Task] = None
+
+
+Listener = Callable[[TaskEvent], None]
+
+
+class ChangesExpiredError(Exception):
+    """Exception raised when requested events are no longer available."""
+
+    pass
+
+
+class Subscription:
+    """
+    Bounded buffer of events delivered to one consumer.
+
+    If the consumer lets ``maxsize`` events pile up, the subscription
+    stops buffering: events already buffered can still be read, after
+    which get() raises ChangesExpiredError.
+
+    Args:
+        maxsize: Most events held before the subscription overflows
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        """Create an empty subscription."""
+        self.maxsize = maxsize
+        self.overflowed = False
+        self.closed = False
+        self._events: deque[TaskEvent] = deque()
+        self._ready = threading.Condition(threading.Lock())
+
+    def __len__(self) -> int:
+        """Return the number of buffered events."""
+        return len(self._events)
+
+    def push(self, event: TaskEvent) -> None:
+        """
+        Buffer an event (called by the change log).
+
+        Args:
+            event: Event to deliver
+        """
+        with self._ready:
+            if self.closed or self.overflowed:
+                return
+            if len(self._events) >= self.maxsize:
+                self.overflowed = True
+            else:
+                self._events.append(event)
+            self._ready.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[TaskEvent]:
+        """
+        Take the next event, waiting for one if none is buffered.
+
+        Args:
+            timeout: Seconds to wait (None waits until an event arrives)
+
+        Returns:
+            The next event, or None on timeout or once closed
+
+        Raises:
+            ChangesExpiredError: If the buffer overflowed and is now empty
+        """
+        with self._ready:
+            self._ready.wait_for(
+                lambda: self._events or self.overflowed or self.closed, timeout
+            )
+            if self._events:
+                return self._events.popleft()
+            if self.overflowed:
+                raise ChangesExpiredError("Subscription overflowed; reload all tasks")
+            return None
+
+    def drain(self) -> list[TaskEvent]:
+        """
+        Take every buffered event without waiting.
+
+        Returns:
+            Buffered events, oldest first
+
+        Raises:
+            ChangesExpiredError: If the buffer overflowed and is now empty
+        """
+        with self._ready:
+            if not self._events and self.overflowed:
+                raise ChangesExpiredError("Subscription overflowed; reload all tasks")
+            events = list(self._events)
+            self._events.clear()
+            return events
+
+    def close(self) -> None:
+        """Stop receiving events and wake any waiting consumer."""
+        with self._ready:
+            self.closed = True
+            self._ready.notify_all()
+
+
+class ChangeLog:
+    """
+    Sequence-numbered record of recent changes with listeners and subscribers.
+
+    Only the most recent ``capacity`` events are retained. Not thread-safe
+    on its own: TodoManager appends under its lock.
+
+    Args:
+        capacity: Number of recent events kept for since()
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        """Create an empty change log."""
+        self.seq = 0
+        self._events: deque[TaskEvent] = deque(maxlen=capacity)
+        self._listeners: list[Listener] = []
+        self._subscriptions: list[Subscription] = []
+
+    def append(
+        self,
+        kind: ChangeKind,
+        task_id: int,
+        task: Optional[Task] = None,
+        previous: Optional[Task] = None,
+    ) -> TaskEvent:
+        """
+        Record a change and deliver it to listeners and subscribers.
+
+        Returns:
+            The new event
+        """
+        self.seq += 1
+        event = TaskEvent(self.seq, kind, task_id, task, previous)
+        self._events.append(event)
+        for listener in self._listeners:
+            listener(event)
+        if self._subscriptions:
+            for subscription in self._subscriptions:
+                subscription.push(event)
+            if any(sub.closed for sub in self._subscriptions):
+                self._subscriptions = [
+                    sub for sub in self._subscriptions if not sub.closed
+                ]
+        return event
+
+    def since(self, seq: int, limit: Optional[int] = None) -> list[TaskEvent]:
+        """
+        Get retained events with a sequence number greater than ``seq``.
+
+        Args:
+            seq: Last sequence number the caller has seen (0 for all)
+            limit: Maximum number of events to return
+
+        Returns:
+            Events in sequence order
+
+        Raises:
+            ChangesExpiredError: If events after ``seq`` are no longer
+                retained, or ``seq`` is ahead of the log
+        """
+        if seq > self.seq:
+            raise ChangesExpiredError(f"Sequence {seq} is ahead of the change log")
+        oldest = self._events[0].seq if self._events else self.seq + 1
+        if seq < oldest - 1:
+            raise ChangesExpiredError(f"Changes after {seq} are no longer available")
+        start = seq - oldest + 1
+        end = None if limit is None else start + limit
+        return list(islice(self._events, start, end))
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        Call ``listener`` synchronously with every future event.
+
+        Args:
+            listener: Callable taking a TaskEvent; it runs while the
+                manager's lock is held, so it must be quick and must not
+                change the manager
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """
+        Stop calling a listener.
+
+        Args:
+            listener: Listener previously passed to add_listener()
+        """
+        self._listeners.remove(listener)
+
+    def subscribe(self, maxsize: int = 1000) -> Subscription:
+        """
+        Start buffering future events for a consumer.
+
+        Args:
+            maxsize: Most events buffered before the subscription overflows
+
+        Returns:
+            New Subscription; close() it when done
+        """
+        subscription = Subscription(maxsize)
+        self._subscriptions.append(subscription)
+        return subscription
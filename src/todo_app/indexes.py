@@ -0,0 +1,343 @@
+"""
+Index structures used by TodoManager.
+
+SortedIndex keeps keys ordered in a list of bounded-size buckets, so an
+insert or removal moves at most one bucket's worth of entries instead of
+shifting a single list holding millions of keys.
+
+TextIndex is an inverted index of the words in task titles and
+descriptions, used for ranked full-text search.
+"""
+
+import heapq
+import re
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Iterable, Iterator
+
+
+class SortedIndex:
+    """
+    Ordered collection of comparable keys with cheap inserts and removals.
+
+    Args:
+        bucket_size: Target number of keys per bucket
+    """
+
+    def __init__(self, bucket_size: int = 1000) -> None:
+        """Create an empty index."""
+        self._bucket_size = bucket_size
+        self._buckets: list[list[Any]] = []
+        self._maxes: list[Any] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of keys in the index."""
+        return self._len
+
+    def load(self, keys: list[Any]) -> None:
+        """
+        Replace the contents with ``keys`` in O(n log n).
+
+        Args:
+            keys: Keys to index, in any order
+        """
+        keys = sorted(keys)
+        size = self._bucket_size
+        self._buckets = [keys[i:i + size] for i in range(0, len(keys), size)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(keys)
+
+    def add(self, key: Any) -> None:
+        """
+        Insert a key, keeping the index ordered.
+
+        Args:
+            key: Key to insert
+        """
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            return
+
+        position = bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            position -= 1
+            self._buckets[position].append(key)
+            self._maxes[position] = key
+        else:
+            insort(self._buckets[position], key)
+        self._len += 1
+
+        bucket = self._buckets[position]
+        if len(bucket) > 2 * self._bucket_size:
+            half = len(bucket) // 2
+            self._buckets[position:position + 1] = [bucket[:half], bucket[half:]]
+            self._maxes[position:position + 1] = [bucket[half - 1], bucket[-1]]
+
+    def discard(self, key: Any) -> None:
+        """
+        Remove a key if present.
+
+        Args:
+            key: Key to remove
+        """
+        position = bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            return
+        bucket = self._buckets[position]
+        index = bisect_left(bucket, key)
+        if index == len(bucket) or bucket[index] != key:
+            return
+
+        del bucket[index]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[position]
+            del self._maxes[position]
+        elif index == len(bucket):
+            self._maxes[position] = bucket[-1]
+
+    def discard_many(self, keys: Iterable[Any]) -> None:
+        """
+        Remove several keys, rebuilding each affected bucket once.
+
+        Args:
+            keys: Keys to remove; missing keys are ignored
+        """
+        removed = set(keys)
+        touched = {bisect_left(self._maxes, key) for key in removed}
+        touched.discard(len(self._maxes))
+        if not touched:
+            return
+        for position in touched:
+            bucket = self._buckets[position]
+            kept = [key for key in bucket if key not in removed]
+            self._len -= len(bucket) - len(kept)
+            self._buckets[position] = kept
+        self._buckets = [bucket for bucket in self._buckets if bucket]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+
+    def irange(self, start: Any) -> Iterator[Any]:
+        """
+        Iterate over keys greater than or equal to ``start``, in order.
+
+        Args:
+            start: Smallest key to yield
+
+        Yields:
+            Keys in ascending order
+        """
+        position = bisect_left(self._maxes, start)
+        if position == len(self._maxes):
+            return
+        bucket = self._buckets[position]
+        yield from bucket[bisect_left(bucket, start):]
+        for bucket in self._buckets[position + 1:]:
+            yield from bucket
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over all keys in order."""
+        for bucket in self._buckets:
+            yield from bucket
+
+    def __contains__(self, key: Any) -> bool:
+        """Return whether ``key`` is in the index."""
+        position = bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            return False
+        bucket = self._buckets[position]
+        index = bisect_right(bucket, key)
+        return index > 0 and bucket[index - 1] == key
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+MAX_PREFIX_EXPANSIONS = 32
+"""Most vocabulary tokens a single query term may expand to"""
+
+RANKING_WINDOW = 1000
+"""Candidates examined for a better score once a search has enough results"""
+
+
+def tokenize(text: str) -> set[str]:
+    """
+    Split text into the set of case-folded word tokens it contains.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Set of distinct tokens
+    """
+    return set(TOKEN_PATTERN.findall(text.casefold()))
+
+
+class TextIndex:
+    """
+    Inverted index from word tokens to the IDs of tasks containing them.
+
+    Titles and descriptions have separate postings, so title hits can be
+    ranked first without scoring every match. Each posting maps task IDs
+    to the stamp of the add() that indexed them, a counter shared by all
+    postings; IDs sit in stamp order, so reading a posting backwards
+    yields the most recently added or edited tasks first, and stamps
+    compare recency across postings. A SortedIndex of all tokens serves
+    prefix lookups.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._title: dict[str, dict[int, int]] = {}
+        self._description: dict[str, dict[int, int]] = {}
+        self._vocabulary = SortedIndex()
+        self._stamp = 0
+
+    def add(self, task_id: int, title: str, description: str) -> None:
+        """
+        Index a task's text.
+
+        Args:
+            task_id: ID of the task
+            title: Task title
+            description: Task description
+        """
+        self._stamp += 1
+        fields = ((self._title, title), (self._description, description))
+        for postings, text in fields:
+            for token in tokenize(text):
+                posting = postings.get(token)
+                if posting is None:
+                    if token not in self._title and token not in self._description:
+                        self._vocabulary.add(token)
+                    posting = postings[token] = {}
+                posting[task_id] = self._stamp
+
+    def remove(self, task_id: int, title: str, description: str) -> None:
+        """
+        Remove a task's text from the index.
+
+        Args:
+            task_id: ID of the task
+            title: Title the task was indexed with
+            description: Description the task was indexed with
+        """
+        fields = ((self._title, title), (self._description, description))
+        for postings, text in fields:
+            for token in tokenize(text):
+                posting = postings.get(token)
+                if posting is None:
+                    continue
+                posting.pop(task_id, None)
+                if not posting:
+                    del postings[token]
+                    if token not in self._title and token not in self._description:
+                        self._vocabulary.discard(token)
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Return (token, boost) pairs a query term matches, exact match first."""
+        matches = []
+        for token in self._vocabulary.irange(term):
+            if not token.startswith(term):
+                break
+            matches.append((token, 1.0 if token == term else 0.5))
+            if len(matches) == MAX_PREFIX_EXPANSIONS:
+                break
+        return matches
+
+    def _score(self, task_id: int, expansion: list[tuple[str, float]]) -> float:
+        """Return the best score any token of one query term gives a task."""
+        best = 0.0
+        for token, boost in expansion:
+            if task_id in self._title.get(token, ()):
+                best = max(best, 2 * boost)
+            elif task_id in self._description.get(token, ()):
+                best = max(best, boost)
+        return best
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[float, int]]:
+        """
+        Find tasks containing every query term, best matches first.
+
+        Each term matches whole tokens exactly or as a prefix. A term
+        scores 2 when it hits the title and 1 when it only hits the
+        description, halved for prefix-only hits; a task's score is the
+        sum over terms. Ties go to matches through whole words, then to
+        the most recently added or edited task.
+
+        The rarest term drives the search, and its postings are read from
+        the highest-scoring group down, so scanning stops as soon as no
+        remaining task can enter the top ``limit``. When every term is
+        common that bound may never be reached, so once ``limit`` results
+        are found only RANKING_WINDOW more candidates are examined: such
+        searches rank the most recent matches exactly rather than scanning
+        every task. No match is ever dropped while results are fewer than
+        ``limit``.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            List of (score, task ID) pairs, best first
+        """
+        terms = sorted(tokenize(query))
+        if not terms or limit <= 0:
+            return []
+        expansions = [self._expand(term) for term in terms]
+        if not all(expansions):
+            return []
+
+        def size(expansion: list[tuple[str, float]]) -> int:
+            return sum(
+                len(self._title.get(token, ()))
+                + len(self._description.get(token, ()))
+                for token, _ in expansion
+            )
+
+        expansions.sort(key=size)
+        driver, others = expansions[0], expansions[1:]
+        best_rest = sum(2 * expansion[0][1] for expansion in others)
+
+        # Equal-scoring groups keep whole words (boost 1) ahead of prefixes
+        groups = []
+        for token, boost in driver:
+            groups.append((2 * boost, boost, self._title.get(token, {})))
+            groups.append((boost, boost, self._description.get(token, {})))
+        groups.sort(key=lambda group: group[0], reverse=True)
+
+        top: list[tuple[float, float, int, int]] = []
+        seen: set[int] = set()
+        window = RANKING_WINDOW
+        for group_score, boost, posting in groups:
+            # A later group can still tie the worst kept entry and win on
+            # whole-word boost or recency, so stop only when it cannot.
+            if len(top) == limit and top[0][:2] > (group_score + best_rest, boost):
+                break
+            for task_id, stamp in reversed(posting.items()):
+                if task_id in seen:
+                    continue
+                if len(top) == limit:
+                    window -= 1
+                    if window < 0:
+                        break
+                seen.add(task_id)
+                score = group_score
+                for expansion in others:
+                    term_score = self._score(task_id, expansion)
+                    if not term_score:
+                        break
+                    score += term_score
+                else:
+                    entry = (score, boost, stamp, task_id)
+                    if len(top) < limit:
+                        heapq.heappush(top, entry)
+                    elif entry > top[0]:
+                        heapq.heapreplace(top, entry)
+                    if len(top) == limit and top[0][0] >= group_score + best_rest:
+                        break
+            if window < 0:
+                break
+
+        top.sort(reverse=True)
+        return [(score, task_id) for score, _, _, task_id in top]
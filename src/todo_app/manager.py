@@ -6,9 +6,21 @@ operations including creating, reading, updating, deleting, and toggling
 completion status of tasks.
 """
 
-from typing import Optional
-
+import threading
+from dataclasses import replace
+from itertools import takewhile
+from typing import Iterable, Iterator, Mapping, Optional
+
+from .binary import gc_paused, read_snapshot, write_snapshot
+from .events import ChangeKind, ChangeLog, Listener, Subscription, TaskEvent
+from .indexes import SortedIndex, TextIndex
 from .models import Task
+from .storage import TaskStorage
+from .table import TaskSnapshot, TaskTable
+
+
+TASK_OVERHEAD_BYTES = 260
+"""Approximate fixed memory cost of one task: objects, table slot and indexes"""
 
 
 class TaskNotFoundError(Exception):
@@ -21,14 +33,191 @@ class TodoManager:
     """
     Manages a collection of todo tasks in memory.
 
-    This class maintains an in-memory list of Task objects and provides
-    methods for CRUD operations plus completion toggling.
+    This class maintains an in-memory store of Task objects and provides
+    methods for CRUD operations plus completion toggling. Tasks are kept in
+    an ID-ordered TaskTable, so iteration stays in creation order while
+    lookups and deletions are O(1).
+
+    Task objects are never modified in place: a change stores a new Task
+    with the updated fields. Together with the table's copy-on-write
+    chunks this makes snapshot() and paginated reads cheap and consistent
+    even while other threads keep writing.
+
+    Secondary indexes are updated on every mutation so filtered queries do
+    not scan the whole store: task IDs partitioned by completion status, and
+    a sorted index of (case-folded title, ID) pairs for prefix search. The
+    full-text index used by search() is built on the first search and kept
+    up to date from then on.
+
+    With a TaskStorage attached, state is recovered from disk on creation
+    and every change is appended to the storage's operation log.
+
+    Every change is also published as a sequence-numbered TaskEvent (see
+    events.py) to listeners, subscriptions and a bounded change log, so
+    derived views can follow changes without rescanning the tasks.
+
+    The manager is safe to share between threads. Changes are serialized by
+    a single lock, so IDs are never handed out twice and every index and
+    log record is written in the same order as the change it describes.
+    Looking up one task takes no lock, nor does reading a snapshot;
+    queries that combine several structures take the lock.
     """
 
-    def __init__(self) -> None:
-        """Initialize the TodoManager with an empty task list."""
-        self._tasks: list[Task] = []
+    def __init__(self, storage: Optional[TaskStorage] = None) -> None:
+        """
+        Initialize the TodoManager.
+
+        Args:
+            storage: Optional persistence engine; when given, existing state
+                is loaded from it and every change is recorded to it
+        """
+        self._tasks = TaskTable()
         self._next_id: int = 1
+        self._by_status: dict[bool, SortedIndex] = {
+            False: SortedIndex(),
+            True: SortedIndex(),
+        }
+        self._titles = SortedIndex()
+        self._text: Optional[TextIndex] = None
+        self._text_bytes = 0
+        self._storage = storage
+        self._changes = ChangeLog()
+        self._lock = threading.RLock()
+
+        if storage is not None:
+            tasks, next_id = storage.load()
+            self._replace_state(tasks.values(), next_id)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether changes are saved to disk."""
+        return self._storage is not None
+
+    def __len__(self) -> int:
+        """Return the number of tasks."""
+        return len(self._tasks)
+
+    def memory_estimate(self) -> int:
+        """
+        Estimate the memory held by this manager's tasks and indexes.
+
+        Maintained incrementally, so this is O(1). Titles count twice
+        because the title index keeps a case-folded copy.
+
+        Returns:
+            Approximate size in bytes
+        """
+        return len(self._tasks) * TASK_OVERHEAD_BYTES + self._text_bytes
+
+    def _replace_state(self, tasks: Iterable[Task], next_id: int) -> None:
+        """Replace every task (given in ID order) and rebuild the indexes."""
+        self._tasks.load(tasks)
+        self._next_id = next_id
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Build the secondary indexes from scratch (used after loading)."""
+        self._text_bytes = 0
+        status_ids: dict[bool, list[int]] = {False: [], True: []}
+        titles = []
+        for task in self._tasks:
+            status_ids[task.completed].append(task.id)
+            titles.append((task.title.casefold(), task.id))
+            self._text_bytes += 2 * len(task.title) + len(task.description)
+        for completed, ids in status_ids.items():
+            self._by_status[completed].load(ids)
+        self._titles.load(titles)
+        self._text = None
+
+    def _index(self, task: Task) -> None:
+        """Add a task to the secondary indexes."""
+        self._by_status[task.completed].add(task.id)
+        self._titles.add((task.title.casefold(), task.id))
+        self._text_bytes += 2 * len(task.title) + len(task.description)
+        if self._text is not None:
+            self._text.add(task.id, task.title, task.description)
+
+    def _unindex(self, task: Task) -> None:
+        """Remove a task from the secondary indexes."""
+        self._by_status[task.completed].discard(task.id)
+        self._titles.discard((task.title.casefold(), task.id))
+        self._text_bytes -= 2 * len(task.title) + len(task.description)
+        if self._text is not None:
+            self._text.remove(task.id, task.title, task.description)
+
+    def _persist(self, *tasks: Task) -> None:
+        """Record created or changed tasks to storage, if attached."""
+        if self._storage is not None and tasks:
+            self._storage.record_put(*tasks)
+            if self._storage.needs_compaction:
+                self.compact()
+
+    def _persist_delete(self, *task_ids: int) -> None:
+        """Record deleted tasks to storage, if attached."""
+        if self._storage is not None and task_ids:
+            self._storage.record_delete(*task_ids)
+            if self._storage.needs_compaction:
+                self.compact()
+
+    def compact(self) -> None:
+        """
+        Snapshot the current state to storage and start a new operation log.
+
+        Only the log rotation happens under the lock; the snapshot is a
+        copy-on-write view written by a background thread, so other
+        threads keep making changes meanwhile. Called automatically once
+        the log grows past the storage's ``snapshot_every`` records; does
+        nothing without storage.
+        """
+        with self._lock:
+            if self._storage is not None:
+                view = self._tasks.snapshot()
+                self._storage.compact(view.values(), self._next_id)
+
+    def save(self, path: str, compress: bool = False) -> int:
+        """
+        Write all tasks to a binary snapshot file (format in binary.py).
+
+        The file is streamed from a snapshot(), so other threads can keep
+        making changes while it is being written.
+
+        Args:
+            path: Destination file, replaced atomically
+            compress: Compress the file with zlib (smaller, slower)
+
+        Returns:
+            Number of tasks written
+        """
+        with self._lock:
+            view = self._tasks.snapshot()
+            next_id = self._next_id
+        return write_snapshot(path, view.values(), next_id, compress=compress)
+
+    def load(self, path: str) -> None:
+        """
+        Replace all tasks with those stored in a snapshot file.
+
+        With storage attached, the loaded state is compacted to disk at once.
+
+        Args:
+            path: Snapshot file written by save() or by TaskStorage
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot
+        """
+        with gc_paused():
+            tasks, next_id = read_snapshot(path)
+            tasks.sort(key=lambda task: task.id)
+            with self._lock:
+                self._replace_state(tasks, next_id)
+                self._changes.append(ChangeKind.RESET, 0)
+        self.compact()
+
+    def close(self) -> None:
+        """Flush pending changes to disk and release the storage."""
+        with self._lock:
+            if self._storage is not None:
+                self._storage.close()
 
     def add_task(self, title: str, description: str = "") -> Task:
         """
@@ -47,16 +236,55 @@ class TodoManager:
         if not title or not title.strip():
             raise ValueError("Task title cannot be empty")
 
-        task = Task(
-            id=self._next_id,
-            title=title.strip(),
-            description=description.strip(),
-            completed=False,
-        )
-        self._tasks.append(task)
-        self._next_id += 1
+        with self._lock:
+            task = Task(
+                id=self._next_id,
+                title=title.strip(),
+                description=description.strip(),
+                completed=False,
+            )
+            self._tasks[task.id] = task
+            self._index(task)
+            self._next_id += 1
+            self._persist(task)
+            self._changes.append(ChangeKind.ADD, task.id, task)
         return task
 
+    def add_tasks(self, items: Iterable[tuple[str, str]]) -> list[Task]:
+        """
+        Add several tasks at once.
+
+        Every title is validated before any task is created, so either all
+        tasks are added or none is.
+
+        Args:
+            items: (title, description) pairs
+
+        Returns:
+            The newly created Task objects, in input order
+
+        Raises:
+            ValueError: If any title is empty or contains only whitespace
+        """
+        fields = []
+        for position, (title, description) in enumerate(items):
+            if not title or not title.strip():
+                raise ValueError(f"Task title cannot be empty (item {position + 1})")
+            fields.append((title.strip(), description.strip()))
+
+        with self._lock:
+            tasks = []
+            for title, description in fields:
+                task = Task(id=self._next_id, title=title, description=description)
+                self._tasks[task.id] = task
+                self._index(task)
+                self._next_id += 1
+                tasks.append(task)
+            self._persist(*tasks)
+            for task in tasks:
+                self._changes.append(ChangeKind.ADD, task.id, task)
+        return tasks
+
     def list_tasks(self) -> list[Task]:
         """
         Get all tasks in the todo list.
@@ -64,7 +292,156 @@ class TodoManager:
         Returns:
             List of all Task objects ordered by ID (creation order)
         """
-        return self._tasks.copy()
+        with self._lock:
+            return list(self._tasks)
+
+    def snapshot(self) -> TaskSnapshot:
+        """
+        Get an immutable view of all tasks as they are right now.
+
+        The view shares storage with the manager (copy-on-write), so taking
+        it costs O(n / CHUNK_SIZE) rather than a copy of every task, and
+        later changes never show through.
+
+        Returns:
+            TaskSnapshot supporting len(), lookups, iteration and page()
+        """
+        with self._lock:
+            return self._tasks.snapshot()
+
+    def iter_tasks(self, after_id: int = 0) -> Iterator[Task]:
+        """
+        Lazily iterate over tasks in ID order.
+
+        Iterates over a snapshot, so concurrent changes are not seen.
+
+        Args:
+            after_id: Start after this ID (a cursor from a previous read)
+
+        Yields:
+            Task objects ordered by ID
+        """
+        return self.snapshot().iter_from(after_id)
+
+    def list_page(
+        self, limit: int, cursor: Optional[int] = None, offset: int = 0
+    ) -> tuple[list[Task], Optional[int], int]:
+        """
+        Get one page of tasks in ID order.
+
+        Args:
+            limit: Maximum number of tasks to return
+            cursor: Return tasks after this ID (``next_cursor`` of a previous page)
+            offset: Number of tasks to skip (ignored when ``cursor`` is given)
+
+        Returns:
+            Tuple of (tasks, next cursor or None on the last page, total tasks)
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        view = self.snapshot()
+        tasks, next_cursor = view.page(limit, cursor, offset)
+        return tasks, next_cursor, len(view)
+
+    def list_by_status(self, completed: bool) -> list[Task]:
+        """
+        Get tasks with the given completion status.
+
+        Args:
+            completed: True for completed tasks, False for incomplete ones
+
+        Returns:
+            List of matching Task objects ordered by ID
+        """
+        with self._lock:
+            return [self._tasks[task_id] for task_id in self._by_status[completed]]
+
+    def find_by_title_prefix(self, prefix: str) -> list[Task]:
+        """
+        Get tasks whose title starts with a prefix (case-insensitive).
+
+        Args:
+            prefix: Beginning of the title to match
+
+        Returns:
+            List of matching Task objects ordered by title, then ID
+        """
+        prefix = prefix.casefold()
+        matches = []
+        with self._lock:
+            for title, task_id in self._titles.irange((prefix,)):
+                if not title.startswith(prefix):
+                    break
+                matches.append(self._tasks[task_id])
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> list[Task]:
+        """
+        Find tasks whose title or description contains every query word.
+
+        Words match case-insensitively, either whole or as the start of a
+        word. Title matches rank above description matches and whole-word
+        matches above prefix matches; ties go to the most recent changes.
+
+        The word index is built on the first search (O(n)) and then kept
+        up to date by every change.
+
+        Args:
+            query: Free-text query such as ``"buy groc"``
+            limit: Maximum number of tasks to return
+
+        Returns:
+            List of matching Task objects, best match first
+        """
+        with self._lock:
+            if self._text is None:
+                self._text = TextIndex()
+                for task in self._tasks:
+                    self._text.add(task.id, task.title, task.description)
+            ranked = self._text.search(query, limit)
+            return [self._tasks[task_id] for _, task_id in ranked]
+
+    def list_id_range(self, start: int, end: int) -> list[Task]:
+        """
+        Get tasks whose ID lies within an inclusive range.
+
+        Args:
+            start: Lowest ID to include
+            end: Highest ID to include
+
+        Returns:
+            List of matching Task objects ordered by ID
+        """
+        with self._lock:
+            start = max(start, 1)
+            end = min(end, self._next_id - 1)
+            if end < start:
+                return []
+            tasks = self._tasks
+            if end - start + 1 > len(tasks):
+                # Wide range over a sparse store: iterating beats probing
+                return list(
+                    takewhile(lambda task: task.id <= end, tasks.iter_from(start - 1))
+                )
+            return [tasks[i] for i in range(start, end + 1) if i in tasks]
+
+    def get_task(self, task_id: int) -> Task:
+        """
+        Get a task by its ID.
+
+        Args:
+            task_id: The unique identifier of the task
+
+        Returns:
+            The Task object with the specified ID
+
+        Raises:
+            TaskNotFoundError: If no task with the given ID exists
+        """
+        return self._find_task_by_id(task_id)
 
     def _find_task_by_id(self, task_id: int) -> Task:
         """
@@ -79,10 +456,10 @@ class TodoManager:
         Raises:
             TaskNotFoundError: If no task with the given ID exists
         """
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        return task
 
     def update_task(
         self,
@@ -105,17 +482,88 @@ class TodoManager:
             TaskNotFoundError: If no task with the given ID exists
             ValueError: If new_title is provided but empty
         """
-        task = self._find_task_by_id(task_id)
+        if new_title is not None and not new_title.strip():
+            raise ValueError("Task title cannot be empty")
 
-        if new_title is not None:
-            if not new_title or not new_title.strip():
-                raise ValueError("Task title cannot be empty")
-            task.title = new_title.strip()
+        with self._lock:
+            task = self._find_task_by_id(task_id)
+            changes = {}
+            if new_title is not None:
+                changes["title"] = new_title.strip()
+            if new_description is not None:
+                changes["description"] = new_description.strip()
+
+            updated = replace(task, **changes)
+            self._unindex(task)
+            self._tasks[task_id] = updated
+            self._index(updated)
+            self._persist(updated)
+            self._changes.append(ChangeKind.UPDATE, task_id, updated, task)
+        return updated
+
+    def _require_all(self, task_ids: Iterable[int]) -> list[int]:
+        """
+        Check that tasks exist before a bulk change (call with the lock held).
 
-        if new_description is not None:
-            task.description = new_description.strip()
+        Returns:
+            The IDs in input order without duplicates
 
-        return task
+        Raises:
+            TaskNotFoundError: Naming every ID that does not exist
+        """
+        ids = list(dict.fromkeys(task_ids))
+        missing = [task_id for task_id in ids if task_id not in self._tasks]
+        if len(missing) == 1:
+            raise TaskNotFoundError(f"Task with ID {missing[0]} not found")
+        if missing:
+            listed = ", ".join(map(str, missing))
+            raise TaskNotFoundError(f"Tasks with IDs {listed} not found")
+        return ids
+
+    def update_many(
+        self, changes: Mapping[int, tuple[Optional[str], Optional[str]]]
+    ) -> list[Task]:
+        """
+        Update the title and/or description of several tasks at once.
+
+        All IDs and titles are validated before anything changes.
+
+        Args:
+            changes: Maps task ID to (new_title, new_description); None keeps
+                the existing value
+
+        Returns:
+            The updated Task objects, in input order
+
+        Raises:
+            TaskNotFoundError: If any task does not exist
+            ValueError: If any new title is provided but empty
+        """
+        for task_id, (new_title, _) in changes.items():
+            if new_title is not None and not new_title.strip():
+                raise ValueError(f"Task title cannot be empty (task {task_id})")
+
+        with self._lock:
+            self._require_all(changes)
+            updated = []
+            previous = []
+            for task_id, (new_title, new_description) in changes.items():
+                task = self._tasks[task_id]
+                fields = {}
+                if new_title is not None:
+                    fields["title"] = new_title.strip()
+                if new_description is not None:
+                    fields["description"] = new_description.strip()
+                new_task = replace(task, **fields)
+                self._unindex(task)
+                self._tasks[task_id] = new_task
+                self._index(new_task)
+                updated.append(new_task)
+                previous.append(task)
+            self._persist(*updated)
+            for new_task, task in zip(updated, previous):
+                self._changes.append(ChangeKind.UPDATE, task.id, new_task, task)
+        return updated
 
     def delete_task(self, task_id: int) -> None:
         """
@@ -127,8 +575,48 @@ class TodoManager:
         Raises:
             TaskNotFoundError: If no task with the given ID exists
         """
-        task = self._find_task_by_id(task_id)
-        self._tasks.remove(task)
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                raise TaskNotFoundError(f"Task with ID {task_id} not found")
+            self._unindex(task)
+            self._persist_delete(task_id)
+            self._changes.append(ChangeKind.DELETE, task_id, previous=task)
+
+    def delete_many(self, task_ids: Iterable[int]) -> int:
+        """
+        Delete several tasks at once.
+
+        All IDs are validated first; the store and indexes then drop the
+        tasks in one pass each rather than once per task.
+
+        Args:
+            task_ids: IDs of the tasks to delete
+
+        Returns:
+            Number of tasks deleted
+
+        Raises:
+            TaskNotFoundError: If any task does not exist (nothing is deleted)
+        """
+        with self._lock:
+            ids = self._require_all(task_ids)
+            removed = self._tasks.pop_many(ids)
+            done = {True: [], False: []}
+            for task in removed:
+                done[task.completed].append(task.id)
+                self._text_bytes -= 2 * len(task.title) + len(task.description)
+                if self._text is not None:
+                    self._text.remove(task.id, task.title, task.description)
+            for completed, status_ids in done.items():
+                self._by_status[completed].discard_many(status_ids)
+            self._titles.discard_many(
+                (task.title.casefold(), task.id) for task in removed
+            )
+            self._persist_delete(*ids)
+            for task in removed:
+                self._changes.append(ChangeKind.DELETE, task.id, previous=task)
+        return len(removed)
 
     def toggle_complete(self, task_id: int) -> Task:
         """
@@ -143,6 +631,114 @@ class TodoManager:
         Raises:
             TaskNotFoundError: If no task with the given ID exists
         """
-        task = self._find_task_by_id(task_id)
-        task.completed = not task.completed
-        return task
+        with self._lock:
+            task = self._find_task_by_id(task_id)
+            updated = replace(task, completed=not task.completed)
+            self._tasks[task_id] = updated
+            self._by_status[task.completed].discard(task_id)
+            self._by_status[updated.completed].add(task_id)
+            self._persist(updated)
+            self._changes.append(ChangeKind.TOGGLE, task_id, updated, task)
+        return updated
+
+    def complete_many(self, task_ids: Iterable[int]) -> list[Task]:
+        """
+        Mark several tasks as completed at once.
+
+        Unlike toggle_complete(), tasks that are already completed stay
+        completed. All IDs are validated before anything changes.
+
+        Args:
+            task_ids: IDs of the tasks to complete
+
+        Returns:
+            The completed Task objects, in input order
+
+        Raises:
+            TaskNotFoundError: If any task does not exist
+        """
+        with self._lock:
+            ids = self._require_all(task_ids)
+            tasks = []
+            changed = []
+            previous = []
+            for task_id in ids:
+                task = self._tasks[task_id]
+                if not task.completed:
+                    previous.append(task)
+                    task = replace(task, completed=True)
+                    self._tasks[task_id] = task
+                    changed.append(task)
+                tasks.append(task)
+            changed_ids = [task.id for task in changed]
+            self._by_status[False].discard_many(changed_ids)
+            for task_id in changed_ids:
+                self._by_status[True].add(task_id)
+            self._persist(*changed)
+            for task, old in zip(changed, previous):
+                self._changes.append(ChangeKind.TOGGLE, task.id, task, old)
+        return tasks
+
+    @property
+    def change_seq(self) -> int:
+        """Sequence number of the latest change (0 before any change)."""
+        return self._changes.seq
+
+    def changes_since(
+        self, seq: int, limit: Optional[int] = None
+    ) -> tuple[list[TaskEvent], int]:
+        """
+        Get the changes made after a sequence number.
+
+        Args:
+            seq: Last sequence number already seen (0 for all retained)
+            limit: Maximum number of events to return
+
+        Returns:
+            Tuple of (events in order, latest sequence number)
+
+        Raises:
+            ChangesExpiredError: If the changes are no longer retained; the
+                caller should reload all tasks and continue from the
+                returned ``change_seq``
+        """
+        with self._lock:
+            return self._changes.since(seq, limit), self._changes.seq
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        Call a function with every future change.
+
+        The listener runs synchronously while the manager's lock is held,
+        so it sees changes in order and must be quick and must not modify
+        the manager.
+
+        Args:
+            listener: Callable taking a TaskEvent
+        """
+        with self._lock:
+            self._changes.add_listener(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """
+        Stop calling a listener.
+
+        Args:
+            listener: Listener previously passed to add_listener()
+        """
+        with self._lock:
+            self._changes.remove_listener(listener)
+
+    def subscribe(self, maxsize: int = 1000) -> Subscription:
+        """
+        Receive future changes through a bounded buffer.
+
+        Args:
+            maxsize: Most events buffered before the subscription overflows
+                and must be replaced by reloading all tasks
+
+        Returns:
+            Subscription to read events from; close() it when done
+        """
+        with self._lock:
+            return self._changes.subscribe(maxsize)
@@ -0,0 +1,137 @@
+"""
+Shared TodoManager served to other processes.
+
+A single server process owns the TodoManager (and its optional storage)
+and applies every change, so task IDs and state stay consistent. Any
+number of client processes, such as several uvicorn workers running
+api.py, connect to it over a local socket and call the manager's public
+methods through a proxy. Tasks returned to clients are copies.
+
+Usage:
+    python -m src.todo_app.server --address 127.0.0.1:50000 [--data-dir DIR]
+
+The shared secret is read from the TODO_MANAGER_AUTHKEY environment
+variable in both the server and its clients.
+"""
+
+import argparse
+import os
+from multiprocessing.managers import BaseManager
+from typing import Optional
+
+from .manager import TodoManager
+from .storage import TaskStorage
+
+EXPOSED = (
+    "add_task",
+    "add_tasks",
+    "list_tasks",
+    "list_page",
+    "list_by_status",
+    "find_by_title_prefix",
+    "list_id_range",
+    "search",
+    "get_task",
+    "update_task",
+    "update_many",
+    "delete_task",
+    "delete_many",
+    "toggle_complete",
+    "complete_many",
+    "changes_since",
+    "compact",
+)
+"""TodoManager methods callable by clients"""
+
+
+class TaskServer(BaseManager):
+    """Multiprocessing manager that hosts one shared TodoManager."""
+
+    pass
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """
+    Parse a ``host:port`` string.
+
+    Args:
+        address: Address such as ``127.0.0.1:50000``
+
+    Returns:
+        Tuple of (host, port)
+
+    Raises:
+        ValueError: If the address has no valid port
+    """
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Invalid address '{address}', expected host:port")
+    return host, int(port)
+
+
+def _authkey(authkey: Optional[bytes]) -> bytes:
+    """Return the given authkey or the one from TODO_MANAGER_AUTHKEY."""
+    if authkey is not None:
+        return authkey
+    value = os.environ.get("TODO_MANAGER_AUTHKEY")
+    if not value:
+        raise ValueError("TODO_MANAGER_AUTHKEY must be set")
+    return value.encode("utf-8")
+
+
+def serve(
+    address: str,
+    authkey: Optional[bytes] = None,
+    manager: Optional[TodoManager] = None,
+) -> None:
+    """
+    Serve a TodoManager to client processes until interrupted.
+
+    Args:
+        address: ``host:port`` to listen on
+        authkey: Shared secret (default: TODO_MANAGER_AUTHKEY)
+        manager: Manager to share (default: a new in-memory one)
+    """
+    shared = manager if manager is not None else TodoManager()
+    TaskServer.register("todo_manager", callable=lambda: shared, exposed=EXPOSED)
+    server = TaskServer(address=parse_address(address), authkey=_authkey(authkey))
+    try:
+        server.get_server().serve_forever()
+    finally:
+        shared.close()
+
+
+def connect(address: str, authkey: Optional[bytes] = None):
+    """
+    Connect to a running task server.
+
+    Args:
+        address: ``host:port`` the server listens on
+        authkey: Shared secret (default: TODO_MANAGER_AUTHKEY)
+
+    Returns:
+        Proxy exposing the shared TodoManager's public methods
+    """
+    TaskServer.register("todo_manager", exposed=EXPOSED)
+    client = TaskServer(address=parse_address(address), authkey=_authkey(authkey))
+    client.connect()
+    return client.todo_manager()
+
+
+def main() -> None:
+    """Run the task server from the command line."""
+    parser = argparse.ArgumentParser(description="Shared TodoManager server")
+    parser.add_argument("--address", default="127.0.0.1:50000", help="host:port")
+    parser.add_argument("--data-dir", help="persist tasks in this directory")
+    args = parser.parse_args()
+
+    storage = TaskStorage(args.data_dir) if args.data_dir else None
+    print(f"Serving tasks on {args.address}")
+    try:
+        serve(args.address, manager=TodoManager(storage))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Optional on-disk persistence for TodoManager.
+
+State lives in a directory holding up to three files:
+
+- ``tasks.snapshot``: full state at some point in time (see binary.py)
+- ``tasks.log.old``: changes made before a snapshot that is still being
+  written (only present during, or after an interrupted, compaction)
+- ``tasks.log``: append-only log of every change made since then
+
+Each change is appended to the log as a checksummed, length-prefixed
+record. Writes are buffered and flushed with ``fsync`` in batches by a
+background thread every ``sync_interval`` seconds (group commit), so a
+crash loses at most that window of changes.
+
+Once the log holds ``snapshot_every`` records it is compacted: the log
+is renamed to ``tasks.log.old`` and a fresh one started, then a snapshot
+of the state at that moment is written by a background thread, after
+which the old log is deleted. Writers only wait for the rename.
+Recovery maps the snapshot and both logs with ``mmap`` and replays the
+old log, then the current one.
+
+Log records are idempotent full-state writes ("put task" / "delete
+task"), so replaying a log over a snapshot that already contains some of
+its changes still yields the correct state.
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import threading
+import zlib
+from typing import Iterable, Optional
+
+from .binary import read_snapshot, write_snapshot
+from .models import Task
+
+OP_PUT = 1
+OP_DELETE = 2
+
+FRAME = struct.Struct("<II")
+"""Log record frame: payload length, CRC-32 of payload"""
+
+PUT = struct.Struct("<BQBII")
+"""Put payload: op, ID, completed, title length, description length"""
+
+DELETE = struct.Struct("<BQ")
+"""Delete payload: op, ID"""
+
+
+class TaskStorage:
+    """
+    Append-only operation log with periodic snapshot compaction.
+
+    Args:
+        directory: Directory holding the snapshot and log (created if missing)
+        sync_interval: Seconds between batched fsyncs (0 syncs every write)
+        snapshot_every: Log records after which the log is compacted
+    """
+
+    SNAPSHOT_FILE = "tasks.snapshot"
+    LOG_FILE = "tasks.log"
+    OLD_LOG_FILE = "tasks.log.old"
+
+    def __init__(
+        self,
+        directory: str,
+        sync_interval: float = 0.05,
+        snapshot_every: int = 100_000,
+    ) -> None:
+        """Prepare storage in a directory; call load() before recording."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.log_path = os.path.join(directory, self.LOG_FILE)
+        self.old_log_path = os.path.join(directory, self.OLD_LOG_FILE)
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.log_records = 0
+
+        self._lock = threading.Lock()
+        self._log = None
+        self._dirty = False
+        self._stop = threading.Event()
+        self._syncer: Optional[threading.Thread] = None
+        self._compactor: Optional[threading.Thread] = None
+
+    def load(self) -> tuple[dict[int, Task], int]:
+        """
+        Recover state from the snapshot and log, then open the log for writing.
+
+        A torn record at the end of the log (from a crash mid-write) is
+        discarded and the log is truncated to the last complete record.
+
+        Returns:
+            Tuple of (tasks by ID in creation order, next ID)
+        """
+        tasks: dict[int, Task] = {}
+        next_id = 1
+        if os.path.exists(self.snapshot_path):
+            snapshot, next_id = read_snapshot(self.snapshot_path)
+            tasks = {task.id: task for task in snapshot}
+
+        _, next_id = self._replay_file(self.old_log_path, tasks, next_id)
+        valid_size, next_id = self._replay_file(self.log_path, tasks, next_id)
+
+        self._log = open(self.log_path, "ab", buffering=1 << 16)
+        if self._log.tell() != valid_size:
+            self._log.truncate(valid_size)
+            self._log.seek(valid_size)
+
+        if self.sync_interval > 0:
+            self._syncer = threading.Thread(
+                target=self._sync_loop, name="todo-log-sync", daemon=True
+            )
+            self._syncer.start()
+        return tasks, next_id
+
+    def _replay_file(
+        self, path: str, tasks: dict[int, Task], next_id: int
+    ) -> tuple[int, int]:
+        """Map a log file and replay it; return (valid bytes, next ID)."""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return 0, next_id
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            with memoryview(mapped) as view:
+                return self._replay(view, tasks, next_id)
+
+    def _replay(
+        self, view: memoryview, tasks: dict[int, Task], next_id: int
+    ) -> tuple[int, int]:
+        """Apply log records to ``tasks``; return (bytes consumed, next ID)."""
+        offset = 0
+        while offset + FRAME.size <= len(view):
+            size, checksum = FRAME.unpack_from(view, offset)
+            start = offset + FRAME.size
+            payload = view[start:start + size]
+            if len(payload) < size or zlib.crc32(payload) != checksum:
+                break
+
+            if payload[0] == OP_PUT:
+                _, task_id, completed, title_size, _ = PUT.unpack_from(payload)
+                title_end = PUT.size + title_size
+                task = Task(
+                    id=task_id,
+                    title=str(payload[PUT.size:title_end], "utf-8"),
+                    description=str(payload[title_end:], "utf-8"),
+                    completed=bool(completed),
+                )
+                tasks[task_id] = task
+                next_id = max(next_id, task_id + 1)
+            elif payload[0] == OP_DELETE:
+                _, task_id = DELETE.unpack_from(payload)
+                tasks.pop(task_id, None)
+
+            offset = start + size
+            self.log_records += 1
+        return offset, next_id
+
+    def _append(self, *payloads: bytes) -> None:
+        """Write framed records to the log as one batch."""
+        with self._lock:
+            for payload in payloads:
+                self._log.write(FRAME.pack(len(payload), zlib.crc32(payload)))
+                self._log.write(payload)
+            self.log_records += len(payloads)
+            if self.sync_interval > 0:
+                self._dirty = True
+            else:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+
+    def record_put(self, *tasks: Task) -> None:
+        """
+        Log the current state of created or changed tasks.
+
+        Args:
+            tasks: Tasks whose state should survive a restart
+        """
+        payloads = []
+        for task in tasks:
+            title = task.title.encode("utf-8")
+            description = task.description.encode("utf-8")
+            header = PUT.pack(
+                OP_PUT, task.id, task.completed, len(title), len(description)
+            )
+            payloads.append(header + title + description)
+        self._append(*payloads)
+
+    def record_delete(self, *task_ids: int) -> None:
+        """
+        Log the deletion of tasks.
+
+        Args:
+            task_ids: IDs of the deleted tasks
+        """
+        self._append(*[DELETE.pack(OP_DELETE, task_id) for task_id in task_ids])
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether the log needs compacting (never while one is running)."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return False
+        return self.log_records >= self.snapshot_every
+
+    def compact(self, tasks: Iterable[Task], next_id: int) -> None:
+        """
+        Start a new log and snapshot the given state in the background.
+
+        The caller must make sure no record is appended until this returns
+        (TodoManager holds its lock), so ``tasks`` is exactly the state the
+        rotated log ends with. ``tasks`` is iterated on another thread and
+        must not change afterwards; pass a TaskSnapshot. If a compaction is
+        still running, this first waits for it.
+
+        Args:
+            tasks: All current tasks, in creation order
+            next_id: ID the manager will assign to the next new task
+        """
+        self.wait_for_compaction()
+        with self._lock:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log.close()
+            if os.path.exists(self.old_log_path):
+                # An earlier snapshot never completed, so its log is still
+                # needed; keep both logs' records in replay order.
+                with open(self.log_path, "rb") as src, open(
+                    self.old_log_path, "ab"
+                ) as dst:
+                    shutil.copyfileobj(src, dst)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.remove(self.log_path)
+            else:
+                os.replace(self.log_path, self.old_log_path)
+            self._log = open(self.log_path, "ab", buffering=1 << 16)
+            self.log_records = 0
+            self._dirty = False
+
+        self._compactor = threading.Thread(
+            target=self._write_snapshot,
+            args=(tasks, next_id),
+            name="todo-compact",
+            daemon=True,
+        )
+        self._compactor.start()
+
+    def _write_snapshot(self, tasks: Iterable[Task], next_id: int) -> None:
+        """Background half of compact(): snapshot, then drop the old log."""
+        write_snapshot(self.snapshot_path, tasks, next_id)
+        # The old log is only deleted once the snapshot is safely on disk
+        os.remove(self.old_log_path)
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running compaction has written its snapshot."""
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+    def sync(self) -> None:
+        """Flush buffered log records and fsync them to disk."""
+        with self._lock:
+            if self._log is None or not self._dirty:
+                return
+            self._log.flush()
+            self._dirty = False
+            # The log may be closed or rotated while we sync, so keep our own fd
+            fd = os.dup(self._log.fileno())
+        # fsync without the lock so writers keep appending meanwhile
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _sync_loop(self) -> None:
+        """Background group commit: fsync pending records periodically."""
+        while not self._stop.wait(self.sync_interval):
+            self.sync()
+
+    def close(self) -> None:
+        """Sync pending records, stop the background threads and close the log."""
+        self.wait_for_compaction()
+        self._stop.set()
+        if self._syncer is not None:
+            self._syncer.join()
+            self._syncer = None
+        self.sync()
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
@@ -0,0 +1,239 @@
+"""
+ID-ordered task table with cheap copy-on-write snapshots.
+
+Tasks are stored in chunks holding up to CHUNK_SIZE consecutive IDs.
+Taking a snapshot copies only the small map of chunks (one entry per
+CHUNK_SIZE IDs) and marks every chunk as shared; the next write to a
+shared chunk copies just that chunk first. Snapshots therefore cost
+O(n / CHUNK_SIZE), the first write to each chunk after a snapshot costs
+O(CHUNK_SIZE), and a snapshot never changes after it is taken.
+
+Chunking by ID also lets pages start at any cursor without walking every
+earlier task.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional
+
+from .models import Task
+
+CHUNK_SIZE = 1024
+
+
+class TaskSnapshot:
+    """
+    Immutable, ID-ordered view of the tasks at one point in time.
+
+    Tasks themselves are never modified in place by TodoManager (changes
+    replace the Task object), so a snapshot is fully consistent and can be
+    read from any thread without locking.
+    """
+
+    __slots__ = ("_chunks", "_keys", "_len")
+
+    def __init__(self) -> None:
+        """Create an empty snapshot."""
+        self._chunks: dict[int, dict[int, Task]] = {}
+        self._keys: list[int] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of tasks."""
+        return self._len
+
+    def __contains__(self, task_id: int) -> bool:
+        """Return whether a task with this ID exists."""
+        chunk = self._chunks.get(task_id // CHUNK_SIZE)
+        return chunk is not None and task_id in chunk
+
+    def __getitem__(self, task_id: int) -> Task:
+        """Return the task with this ID, raising KeyError if missing."""
+        chunk = self._chunks.get(task_id // CHUNK_SIZE)
+        if chunk is None:
+            raise KeyError(task_id)
+        return chunk[task_id]
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Return the task with this ID, or None if missing."""
+        chunk = self._chunks.get(task_id // CHUNK_SIZE)
+        return chunk.get(task_id) if chunk is not None else None
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over all tasks in ID order."""
+        return self.iter_from(0)
+
+    def values(self) -> Iterator[Task]:
+        """Iterate over all tasks in ID order."""
+        return self.iter_from(0)
+
+    def iter_from(self, after_id: int = 0) -> Iterator[Task]:
+        """
+        Iterate over tasks with an ID greater than ``after_id``, in ID order.
+
+        Args:
+            after_id: Cursor; iteration starts just after this ID
+
+        Yields:
+            Task objects in ID order
+        """
+        chunks = self._chunks
+        position = bisect_left(self._keys, after_id // CHUNK_SIZE)
+        for key in self._keys[position:]:
+            chunk = chunks[key]
+            if key == after_id // CHUNK_SIZE:
+                for task_id, task in chunk.items():
+                    if task_id > after_id:
+                        yield task
+            else:
+                yield from chunk.values()
+
+    def page(
+        self, limit: int, cursor: Optional[int] = None, offset: int = 0
+    ) -> tuple[list[Task], Optional[int]]:
+        """
+        Return one page of tasks in ID order.
+
+        Args:
+            limit: Maximum number of tasks to return
+            cursor: Return tasks after this ID (from a previous page)
+            offset: Number of tasks to skip first (ignored when ``cursor`` is set)
+
+        Returns:
+            Tuple of (tasks, cursor for the next page or None at the end)
+        """
+        if cursor is None:
+            cursor = self._id_at_offset(offset) if offset > 0 else 0
+            if cursor is None:
+                return [], None
+
+        tasks = []
+        iterator = self.iter_from(cursor)
+        for task in iterator:
+            if len(tasks) == limit:
+                return tasks, tasks[-1].id
+            tasks.append(task)
+        return tasks, None
+
+    def _id_at_offset(self, offset: int) -> Optional[int]:
+        """Return the ID of the task just before position ``offset``."""
+        if offset >= self._len:
+            return None
+        for key in self._keys:
+            chunk = self._chunks[key]
+            if offset < len(chunk):
+                if offset == 0:
+                    return key * CHUNK_SIZE - 1
+                ids = list(chunk)
+                return ids[offset - 1]
+            offset -= len(chunk)
+        return None
+
+
+class TaskTable(TaskSnapshot):
+    """Mutable task table that hands out copy-on-write snapshots."""
+
+    __slots__ = ("_owned",)
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        super().__init__()
+        self._owned: set[int] = set()
+
+    def load(self, tasks: Iterator[Task]) -> None:
+        """
+        Replace the contents with ``tasks`` (which must be in ID order).
+
+        Args:
+            tasks: Tasks to store
+        """
+        chunks: dict[int, dict[int, Task]] = {}
+        for task in tasks:
+            key = task.id // CHUNK_SIZE
+            chunk = chunks.get(key)
+            if chunk is None:
+                chunk = chunks[key] = {}
+            chunk[task.id] = task
+        self._chunks = chunks
+        self._keys = sorted(chunks)
+        self._len = sum(map(len, chunks.values()))
+        self._owned = set(chunks)
+
+    def snapshot(self) -> TaskSnapshot:
+        """Return an immutable view of the current contents."""
+        view = TaskSnapshot()
+        view._chunks = dict(self._chunks)
+        view._keys = self._keys.copy()
+        view._len = self._len
+        # Every chunk is now shared with the snapshot
+        self._owned = set()
+        return view
+
+    def _writable_chunk(self, key: int) -> dict[int, Task]:
+        """Return chunk ``key`` for writing, copying it if shared."""
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = {}
+            self._chunks[key] = chunk
+            position = bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+        elif key not in self._owned:
+            chunk = dict(chunk)
+            self._chunks[key] = chunk
+        self._owned.add(key)
+        return chunk
+
+    def __setitem__(self, task_id: int, task: Task) -> None:
+        """Insert or replace the task with this ID."""
+        chunk = self._writable_chunk(task_id // CHUNK_SIZE)
+        if task_id not in chunk:
+            self._len += 1
+        chunk[task_id] = task
+
+    def pop(self, task_id: int, default: Optional[Task] = None) -> Optional[Task]:
+        """Remove and return the task with this ID, or ``default`` if missing."""
+        key = task_id // CHUNK_SIZE
+        chunk = self._chunks.get(key)
+        if chunk is None or task_id not in chunk:
+            return default
+
+        chunk = self._writable_chunk(key)
+        task = chunk.pop(task_id)
+        self._len -= 1
+        if not chunk:
+            del self._chunks[key]
+            del self._keys[bisect_left(self._keys, key)]
+            self._owned.discard(key)
+        return task
+
+    def pop_many(self, task_ids: Iterable[int]) -> list[Task]:
+        """
+        Remove several tasks, copying each affected chunk at most once.
+
+        Args:
+            task_ids: IDs to remove; missing IDs are ignored
+
+        Returns:
+            The removed tasks
+        """
+        by_chunk: dict[int, list[int]] = {}
+        for task_id in task_ids:
+            by_chunk.setdefault(task_id // CHUNK_SIZE, []).append(task_id)
+
+        removed = []
+        emptied = False
+        for key, ids in by_chunk.items():
+            if key not in self._chunks:
+                continue
+            chunk = self._writable_chunk(key)
+            for task_id in ids:
+                task = chunk.pop(task_id, None)
+                if task is not None:
+                    removed.append(task)
+            if not chunk:
+                del self._chunks[key]
+                self._owned.discard(key)
+                emptied = True
+        if emptied:
+            self._keys = [key for key in self._keys if key in self._chunks]
+        self._len -= len(removed)
+        return removed
@@ -0,0 +1,234 @@
+"""
+Per-user partitioned task store for hosting many tenants in one process.
+
+Each user gets a separate TodoManager (a shard) with its own tasks, IDs
+and lock, so one tenant's requests never wait on another's. Shards are
+created lazily on first use and restored from the user's snapshot file
+when one exists.
+
+Shards that have not been used for ``idle_seconds`` are written to a
+snapshot (see binary.py) and dropped from memory by a background thread.
+When ``max_bytes`` is set, the least recently used idle shards are also
+evicted as soon as the estimated memory of all resident shards exceeds
+it. A shard that is in use is never evicted.
+
+Tenant state reaches disk only when its shard is evicted or the store is
+closed; changes made since then are lost if the process crashes.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .manager import TodoManager
+
+
+class _Shard:
+    """One tenant's manager plus bookkeeping used by TenantStore."""
+
+    __slots__ = ("path", "lock", "manager", "users", "last_used", "bytes")
+
+    def __init__(self, path: str) -> None:
+        """Create an unloaded shard backed by the snapshot at ``path``."""
+        self.path = path
+        # Held while the manager is restored from or written to disk
+        self.lock = threading.Lock()
+        self.manager: Optional[TodoManager] = None
+        self.users = 0
+        self.last_used = time.monotonic()
+        self.bytes = 0
+
+
+class TenantStore:
+    """
+    Map of user IDs to lazily loaded, evictable TodoManager shards.
+
+    Args:
+        directory: Directory for evicted shard snapshots (default: a new
+            temporary directory)
+        idle_seconds: Evict shards unused for this long
+        max_bytes: Evict idle shards once resident shards exceed this
+            estimated size (None for no limit)
+        sweep_interval: Seconds between idle-shard sweeps (0 disables the
+            background thread; call evict_idle() yourself)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        idle_seconds: float = 600.0,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 30.0,
+    ) -> None:
+        """Create an empty store; shards are loaded on first use."""
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="todo-tenants-")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.idle_seconds = idle_seconds
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._shards: OrderedDict[str, _Shard] = OrderedDict()
+        self._bytes = 0
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        if sweep_interval > 0:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                args=(sweep_interval,),
+                name="todo-tenant-sweep",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+    def __len__(self) -> int:
+        """Return the number of shards currently held in memory."""
+        return len(self._shards)
+
+    def snapshot_path(self, user_id: str) -> str:
+        """
+        Get the file a user's shard is evicted to.
+
+        The name is a hash of the user ID, so any ID is a safe file name.
+
+        Args:
+            user_id: Tenant identifier
+
+        Returns:
+            Path of the user's snapshot file
+        """
+        digest = hashlib.blake2b(user_id.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{digest}.snapshot")
+
+    @contextmanager
+    def acquire(self, user_id: str) -> Iterator[TodoManager]:
+        """
+        Use a user's TodoManager, loading it first if needed.
+
+        The shard stays in memory until the block exits.
+
+        Args:
+            user_id: Tenant identifier
+
+        Yields:
+            The user's TodoManager
+        """
+        with self._lock:
+            shard = self._shards.get(user_id)
+            if shard is None:
+                shard = _Shard(self.snapshot_path(user_id))
+                self._shards[user_id] = shard
+            else:
+                self._shards.move_to_end(user_id)
+            shard.users += 1
+
+        try:
+            with shard.lock:
+                if shard.manager is None:
+                    shard.manager = self._restore(shard.path)
+            yield shard.manager
+        finally:
+            with self._lock:
+                shard.users -= 1
+                shard.last_used = time.monotonic()
+                if shard.manager is not None:
+                    size = shard.manager.memory_estimate()
+                    self._bytes += size - shard.bytes
+                    shard.bytes = size
+                limit = self.max_bytes
+                over_budget = limit is not None and self._bytes > limit
+            if over_budget:
+                self._evict_over_budget()
+
+    def memory_usage(self) -> int:
+        """
+        Get the estimated memory held by resident shards.
+
+        Sizes are refreshed each time a shard is released.
+
+        Returns:
+            Approximate size in bytes
+        """
+        return self._bytes
+
+    def evict_idle(self) -> int:
+        """
+        Evict every shard that has been idle for ``idle_seconds``.
+
+        Returns:
+            Number of shards evicted
+        """
+        deadline = time.monotonic() - self.idle_seconds
+        with self._lock:
+            victims = [
+                (user_id, shard)
+                for user_id, shard in self._shards.items()
+                if shard.users == 0 and shard.last_used <= deadline
+            ]
+        return sum(self._evict(user_id, shard) for user_id, shard in victims)
+
+    def _evict_over_budget(self) -> None:
+        """Evict least recently used idle shards until under ``max_bytes``."""
+        with self._lock:
+            victims = []
+            excess = self._bytes - self.max_bytes
+            for user_id, shard in self._shards.items():
+                if excess <= 0:
+                    break
+                if shard.users == 0:
+                    victims.append((user_id, shard))
+                    excess -= shard.bytes
+        for user_id, shard in victims:
+            self._evict(user_id, shard)
+
+    def _evict(self, user_id: str, shard: _Shard) -> bool:
+        """Save a shard and drop it from memory unless it was reacquired."""
+        # Holding the shard lock makes a concurrent acquire() wait until the
+        # snapshot is written, so no change can slip in between saving and
+        # dropping the shard.
+        with shard.lock:
+            if shard.manager is None:
+                return False
+            self._save(shard)
+            with self._lock:
+                if shard.users or self._shards.get(user_id) is not shard:
+                    return False
+                del self._shards[user_id]
+                self._bytes -= shard.bytes
+            shard.manager = None
+        return True
+
+    def _restore(self, path: str) -> TodoManager:
+        """Create a manager, loading the snapshot at ``path`` if present."""
+        manager = TodoManager()
+        if os.path.exists(path):
+            manager.load(path)
+        return manager
+
+    def _save(self, shard: _Shard) -> None:
+        """Write a shard's tasks to its snapshot file."""
+        shard.manager.save(shard.path)
+
+    def _sweep_loop(self, interval: float) -> None:
+        """Background eviction of idle shards."""
+        while not self._stop.wait(interval):
+            self.evict_idle()
+
+    def close(self) -> None:
+        """Stop the sweeper and write every resident shard to disk."""
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+        with self._lock:
+            shards = list(self._shards.values())
+        for shard in shards:
+            with shard.lock:
+                if shard.manager is not None:
+                    self._save(shard)
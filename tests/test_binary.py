@@ -0,0 +1,187 @@
+"""Test cases for the binary snapshot format."""
+
+import pytest
+
+from src.todo_app import binary
+from src.todo_app.binary import (
+    HEADER,
+    HEADER_V1,
+    MAGIC,
+    NEW_STRING,
+    RECORD,
+    RECORD_V1,
+    SnapshotFormatError,
+    SnapshotReader,
+    read_snapshot,
+    write_snapshot,
+)
+from src.todo_app.manager import TodoManager
+from src.todo_app.models import Task
+
+TASKS = [
+    Task(id=1, title="Buy milk", description="2 litres", completed=True),
+    Task(id=2, title="Buy milk"),
+    Task(id=5, title="Émile's café ☕", description="naïve"),
+    Task(id=6, title="Write report", description="2 litres"),
+]
+
+
+def write_v1(path, tasks, next_id) -> None:
+    """Write a version 1 snapshot (inline strings, no flags)."""
+    data = bytearray(HEADER_V1.pack(MAGIC, 1, next_id, len(tasks)))
+    for task in tasks:
+        title = task.title.encode("utf-8")
+        description = task.description.encode("utf-8")
+        data += RECORD_V1.pack(task.id, task.completed, len(title), len(description))
+        data += title + description
+    path.write_bytes(bytes(data))
+
+
+class TestRoundTrip:
+    """Test suite for writing and reading snapshots."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_v2_round_trip(self, tmp_path, compress):
+        """Test that tasks and next ID survive a v2 round trip."""
+        path = tmp_path / "tasks.snapshot"
+
+        assert write_snapshot(str(path), TASKS, 7, compress=compress) == 4
+        tasks, next_id = read_snapshot(str(path))
+
+        assert tasks == TASKS
+        assert next_id == 7
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_streaming_reader(self, tmp_path, compress):
+        """Test that iterating a reader yields the same tasks as read_all()."""
+        path = tmp_path / "tasks.snapshot"
+        tasks = [Task(id=i, title=f"Task {i % 10}") for i in range(1, 10_001)]
+        write_snapshot(str(path), tasks, 10_001, compress=compress)
+
+        with SnapshotReader(str(path)) as reader:
+            assert reader.count == 10_000
+            assert reader.compressed is compress
+            assert list(reader) == tasks
+
+    def test_string_table_limit(self, tmp_path, monkeypatch):
+        """Test that strings past the table limit are stored inline."""
+        monkeypatch.setattr(binary, "STRING_TABLE_LIMIT", 3)
+        path = tmp_path / "tasks.snapshot"
+        tasks = [Task(id=i, title=f"Task {i % 5}") for i in range(1, 21)]
+
+        write_snapshot(str(path), tasks, 21)
+
+        assert read_snapshot(str(path)) == (tasks, 21)
+
+    def test_repeated_strings_stored_once(self, tmp_path):
+        """Test that the string table deduplicates titles and descriptions."""
+        path = tmp_path / "tasks.snapshot"
+        tasks = [Task(id=i, title="Same title") for i in range(1, 101)]
+
+        write_snapshot(str(path), tasks, 101)
+
+        assert path.read_bytes().count(b"Same title") == 1
+
+    def test_v1_round_trip(self, tmp_path):
+        """Test that version 1 snapshots can still be read."""
+        path = tmp_path / "tasks.snapshot"
+        write_v1(path, TASKS, 7)
+
+        assert read_snapshot(str(path)) == (TASKS, 7)
+        with SnapshotReader(str(path)) as reader:
+            assert list(reader) == TASKS
+
+    def test_manager_save_and_load(self, tmp_path):
+        """Test TodoManager.save() and load() end to end."""
+        path = str(tmp_path / "tasks.snapshot")
+        manager = TodoManager()
+        manager.add_task("Buy milk")
+        manager.add_task("Write report")
+        manager.delete_task(1)
+        manager.save(path, compress=True)
+
+        loaded = TodoManager()
+        loaded.load(path)
+
+        assert loaded.list_tasks() == manager.list_tasks()
+        assert loaded.add_task("Next").id == 3
+
+
+class TestCorruptFiles:
+    """Test suite for malformed snapshots."""
+
+    def test_not_a_snapshot(self, tmp_path):
+        """Test that a file with the wrong magic is rejected."""
+        path = tmp_path / "tasks.snapshot"
+        path.write_bytes(b'{"tasks": []}' + bytes(20))
+
+        with pytest.raises(SnapshotFormatError, match="not a task snapshot"):
+            read_snapshot(str(path))
+
+    def test_unsupported_version(self, tmp_path):
+        """Test that an unknown format version is rejected."""
+        path = tmp_path / "tasks.snapshot"
+        path.write_bytes(HEADER.pack(MAGIC, 9, 0, 1, 0))
+
+        with pytest.raises(SnapshotFormatError, match="unsupported version"):
+            read_snapshot(str(path))
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_truncated(self, tmp_path, compress):
+        """Test that a snapshot cut short is rejected."""
+        path = tmp_path / "tasks.snapshot"
+        write_snapshot(str(path), TASKS, 7, compress=compress)
+        path.write_bytes(path.read_bytes()[:-5])
+
+        with pytest.raises(SnapshotFormatError):
+            read_snapshot(str(path))
+
+    def test_truncated_v1(self, tmp_path):
+        """Test that a version 1 snapshot cut short is rejected."""
+        path = tmp_path / "tasks.snapshot"
+        write_v1(path, TASKS, 7)
+        path.write_bytes(path.read_bytes()[:-5])
+
+        with pytest.raises(SnapshotFormatError, match="truncated"):
+            read_snapshot(str(path))
+
+    def test_unknown_string_ref(self, tmp_path):
+        """Test that a record pointing past the string table is rejected."""
+        path = tmp_path / "tasks.snapshot"
+        record = RECORD.pack(1, 0, 5, 5)
+        path.write_bytes(HEADER.pack(MAGIC, 2, 0, 2, 1) + record)
+
+        with pytest.raises(SnapshotFormatError):
+            read_snapshot(str(path))
+
+    def test_invalid_utf8(self, tmp_path):
+        """Test that undecodable string bytes are rejected."""
+        path = tmp_path / "tasks.snapshot"
+        record = RECORD.pack(1, 0, NEW_STRING, NEW_STRING)
+        strings = b"\x02\x00\x00\x00\xff\xfe" + b"\x00\x00\x00\x00"
+        path.write_bytes(HEADER.pack(MAGIC, 2, 0, 2, 1) + record + strings)
+
+        with pytest.raises(SnapshotFormatError):
+            read_snapshot(str(path))
+        with pytest.raises(SnapshotFormatError):
+            list(SnapshotReader(str(path)))
+
+    def test_corrupt_compressed_stream(self, tmp_path):
+        """Test that damaged zlib data is rejected."""
+        path = tmp_path / "tasks.snapshot"
+        write_snapshot(str(path), TASKS, 7, compress=True)
+        data = bytearray(path.read_bytes())
+        data[HEADER.size + 2] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(SnapshotFormatError):
+            read_snapshot(str(path))
+
+    def test_trailing_data(self, tmp_path):
+        """Test that bytes after the last record are rejected."""
+        path = tmp_path / "tasks.snapshot"
+        write_snapshot(str(path), TASKS, 7)
+        path.write_bytes(path.read_bytes() + b"extra")
+
+        with pytest.raises(SnapshotFormatError):
+            read_snapshot(str(path))
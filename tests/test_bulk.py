@@ -0,0 +1,142 @@
+"""Test cases for bulk add, update, complete and delete."""
+
+import pytest
+
+from src.todo_app.manager import TaskNotFoundError, TodoManager
+from src.todo_app.storage import TaskStorage
+
+
+@pytest.fixture
+def manager() -> TodoManager:
+    """Manager holding tasks 1-5."""
+    manager = TodoManager()
+    manager.add_tasks((f"Task {i}", f"Details {i}") for i in range(1, 6))
+    return manager
+
+
+def state(manager: TodoManager) -> list[tuple]:
+    """Return every task as a comparable tuple."""
+    return [
+        (task.id, task.title, task.description, task.completed)
+        for task in manager.list_tasks()
+    ]
+
+
+class TestAddTasks:
+    """Test suite for TodoManager.add_tasks()."""
+
+    def test_assigns_consecutive_ids(self, manager):
+        """Test that tasks are created in input order with stripped fields."""
+        tasks = manager.add_tasks([("  Alpha ", " first "), ("Beta", "")])
+
+        assert [(t.id, t.title, t.description) for t in tasks] == [
+            (6, "Alpha", "first"),
+            (7, "Beta", ""),
+        ]
+        assert manager.search("alpha") == [tasks[0]]
+
+    def test_invalid_title_adds_nothing(self, manager):
+        """Test that one empty title rejects the whole batch."""
+        before = state(manager)
+
+        with pytest.raises(ValueError, match="item 2"):
+            manager.add_tasks([("Good", ""), ("   ", ""), ("Also good", "")])
+
+        assert state(manager) == before
+        assert manager.add_task("Next").id == 6
+
+
+class TestUpdateMany:
+    """Test suite for TodoManager.update_many()."""
+
+    def test_updates_fields(self, manager):
+        """Test that None keeps a field and indexes follow the new titles."""
+        updated = manager.update_many({2: ("Renamed", None), 4: (None, "New details")})
+
+        assert [(t.id, t.title, t.description) for t in updated] == [
+            (2, "Renamed", "Details 2"),
+            (4, "Task 4", "New details"),
+        ]
+        assert manager.find_by_title_prefix("renamed") == [updated[0]]
+        assert manager.find_by_title_prefix("Task 2") == []
+
+    def test_missing_id_changes_nothing(self, manager):
+        """Test that an unknown ID rejects every update."""
+        before = state(manager)
+
+        with pytest.raises(TaskNotFoundError, match="Task with ID 9 not found"):
+            manager.update_many({1: ("Changed", None), 9: ("Missing", None)})
+
+        assert state(manager) == before
+
+    def test_empty_title_changes_nothing(self, manager):
+        """Test that an empty new title rejects every update."""
+        before = state(manager)
+
+        with pytest.raises(ValueError, match="task 3"):
+            manager.update_many({1: ("Changed", None), 3: ("", None)})
+
+        assert state(manager) == before
+
+
+class TestCompleteMany:
+    """Test suite for TodoManager.complete_many()."""
+
+    def test_completes_tasks(self, manager):
+        """Test that tasks end up completed, including already completed ones."""
+        manager.toggle_complete(2)
+
+        tasks = manager.complete_many([1, 2, 3])
+
+        assert [task.completed for task in tasks] == [True, True, True]
+        assert [t.id for t in manager.list_by_status(True)] == [1, 2, 3]
+        assert [t.id for t in manager.list_by_status(False)] == [4, 5]
+
+    def test_missing_ids_change_nothing(self, manager):
+        """Test that unknown IDs reject the batch and are all reported."""
+        with pytest.raises(TaskNotFoundError, match="Tasks with IDs 7, 8 not found"):
+            manager.complete_many([1, 7, 8])
+
+        assert manager.list_by_status(True) == []
+
+
+class TestDeleteMany:
+    """Test suite for TodoManager.delete_many()."""
+
+    def test_deletes_tasks(self, manager):
+        """Test that tasks leave the store and every index."""
+        manager.search("task")
+        manager.toggle_complete(3)
+
+        assert manager.delete_many([1, 3, 5]) == 3
+
+        assert [task.id for task in manager.list_tasks()] == [2, 4]
+        assert manager.list_by_status(True) == []
+        assert [t.id for t in manager.find_by_title_prefix("task")] == [2, 4]
+        assert [t.id for t in manager.search("task")] == [4, 2]
+        with pytest.raises(TaskNotFoundError):
+            manager.get_task(3)
+
+    def test_missing_id_deletes_nothing(self, manager):
+        """Test that an unknown ID rejects the whole batch."""
+        before = state(manager)
+
+        with pytest.raises(TaskNotFoundError):
+            manager.delete_many([1, 2, 42])
+
+        assert state(manager) == before
+
+
+def test_bulk_changes_are_persisted(tmp_path):
+    """Test that every bulk operation is written to the storage log."""
+    manager = TodoManager(TaskStorage(str(tmp_path), sync_interval=0))
+    manager.add_tasks([("a", ""), ("b", ""), ("c", ""), ("d", "")])
+    manager.update_many({1: ("A", "first")})
+    manager.complete_many([2, 3])
+    manager.delete_many([3, 4])
+    expected = state(manager)
+    manager.close()
+
+    reopened = TodoManager(TaskStorage(str(tmp_path), sync_interval=0))
+    assert state(reopened) == expected
+    reopened.close()
@@ -0,0 +1,139 @@
+"""Test cases for the non-interactive CLI script mode."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from src.todo_app.cli import CLI
+from src.todo_app.manager import TodoManager
+from src.todo_app.storage import TaskStorage
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestRunScript:
+    """Test suite for CLI.run_script()."""
+
+    def test_successful_script(self, capsys):
+        """Test that commands run in order and the summary counts them."""
+        cli = CLI()
+        script = [
+            "# set up",
+            "add Milk two litres",
+            "",
+            "add Bread",
+            "complete 1",
+            "update 2 Rye sourdough",
+            "list done",
+        ]
+
+        assert cli.run_script(script) == 0
+
+        out = capsys.readouterr().out
+        assert "Title: Milk" in out
+        assert "[OK] Task #1 marked as completed!" in out
+        assert "[OK] Task #2 updated successfully!" in out
+        assert "Processed 5 command(s)" in out
+        assert "5 succeeded, 0 failed" in out
+        tasks = cli.manager.list_tasks()
+        assert [(t.title, t.description, t.completed) for t in tasks] == [
+            ("Milk", "two litres", True),
+            ("Rye", "sourdough", False),
+        ]
+
+    def test_failures_are_counted_with_line_numbers(self, capsys):
+        """Test that failed commands are summarized by line."""
+        cli = CLI()
+        script = ["add Milk", "delete 7", "complete x", "frobnicate", "list"]
+
+        assert cli.run_script(script) == 3
+
+        out = capsys.readouterr().out
+        assert "5 command(s)" in out
+        assert "2 succeeded, 3 failed" in out
+        assert "  line 2: Error: Task with ID 7 not found" in out
+        assert "  line 3: Error: Invalid task ID 'x'" in out
+        assert "  line 4: Unknown command: 'frobnicate'" in out
+
+    def test_quiet_prints_only_summary(self, capsys):
+        """Test that quiet mode hides command output but keeps failures."""
+        cli = CLI()
+
+        assert cli.run_script(["add Milk", "list", "delete 9"], quiet=True) == 1
+
+        out = capsys.readouterr().out
+        assert "Title: Milk" not in out
+        assert "2 succeeded, 1 failed" in out
+        assert "line 3: Error: Task with ID 9 not found" in out
+
+    def test_quit_stops_the_script(self, capsys):
+        """Test that commands after quit are not run."""
+        cli = CLI()
+
+        cli.run_script(["add One", "quit", "add Two"])
+
+        assert [t.title for t in cli.manager.list_tasks()] == ["One"]
+        assert "Processed 1 command(s)" in capsys.readouterr().out
+
+    def test_bulk_commands_need_no_confirmation(self, capsys):
+        """Test that delete and complete ranges run without prompting."""
+        cli = CLI()
+        script = [f"add Task{i}" for i in range(1, 11)]
+        script += ["complete 1-3", "delete 4-10"]
+
+        assert cli.run_script(script) == 0
+
+        assert [t.id for t in cli.manager.list_by_status(True)] == [1, 2, 3]
+        assert len(cli.manager) == 3
+
+    def test_update_without_title_fails(self, capsys):
+        """Test that inline update requires a new title."""
+        cli = CLI()
+
+        assert cli.run_script(["add Milk", "update 1"]) == 1
+        assert "line 2: Error: New title is required." in capsys.readouterr().out
+
+    def test_persistent_script_saves_tasks(self, tmp_path, capsys):
+        """Test that a script run against storage closes and saves it."""
+        cli = CLI(TodoManager(TaskStorage(str(tmp_path))))
+
+        cli.run_script(["add Saved"])
+
+        assert "All tasks have been saved." in capsys.readouterr().out
+        reopened = TodoManager(TaskStorage(str(tmp_path)))
+        assert [t.title for t in reopened.list_tasks()] == ["Saved"]
+        reopened.close()
+
+
+class TestMainExitStatus:
+    """Test suite for running scripts through main.py."""
+
+    def run_main(self, *args, stdin="") -> subprocess.CompletedProcess:
+        """Run main.py with piped stdin."""
+        return subprocess.run(
+            [sys.executable, str(ROOT / "main.py"), *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            timeout=60,
+            check=False,
+        )
+
+    def test_piped_stdin_success(self):
+        """Test that a clean script exits with status 0."""
+        result = self.run_main(stdin="add Milk\ncomplete 1\n")
+
+        assert result.returncode == 0
+        assert "2 succeeded, 0 failed" in result.stdout
+
+    def test_script_file_failure(self, tmp_path):
+        """Test that a failing command makes the process exit with status 1."""
+        script = tmp_path / "commands.txt"
+        script.write_text("add Milk\ndelete 5\n", encoding="utf-8")
+
+        result = self.run_main("--quiet", "--script", str(script))
+
+        assert result.returncode == 1
+        assert "Title: Milk" not in result.stdout
+        assert "line 2: Error: Task with ID 5 not found" in result.stdout
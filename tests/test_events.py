@@ -0,0 +1,162 @@
+"""Test cases for TodoManager change events."""
+
+import threading
+
+import pytest
+
+from src.todo_app.events import ChangeKind, ChangeLog, ChangesExpiredError
+from src.todo_app.manager import TaskNotFoundError, TodoManager
+
+
+@pytest.fixture
+def manager() -> TodoManager:
+    """Manager holding tasks 1-3 (change sequence 3)."""
+    manager = TodoManager()
+    manager.add_tasks([("One", ""), ("Two", ""), ("Three", "")])
+    return manager
+
+
+def summary(events) -> list[tuple]:
+    """Return (seq, kind, task ID) for each event."""
+    return [(event.seq, event.kind, event.task_id) for event in events]
+
+
+class TestBulkEvents:
+    """Test suite for the events emitted by bulk operations."""
+
+    def test_add_tasks_emits_one_event_per_task(self):
+        """Test that a bulk add emits ADD events in input order."""
+        manager = TodoManager()
+
+        tasks = manager.add_tasks([("a", ""), ("b", "")])
+        events, seq = manager.changes_since(0)
+
+        assert summary(events) == [(1, ChangeKind.ADD, 1), (2, ChangeKind.ADD, 2)]
+        assert [event.task for event in events] == tasks
+        assert seq == 2
+
+    def test_update_many_events_carry_both_versions(self, manager):
+        """Test that UPDATE events hold the task before and after."""
+        manager.update_many({1: ("Uno", None), 3: ("Tres", None)})
+        events, _ = manager.changes_since(3)
+
+        assert summary(events) == [(4, ChangeKind.UPDATE, 1), (5, ChangeKind.UPDATE, 3)]
+        assert [(e.previous.title, e.task.title) for e in events] == [
+            ("One", "Uno"),
+            ("Three", "Tres"),
+        ]
+
+    def test_complete_many_skips_completed_tasks(self, manager):
+        """Test that only tasks whose status changed emit TOGGLE events."""
+        manager.toggle_complete(2)
+
+        manager.complete_many([1, 2, 3])
+        events, _ = manager.changes_since(4)
+
+        assert summary(events) == [(5, ChangeKind.TOGGLE, 1), (6, ChangeKind.TOGGLE, 3)]
+        assert all(event.task.completed for event in events)
+
+    def test_delete_many_events(self, manager):
+        """Test that DELETE events carry the removed task."""
+        manager.delete_many([3, 1])
+        events, _ = manager.changes_since(3)
+
+        assert summary(events) == [(4, ChangeKind.DELETE, 3), (5, ChangeKind.DELETE, 1)]
+        assert [event.previous.title for event in events] == ["Three", "One"]
+        assert all(event.task is None for event in events)
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda m: m.add_tasks([("ok", ""), ("", "")]),
+            lambda m: m.update_many({1: ("x", None), 9: ("y", None)}),
+            lambda m: m.complete_many([1, 9]),
+            lambda m: m.delete_many([1, 9]),
+        ],
+    )
+    def test_failed_batch_emits_nothing(self, manager, operation):
+        """Test that a rejected batch publishes no event."""
+        received = []
+        manager.add_listener(received.append)
+
+        with pytest.raises((ValueError, TaskNotFoundError)):
+            operation(manager)
+
+        assert received == []
+        assert manager.change_seq == 3
+
+
+class TestDelivery:
+    """Test suite for listeners, subscriptions and the change log."""
+
+    def test_listener_sees_every_change_in_order(self, manager):
+        """Test synchronous listener delivery and removal."""
+        received = []
+        manager.add_listener(received.append)
+
+        manager.add_task("Four")
+        manager.toggle_complete(4)
+        manager.remove_listener(received.append)
+        manager.delete_task(4)
+
+        assert summary(received) == [(4, ChangeKind.ADD, 4), (5, ChangeKind.TOGGLE, 4)]
+
+    def test_subscription_across_threads(self, manager):
+        """Test that a subscriber on another thread gets every event."""
+        subscription = manager.subscribe()
+        received = []
+
+        def consume():
+            while (event := subscription.get(timeout=5)) is not None:
+                received.append(event.seq)
+                if event.seq == 103:
+                    return
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(100):
+            manager.add_task(f"Task {i}")
+        consumer.join()
+
+        assert received == list(range(4, 104))
+
+    def test_subscription_overflow(self, manager):
+        """Test that a full subscription expires after its buffer drains."""
+        subscription = manager.subscribe(maxsize=2)
+        manager.add_tasks([("a", ""), ("b", ""), ("c", "")])
+
+        assert [event.seq for event in subscription.drain()] == [4, 5]
+        with pytest.raises(ChangesExpiredError):
+            subscription.get(timeout=0)
+
+    def test_closed_subscription_stops(self, manager):
+        """Test that close() wakes the consumer and drops later events."""
+        subscription = manager.subscribe()
+        subscription.close()
+        manager.add_task("Four")
+
+        assert subscription.get(timeout=0) is None
+        assert len(subscription) == 0
+
+    def test_changes_since_limit_and_expiry(self):
+        """Test paging through retained events and expiry of old ones."""
+        log = ChangeLog(capacity=3)
+        for task_id in range(1, 6):
+            log.append(ChangeKind.ADD, task_id)
+
+        assert [event.seq for event in log.since(2, limit=2)] == [3, 4]
+        assert log.since(5) == []
+        with pytest.raises(ChangesExpiredError):
+            log.since(1)
+        with pytest.raises(ChangesExpiredError):
+            log.since(6)
+
+    def test_load_emits_reset(self, manager, tmp_path):
+        """Test that replacing every task emits a single RESET event."""
+        path = str(tmp_path / "tasks.snapshot")
+        manager.save(path)
+
+        manager.load(path)
+        events, _ = manager.changes_since(3)
+
+        assert summary(events) == [(4, ChangeKind.RESET, 0)]
@@ -0,0 +1,108 @@
+"""Test cases for paginated task listing and snapshots."""
+
+import pytest
+
+from src.todo_app.manager import TodoManager
+from src.todo_app.table import CHUNK_SIZE
+
+
+@pytest.fixture
+def manager() -> TodoManager:
+    """Manager with tasks spanning several table chunks, some deleted."""
+    manager = TodoManager()
+    manager.add_tasks((f"Task {i}", "") for i in range(1, 2 * CHUNK_SIZE + 101))
+    manager.delete_many(range(CHUNK_SIZE - 10, CHUNK_SIZE + 10))
+    return manager
+
+
+def walk(manager: TodoManager, limit: int) -> list[int]:
+    """Collect every task ID by following next cursors."""
+    ids = []
+    cursor = None
+    while True:
+        tasks, cursor, _ = manager.list_page(limit, cursor)
+        ids.extend(task.id for task in tasks)
+        if cursor is None:
+            return ids
+
+
+class TestListPage:
+    """Test suite for TodoManager.list_page()."""
+
+    def test_pages_are_in_id_order(self, manager):
+        """Test that following cursors visits every task once, in order."""
+        expected = [task.id for task in manager.list_tasks()]
+
+        for limit in (1, 7, 100, CHUNK_SIZE, 10 * CHUNK_SIZE):
+            assert walk(manager, limit) == expected
+
+    def test_page_contents_and_total(self, manager):
+        """Test the first page, its cursor and the total count."""
+        tasks, cursor, total = manager.list_page(3)
+
+        assert [task.id for task in tasks] == [1, 2, 3]
+        assert cursor == 3
+        assert total == len(manager)
+
+    def test_last_page_has_no_cursor(self):
+        """Test that an exactly full last page ends the walk."""
+        manager = TodoManager()
+        manager.add_tasks([("a", ""), ("b", ""), ("c", ""), ("d", "")])
+
+        tasks, cursor, _ = manager.list_page(2, cursor=2)
+
+        assert [task.id for task in tasks] == [3, 4]
+        assert cursor is None
+
+    def test_offset(self, manager):
+        """Test offset paging, including across deleted IDs."""
+        expected = [task.id for task in manager.list_tasks()]
+
+        for offset in (0, 1, CHUNK_SIZE - 11, CHUNK_SIZE, len(expected) - 1):
+            tasks, _, _ = manager.list_page(5, offset=offset)
+            assert [task.id for task in tasks] == expected[offset:offset + 5]
+
+    def test_offset_past_end(self, manager):
+        """Test that an offset beyond the last task returns an empty page."""
+        assert manager.list_page(5, offset=len(manager)) == ([], None, len(manager))
+
+    def test_cursor_ignores_offset(self, manager):
+        """Test that a cursor takes precedence over an offset."""
+        tasks, _, _ = manager.list_page(2, cursor=10, offset=500)
+
+        assert [task.id for task in tasks] == [11, 12]
+
+    def test_empty_manager(self):
+        """Test paging an empty manager."""
+        assert TodoManager().list_page(10) == ([], None, 0)
+
+    @pytest.mark.parametrize("limit", [0, -1, -100])
+    def test_rejects_non_positive_limit(self, manager, limit):
+        """Test that a limit below 1 is rejected instead of misbehaving."""
+        with pytest.raises(ValueError, match="at least 1"):
+            manager.list_page(limit)
+
+
+class TestSnapshot:
+    """Test suite for copy-on-write snapshots."""
+
+    def test_snapshot_ignores_later_changes(self, manager):
+        """Test that changes after snapshot() do not show through."""
+        view = manager.snapshot()
+        before = list(view.values())
+
+        manager.update_task(1, "Changed")
+        manager.delete_task(2)
+        manager.add_task("New")
+
+        assert list(view.values()) == before
+        assert view[1].title == "Task 1"
+        assert 2 in view
+        assert manager.get_task(1).title == "Changed"
+
+    def test_iter_tasks_after_cursor(self, manager):
+        """Test lazy iteration starting after an ID."""
+        ids = [task.id for task in manager.iter_tasks(after_id=CHUNK_SIZE - 20)]
+
+        assert ids[:9] == list(range(CHUNK_SIZE - 19, CHUNK_SIZE - 10))
+        assert ids[9] == CHUNK_SIZE + 10
@@ -0,0 +1,106 @@
+"""Test cases for indexed TodoManager queries."""
+
+import pytest
+
+from src.todo_app.manager import TodoManager
+
+
+@pytest.fixture
+def manager() -> TodoManager:
+    """Manager with 30 tasks; every third completed, IDs 10-19 deleted."""
+    manager = TodoManager()
+    for i in range(1, 31):
+        manager.add_task(f"Item {i:02d}" if i % 2 else f"Chore {i:02d}")
+    manager.complete_many(range(3, 31, 3))
+    manager.delete_many(range(10, 20))
+    return manager
+
+
+class TestListByStatus:
+    """Test suite for TodoManager.list_by_status()."""
+
+    def test_completed_in_id_order(self, manager):
+        """Test that completed tasks come back ordered by ID."""
+        ids = [task.id for task in manager.list_by_status(True)]
+
+        assert ids == [3, 6, 9, 21, 24, 27, 30]
+
+    def test_pending_in_id_order(self, manager):
+        """Test that incomplete tasks come back ordered by ID."""
+        ids = [task.id for task in manager.list_by_status(False)]
+
+        assert ids == [i for i in range(1, 31) if i % 3 and not 10 <= i < 20]
+
+    def test_follows_toggles_and_new_tasks(self, manager):
+        """Test that toggles move tasks between statuses, keeping order."""
+        manager.toggle_complete(3)
+        manager.toggle_complete(1)
+        new = manager.add_task("Late")
+        manager.toggle_complete(new.id)
+
+        assert [t.id for t in manager.list_by_status(True)] == [
+            1, 6, 9, 21, 24, 27, 30, new.id
+        ]
+        assert 3 in [t.id for t in manager.list_by_status(False)]
+
+    def test_empty_status(self):
+        """Test that a status with no tasks gives an empty list."""
+        manager = TodoManager()
+        manager.add_task("Only")
+
+        assert manager.list_by_status(True) == []
+
+
+class TestFindByTitlePrefix:
+    """Test suite for TodoManager.find_by_title_prefix()."""
+
+    def test_matches_case_insensitively(self, manager):
+        """Test that prefixes match regardless of case, in title order."""
+        titles = [task.title for task in manager.find_by_title_prefix("chORE 2")]
+
+        assert titles == ["Chore 20", "Chore 22", "Chore 24", "Chore 26", "Chore 28"]
+
+    def test_deleted_tasks_do_not_match(self, manager):
+        """Test that deleted tasks are gone from the title index."""
+        assert manager.find_by_title_prefix("Item 1") == []
+
+    def test_no_match(self, manager):
+        """Test prefixes that sort before, between and after every title."""
+        for prefix in ("Aardvark", "D", "Itemz", "zzz"):
+            assert manager.find_by_title_prefix(prefix) == []
+
+    def test_empty_prefix_matches_everything(self, manager):
+        """Test that an empty prefix returns every task."""
+        assert len(manager.find_by_title_prefix("")) == len(manager)
+
+
+class TestListIdRange:
+    """Test suite for TodoManager.list_id_range()."""
+
+    def test_range_spanning_a_gap(self, manager):
+        """Test that deleted IDs inside the range are skipped."""
+        ids = [task.id for task in manager.list_id_range(8, 21)]
+
+        assert ids == [8, 9, 20, 21]
+
+    def test_range_inside_a_gap(self, manager):
+        """Test that a range covering only deleted IDs is empty."""
+        assert manager.list_id_range(11, 18) == []
+
+    def test_wide_range_over_sparse_store(self):
+        """Test a range far wider than the number of remaining tasks."""
+        manager = TodoManager()
+        for i in range(2000):
+            manager.add_task(f"Task {i}")
+        manager.delete_many(i for i in range(1, 2001) if i % 500)
+
+        ids = [task.id for task in manager.list_id_range(1, 1600)]
+
+        assert ids == [500, 1000, 1500]
+
+    def test_out_of_bounds_and_reversed(self, manager):
+        """Test ranges beyond the known IDs and with start after end."""
+        assert [task.id for task in manager.list_id_range(-5, 2)] == [1, 2]
+        assert [task.id for task in manager.list_id_range(29, 1000)] == [29, 30]
+        assert manager.list_id_range(100, 200) == []
+        assert manager.list_id_range(5, 4) == []
@@ -0,0 +1,79 @@
+"""Test cases for ranked full-text search."""
+
+import pytest
+
+from src.todo_app.manager import TodoManager
+
+
+@pytest.fixture
+def manager() -> TodoManager:
+    """Manager with a few tasks sharing words."""
+    manager = TodoManager()
+    manager.add_tasks(
+        [
+            ("Buy groceries", "milk and eggs"),  # 1
+            ("Call the bank", "about the groceries bill"),  # 2
+            ("Groceries for the party", ""),  # 3
+            ("Grocery list", "buy bread"),  # 4
+            ("Write report", "quarterly numbers"),  # 5
+        ]
+    )
+    return manager
+
+
+def ids(tasks) -> list[int]:
+    """Return the IDs of tasks, in order."""
+    return [task.id for task in tasks]
+
+
+class TestSearch:
+    """Test suite for TodoManager.search()."""
+
+    def test_title_matches_rank_above_description(self, manager):
+        """Test that title hits come first, most recent first among ties."""
+        assert ids(manager.search("groceries")) == [3, 1, 2]
+
+    def test_whole_words_rank_above_prefixes(self, manager):
+        """Test that a prefix hit ranks below whole-word hits."""
+        assert ids(manager.search("grocer")) == [4, 3, 1, 2]
+        assert ids(manager.search("groceries")) == [3, 1, 2]
+
+    def test_every_term_must_match(self, manager):
+        """Test that multi-word queries require all words."""
+        assert ids(manager.search("buy groc")) == [1, 4]
+        assert manager.search("buy report") == []
+
+    def test_case_insensitive(self, manager):
+        """Test that case is ignored in queries and text."""
+        assert ids(manager.search("WRITE Quarterly")) == [5]
+
+    def test_limit(self, manager):
+        """Test that only the best ``limit`` results are returned."""
+        assert ids(manager.search("grocer", limit=2)) == [4, 3]
+
+    def test_empty_and_unknown_queries(self, manager):
+        """Test queries with no words or no matches."""
+        assert manager.search("") == []
+        assert manager.search("  !! ") == []
+        assert manager.search("zebra") == []
+
+    def test_index_follows_changes(self, manager):
+        """Test that updates and deletions after the first search are seen."""
+        manager.search("groceries")
+
+        manager.update_task(5, "Groceries report")
+        manager.delete_task(3)
+        manager.add_task("More groceries")
+
+        assert ids(manager.search("groceries")) == [6, 5, 1, 2]
+        assert ids(manager.search("quarterly")) == [5]
+        assert manager.search("party") == []
+
+    def test_recent_matches_win_among_many(self):
+        """Test ordering when far more tasks match than the limit."""
+        manager = TodoManager()
+        manager.add_tasks(("Buy milk", "") for _ in range(5000))
+
+        assert ids(manager.search("buy milk", limit=3)) == [5000, 4999, 4998]
+        manager.update_task(10, "Buy milk today")
+        assert ids(manager.search("buy milk", limit=3)) == [10, 5000, 4999]
@@ -0,0 +1,135 @@
+"""Test cases for manager locking under threads and the shared task server."""
+
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import AuthenticationError
+from pathlib import Path
+
+import pytest
+
+from src.todo_app.manager import TaskNotFoundError, TodoManager
+from src.todo_app.server import connect, parse_address
+
+ROOT = Path(__file__).resolve().parent.parent
+AUTHKEY = b"test-secret"
+
+
+def assert_consistent(manager: TodoManager) -> None:
+    """Check that the task table and every secondary index agree."""
+    tasks = manager.list_tasks()
+    ids = [task.id for task in tasks]
+
+    assert ids == sorted(set(ids))
+    assert len(manager) == len(ids)
+    done = {task.id for task in tasks if task.completed}
+    assert set(manager._by_status[True]) == done
+    assert set(manager._by_status[False]) == set(ids) - done
+    assert len(manager._titles) == len(ids)
+
+
+class TestManagerThreads:
+    """Test suite for TodoManager used from many threads at once."""
+
+    def test_mixed_operations_keep_state_consistent(self):
+        """Test that concurrent adds, toggles and deletes never corrupt state."""
+        manager = TodoManager()
+        for i in range(50):
+            manager.add_task(f"Seed {i}")
+
+        def work(seed: int) -> list[int]:
+            rng = random.Random(seed)
+            added = []
+            for i in range(300):
+                action = rng.random()
+                if action < 0.4:
+                    added.append(manager.add_task(f"Task {seed}-{i}").id)
+                    continue
+                task_id = rng.randint(1, manager._next_id)
+                try:
+                    if action < 0.75:
+                        manager.toggle_complete(task_id)
+                    else:
+                        manager.delete_task(task_id)
+                except TaskNotFoundError:
+                    pass
+            return added
+
+        # map() re-raises any exception from a worker thread
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            added = list(pool.map(work, range(8)))
+
+        new_ids = [task_id for ids in added for task_id in ids]
+        assert len(new_ids) == len(set(new_ids))
+        assert manager._next_id == 51 + len(new_ids)
+        assert_consistent(manager)
+
+
+def free_port() -> int:
+    """Return a TCP port that was free a moment ago."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def server_address():
+    """Run the task server in a subprocess and return its address."""
+    address = f"127.0.0.1:{free_port()}"
+    env = {**os.environ, "TODO_MANAGER_AUTHKEY": AUTHKEY.decode()}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.todo_app.server", "--address", address],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                with socket.create_connection(parse_address(address)):
+                    break
+            except ConnectionRefusedError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise
+                time.sleep(0.05)
+        yield address
+    finally:
+        process.terminate()
+        process.wait(10)
+
+
+class TestTaskServer:
+    """Test suite for the multiprocessing task server."""
+
+    def test_proxy_round_trip(self, server_address):
+        """Test that clients share one manager through the proxy."""
+        first = connect(server_address, AUTHKEY)
+        second = connect(server_address, AUTHKEY)
+
+        task = first.add_task("Shared", "from the first client")
+        second.toggle_complete(task.id)
+
+        fetched = first.get_task(task.id)
+        assert (fetched.title, fetched.completed) == ("Shared", True)
+        assert [t.id for t in second.list_by_status(True)] == [task.id]
+        tasks, cursor, total = second.list_page(10)
+        assert ([t.id for t in tasks], cursor, total) == ([task.id], None, 1)
+
+    def test_errors_reach_the_client(self, server_address):
+        """Test that manager exceptions are re-raised in the client."""
+        proxy = connect(server_address, AUTHKEY)
+
+        with pytest.raises(TaskNotFoundError):
+            proxy.get_task(999)
+        with pytest.raises(ValueError):
+            proxy.list_page(0)
+
+    def test_wrong_authkey_is_rejected(self, server_address):
+        """Test that a client without the shared secret cannot connect."""
+        with pytest.raises(AuthenticationError):
+            connect(server_address, b"wrong")
@@ -0,0 +1,167 @@
+"""Test cases for TaskStorage log replay and compaction."""
+
+import os
+import threading
+
+import pytest
+
+from src.todo_app.manager import TodoManager
+from src.todo_app.storage import TaskStorage
+
+
+def open_manager(directory, **options) -> TodoManager:
+    """Open a manager on storage that fsyncs every write."""
+    return TodoManager(TaskStorage(str(directory), sync_interval=0, **options))
+
+
+@pytest.fixture
+def populated(tmp_path):
+    """Directory whose log holds three adds, a toggle and a delete."""
+    manager = open_manager(tmp_path)
+    manager.add_task("Buy milk", "2 litres")
+    manager.add_task("Write report")
+    manager.add_task("Call mum")
+    manager.toggle_complete(1)
+    manager.delete_task(2)
+    manager.close()
+    return tmp_path
+
+
+class TestLogReplay:
+    """Test suite for recovering state from the operation log."""
+
+    def test_restart_restores_state(self, populated):
+        """Test that every logged change survives a restart."""
+        manager = open_manager(populated)
+
+        assert [(t.id, t.title, t.completed) for t in manager.list_tasks()] == [
+            (1, "Buy milk", True),
+            (3, "Call mum", False),
+        ]
+        assert manager.get_task(1).description == "2 litres"
+        assert manager.add_task("Next").id == 4
+
+    def test_truncated_tail_is_discarded(self, populated):
+        """Test that a record torn by a crash is dropped and the log repaired."""
+        log_path = populated / TaskStorage.LOG_FILE
+        size = log_path.stat().st_size
+        with open(log_path, "r+b") as f:
+            f.truncate(size - 3)
+
+        manager = open_manager(populated)
+
+        # The torn record was the delete of task 2
+        assert [task.id for task in manager.list_tasks()] == [1, 2, 3]
+        manager.add_task("After crash")
+        manager.close()
+
+        reopened = open_manager(populated)
+        assert [task.id for task in reopened.list_tasks()] == [1, 2, 3, 4]
+        reopened.close()
+
+    def test_corrupt_tail_is_discarded(self, populated):
+        """Test that a record failing its checksum ends the replay."""
+        log_path = populated / TaskStorage.LOG_FILE
+        data = bytearray(log_path.read_bytes())
+        data[-1] ^= 0xFF
+        log_path.write_bytes(bytes(data))
+
+        manager = open_manager(populated)
+
+        assert [task.id for task in manager.list_tasks()] == [1, 2, 3]
+        assert manager.get_task(1).completed is True
+        manager.close()
+
+    def test_garbage_after_log_is_truncated(self, populated):
+        """Test that trailing bytes shorter than a frame are cut off."""
+        log_path = populated / TaskStorage.LOG_FILE
+        size = log_path.stat().st_size
+        with open(log_path, "ab") as f:
+            f.write(b"\x07\x00")
+
+        open_manager(populated).close()
+
+        assert log_path.stat().st_size == size
+
+
+class TestCompaction:
+    """Test suite for snapshot compaction."""
+
+    def test_compaction_keeps_state(self, tmp_path):
+        """Test that state written across compactions is fully recovered."""
+        manager = open_manager(tmp_path, snapshot_every=10)
+        for i in range(45):
+            manager.add_task(f"Task {i}")
+        manager.delete_many([3, 4, 5])
+        manager.toggle_complete(6)
+        expected = manager.list_tasks()
+        manager.close()
+
+        assert not (tmp_path / TaskStorage.OLD_LOG_FILE).exists()
+        reopened = open_manager(tmp_path)
+        assert reopened.list_tasks() == expected
+        reopened.close()
+
+    def test_interrupted_compaction_replays_old_log(self, tmp_path, monkeypatch):
+        """Test that changes survive a snapshot that never finished."""
+        manager = open_manager(tmp_path)
+        manager.add_task("Before")
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.todo_app.storage.write_snapshot", fail)
+        monkeypatch.setattr("threading.excepthook", lambda args: None)
+        manager.compact()
+        manager.add_task("During")
+        manager.close()
+
+        assert (tmp_path / TaskStorage.OLD_LOG_FILE).exists()
+        monkeypatch.undo()
+        reopened = open_manager(tmp_path)
+        reopened.compact()
+        reopened.add_task("After")
+        reopened.close()
+
+        final = open_manager(tmp_path)
+        assert [t.title for t in final.list_tasks()] == ["Before", "During", "After"]
+        assert not os.path.exists(tmp_path / TaskStorage.OLD_LOG_FILE)
+        final.close()
+
+
+class TestGroupCommit:
+    """Test suite for batched fsync."""
+
+    def test_appends_continue_during_sync(self, tmp_path, monkeypatch):
+        """Test that writers are not blocked while a sync waits on fsync."""
+        storage = TaskStorage(str(tmp_path), sync_interval=3600)
+        manager = TodoManager(storage)
+        manager.add_task("Before")
+
+        in_fsync, release = threading.Event(), threading.Event()
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            in_fsync.set()
+            release.wait(5)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", slow_fsync)
+        syncer = threading.Thread(target=storage.sync)
+        syncer.start()
+        assert in_fsync.wait(5)
+
+        writer = threading.Thread(target=manager.add_task, args=("During",))
+        writer.start()
+        writer.join(2)
+        blocked = writer.is_alive()
+        release.set()
+        syncer.join()
+        writer.join()
+        monkeypatch.undo()
+        manager.close()
+
+        assert not blocked
+        reopened = open_manager(tmp_path)
+        assert [t.title for t in reopened.list_tasks()] == ["Before", "During"]
+        reopened.close()
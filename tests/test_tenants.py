@@ -0,0 +1,98 @@
+"""Test cases for the per-user TenantStore."""
+
+import os
+
+import pytest
+
+from src.todo_app.tenants import TenantStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store without a background sweeper; tests evict explicitly."""
+    store = TenantStore(str(tmp_path), idle_seconds=0, sweep_interval=0)
+    yield store
+    store.close()
+
+
+class TestTenantStore:
+    """Test suite for shard isolation, eviction and reload."""
+
+    def test_tenants_are_isolated(self, store):
+        """Test that each user has separate tasks and IDs."""
+        with store.acquire("alice") as manager:
+            manager.add_task("Alice's task")
+        with store.acquire("bob") as manager:
+            task = manager.add_task("Bob's task")
+
+        assert task.id == 1
+        with store.acquire("alice") as manager:
+            assert [t.title for t in manager.list_tasks()] == ["Alice's task"]
+
+    def test_idle_shards_are_evicted_and_reloaded(self, store):
+        """Test that an evicted shard is written to disk and restored."""
+        with store.acquire("alice") as manager:
+            manager.add_tasks([("One", ""), ("Two", "")])
+            manager.toggle_complete(2)
+            expected = manager.list_tasks()
+
+        assert store.evict_idle() == 1
+        assert len(store) == 0
+        assert store.memory_usage() == 0
+        assert os.path.exists(store.snapshot_path("alice"))
+
+        with store.acquire("alice") as manager:
+            assert manager.list_tasks() == expected
+            assert manager.add_task("Three").id == 3
+
+    def test_shard_in_use_is_not_evicted(self, store):
+        """Test that a shard held by acquire() stays resident."""
+        with store.acquire("alice") as manager:
+            manager.add_task("Busy")
+            assert store.evict_idle() == 0
+            assert len(store) == 1
+
+    def test_recently_used_shards_are_kept(self, tmp_path):
+        """Test that only shards idle for idle_seconds are evicted."""
+        store = TenantStore(str(tmp_path), idle_seconds=3600, sweep_interval=0)
+        with store.acquire("alice") as manager:
+            manager.add_task("Recent")
+
+        assert store.evict_idle() == 0
+        store.close()
+
+    def test_memory_budget_evicts_least_recently_used(self, tmp_path):
+        """Test that exceeding max_bytes evicts the oldest idle shards."""
+        store = TenantStore(
+            str(tmp_path), idle_seconds=3600, max_bytes=50_000, sweep_interval=0
+        )
+        for user in ("alice", "bob", "carol"):
+            with store.acquire(user) as manager:
+                manager.add_tasks((f"{user} {i}", "") for i in range(100))
+
+        assert store.memory_usage() <= 50_000
+        assert len(store) < 3
+        assert os.path.exists(store.snapshot_path("alice"))
+        assert not os.path.exists(store.snapshot_path("carol"))
+
+        with store.acquire("alice") as manager:
+            assert len(manager) == 100
+        store.close()
+
+    def test_close_saves_resident_shards(self, tmp_path):
+        """Test that closing the store writes every shard for the next run."""
+        store = TenantStore(str(tmp_path), sweep_interval=0)
+        with store.acquire("alice") as manager:
+            manager.add_task("Survives restart")
+        store.close()
+
+        reopened = TenantStore(str(tmp_path), sweep_interval=0)
+        with reopened.acquire("alice") as manager:
+            assert [t.title for t in manager.list_tasks()] == ["Survives restart"]
+        reopened.close()
+
+    def test_snapshot_path_is_safe_for_any_user_id(self, store):
+        """Test that user IDs cannot escape the store directory."""
+        path = store.snapshot_path("../../etc/passwd")
+
+        assert os.path.dirname(path) == store.directory